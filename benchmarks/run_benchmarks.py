@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Planner Benchmarks
+==================
+Times the planner's hot paths and records each one's peak traced memory.
+
+Benchmarks (per catalog scale):
+    load_program_json       EngineeringCourseLoader.load_courses_for_program, cold, from term JSON files
+    load_program_snapshot   the same from a freshly built catalog snapshot
+    plan_courses            SYDECoursePlanner.plan_courses with an empty plan cache
+    plan_courses_cached     SYDECoursePlanner.plan_courses served from the plan cache
+    validate_move_<n>       SYDECoursePlanner.validate_move against a plan of n courses
+    parse_all_requirements  EnhancedPrerequisiteParser over every requirementsDescription row (uncached)
+
+Scale 1 is data/course_data_filtered itself; larger scales run against synthetic
+catalogs (see synthetic_catalog.py) holding only the benchmarked program's subjects.
+
+Usage:
+    python -m benchmarks.run_benchmarks --scales 1 10 100 --output bench.json
+    python -m benchmarks.run_benchmarks --compare before.json after.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from src.core import planner as planner_module
+from src.core.planner import (CourseCatalog, EngineeringCourseLoader, EnhancedPrerequisiteParser,
+                              SYDECoursePlanner, DATA_DIR, PROGRAM_SUBJECT_MAPPING)
+from .synthetic_catalog import generate_catalog
+
+BENCHMARK_PROGRAM = "Systems Design Engineering"
+PLAN_INPUT = {"program": BENCHMARK_PROGRAM, "start_term": "1249", "semesters": 3}
+# Courses in the plans validate_move is timed against (3 per term, as on the planning board)
+PLAN_SIZES = (3, 10, 30)
+COURSES_PER_TERM = 3
+# Relative change in median time reported as a regression/improvement by --compare
+COMPARE_THRESHOLD = 0.10
+
+
+def measure(name: str, scale: int, func: Callable[[Any], Any], repeat: int,
+            setup: Optional[Callable[[], Any]] = None, **details) -> Dict[str, Any]:
+    """
+    Time ``func(setup())`` repeat times, then run it once more under tracemalloc.
+
+    Setup runs outside the timed region and before the memory peak is reset.
+    """
+    seconds = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        func(state)
+        seconds.append(time.perf_counter() - start)
+
+    state = setup() if setup else None
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    func(state)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        "name": name,
+        "scale": scale,
+        "repeat": repeat,
+        "min_seconds": min(seconds),
+        "median_seconds": statistics.median(seconds),
+        "mean_seconds": statistics.fmean(seconds),
+        "peak_memory_bytes": peak_memory,
+    }
+    result.update(details)
+    return result
+
+
+def report(result: Dict[str, Any]) -> None:
+    """Print one benchmark result."""
+    print(f"  {result['name']:<24} {result['median_seconds'] * 1000:10.3f} ms"
+          f" (min {result['min_seconds'] * 1000:.3f}) {result['peak_memory_bytes'] / 1024:10.1f} KiB peak")
+
+
+def cold_catalog(catalog_dir: Path, snapshot_path: Optional[Path] = None) -> CourseCatalog:
+    """A new catalog with the process-wide requirements parse cache emptied."""
+    planner_module._PARSED_REQUIREMENTS_CACHE.clear()
+    return CourseCatalog(catalog_dir, snapshot_path=snapshot_path)
+
+
+def make_planner(catalog_dir: Path) -> SYDECoursePlanner:
+    """Planner over the given catalog, with program data loaded from data/."""
+    planner = SYDECoursePlanner()
+    planner.catalog = CourseCatalog(catalog_dir, snapshot_path=None)
+    planner.initialize()
+    return planner
+
+
+def build_plan(planner: SYDECoursePlanner, size: int) -> Dict[str, List[str]]:
+    """Term -> courses plan of up to ``size`` pool courses, filling terms in order."""
+    semesters = math.ceil(size / COURSES_PER_TERM)
+    plan = planner.plan_courses(dict(PLAN_INPUT, semesters=semesters))
+    pool_codes = [item['course']['course_code'] for item in plan['course_pool']][:size]
+    term_codes = [semester['term_code'] for semester in plan['semester_structure']]
+    return {
+        term_code: pool_codes[i * COURSES_PER_TERM:(i + 1) * COURSES_PER_TERM]
+        for i, term_code in enumerate(term_codes)
+    }
+
+
+def requirements_texts(catalog_dir: Path) -> List[Optional[str]]:
+    """Every requirementsDescription row in a catalog (duplicates included)."""
+    texts = []
+    for term_file in sorted(catalog_dir.glob("*/*.json")):
+        with open(term_file, 'r', encoding='utf-8') as f:
+            texts.extend(course_data.get('requirementsDescription') for course_data in json.load(f))
+    return texts
+
+
+def run_scale(catalog_dir: Path, scale: int, repeat: int, work_dir: Path) -> List[Dict[str, Any]]:
+    """Run every benchmark against one catalog."""
+    results = []
+
+    results.append(measure(
+        "load_program_json", scale,
+        lambda catalog: EngineeringCourseLoader(catalog=catalog).load_courses_for_program(BENCHMARK_PROGRAM),
+        repeat, setup=lambda: cold_catalog(catalog_dir)
+    ))
+
+    snapshot_path = work_dir / f"catalog_{scale}x.snapshot"
+    CourseCatalog(catalog_dir, snapshot_path=None).build_snapshot(snapshot_path)
+    results.append(measure(
+        "load_program_snapshot", scale,
+        lambda catalog: EngineeringCourseLoader(catalog=catalog).load_courses_for_program(BENCHMARK_PROGRAM),
+        repeat, setup=lambda: cold_catalog(catalog_dir, snapshot_path)
+    ))
+
+    planner = make_planner(catalog_dir)
+    plan = planner.plan_courses(dict(PLAN_INPUT))
+    results.append(measure(
+        "plan_courses", scale, lambda _: planner.plan_courses(dict(PLAN_INPUT)),
+        repeat, setup=planner.plan_cache.clear, pool_size=len(plan['course_pool'])
+    ))
+    planner.plan_courses(dict(PLAN_INPUT))
+    results.append(measure(
+        "plan_courses_cached", scale, lambda _: planner.plan_courses(dict(PLAN_INPUT)), repeat
+    ))
+
+    program_context = {"program": BENCHMARK_PROGRAM}
+    for size in PLAN_SIZES:
+        current_plan = build_plan(planner, size)
+        # Re-validate the last placed course against the rest of the plan, as the board does on drop
+        term_code = max(term for term, courses in current_plan.items() if courses)
+        course_code = current_plan[term_code][-1]
+        remaining = {term: [code for code in courses if code != course_code] for term, courses in current_plan.items()}
+        results.append(measure(
+            f"validate_move_{size}", scale,
+            lambda _: planner.validate_move(course_code, term_code, remaining, program_context),
+            repeat, plan_courses=sum(len(courses) for courses in current_plan.values())
+        ))
+
+    texts = requirements_texts(catalog_dir)
+    parser = EnhancedPrerequisiteParser()
+    results.append(measure(
+        "parse_all_requirements", scale,
+        lambda _: [parser._parse_requirements_uncached(text) for text in texts],
+        repeat, texts=len(texts), distinct_texts=len(set(texts))
+    ))
+    return results
+
+
+def run(scales: List[int], repeat: int) -> Dict[str, Any]:
+    """Run the suite at every scale and return the results document."""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="planner_bench_") as work:
+        work_dir = Path(work)
+        for scale in scales:
+            if scale == 1:
+                catalog_dir = DATA_DIR / "course_data_filtered"
+            else:
+                catalog_dir = work_dir / f"catalog_{scale}x"
+                generate_catalog(catalog_dir, scale, PROGRAM_SUBJECT_MAPPING[BENCHMARK_PROGRAM])
+            print(f"Scale {scale}x ({catalog_dir})")
+            # Planner construction and data loading print progress; keep the report readable
+            with contextlib.redirect_stdout(io.StringIO()):
+                scale_results = run_scale(catalog_dir, scale, repeat, work_dir)
+            for result in scale_results:
+                report(result)
+            results.extend(scale_results)
+
+    return {
+        "metadata": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "program": BENCHMARK_PROGRAM,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(before_path: Path, after_path: Path, threshold: float = COMPARE_THRESHOLD) -> int:
+    """
+    Print median time and peak memory changes between two result files.
+
+    Returns:
+        Number of benchmarks whose median time regressed by more than threshold
+    """
+    with open(before_path, 'r', encoding='utf-8') as f:
+        before = {(r["name"], r["scale"]): r for r in json.load(f)["results"]}
+    with open(after_path, 'r', encoding='utf-8') as f:
+        after = {(r["name"], r["scale"]): r for r in json.load(f)["results"]}
+
+    regressions = 0
+    print(f"{'benchmark':<24} {'scale':>5} {'before ms':>11} {'after ms':>11} {'ratio':>7} {'memory':>8}")
+    for key in sorted(before.keys() & after.keys(), key=lambda k: (k[1], k[0])):
+        old, new = before[key], after[key]
+        ratio = new["median_seconds"] / old["median_seconds"] if old["median_seconds"] else float("inf")
+        memory_ratio = new["peak_memory_bytes"] / old["peak_memory_bytes"] if old["peak_memory_bytes"] else float("inf")
+        verdict = ""
+        if ratio > 1 + threshold:
+            verdict = "slower"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            verdict = "faster"
+        print(f"{key[0]:<24} {key[1]:>5} {old['median_seconds'] * 1000:11.3f} {new['median_seconds'] * 1000:11.3f}"
+              f" {ratio:6.2f}x {memory_ratio:7.2f}x {verdict}")
+
+    for key in sorted(before.keys() ^ after.keys()):
+        print(f"{key[0]:<24} {key[1]:>5} only in {'before' if key in before else 'after'}")
+    return regressions
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the course planner's hot paths.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10], help="Catalog scale factors (default: 1 10)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark (default: 5)")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    parser.add_argument("--compare", type=Path, nargs=2, metavar=("BEFORE", "AFTER"),
+                        help="Compare two result files instead of running")
+    args = parser.parse_args()
+
+    if args.compare:
+        regressions = compare(*args.compare)
+        raise SystemExit(1 if regressions else 0)
+
+    document = run(args.scales, args.repeat)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
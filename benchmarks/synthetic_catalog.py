@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic Catalog Generator
+===========================
+Writes a scaled copy of data/course_data_filtered for benchmarking.
+
+Every course in the selected subjects is replicated ``scale - 1`` times inside its own
+subject, with a letter suffix on the catalog number (SYDE 600 -> SYDE 600XA, 600XB, ...).
+Course codes in each replica's requirementsDescription get the same suffix, so every
+replica keeps the original prerequisite/antirequisite structure among its own courses.
+Program views, course pools and validation therefore grow with the scale factor.
+
+Usage:
+    python -m benchmarks.synthetic_catalog --scale 10 --output /tmp/catalog_10x
+"""
+
+import argparse
+import json
+import re
+import string
+from pathlib import Path
+from typing import Iterable, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SOURCE_DIR = PROJECT_ROOT / "data" / "course_data_filtered"
+
+# Course codes as written in requirement texts (e.g., "SYDE 600", "ECE657", "SYDE 660A")
+COURSE_CODE_PATTERN = re.compile(r'\b([A-Z]{2,})\s*(\d{3}[A-Z]*)\b')
+
+
+def replica_suffix(replica: int) -> str:
+    """Catalog number suffix of a replica (1 -> 'XA', 27 -> 'XAA'); replica 0 is the original."""
+    if replica == 0:
+        return ""
+    letters = ""
+    while replica:
+        replica, digit = divmod(replica - 1, 26)
+        letters = string.ascii_uppercase[digit] + letters
+    return "X" + letters
+
+
+def replicate_course(course_data: dict, replica: int) -> dict:
+    """Copy of a term-file course row renamed for the given replica."""
+    suffix = replica_suffix(replica)
+    if not suffix:
+        return course_data
+
+    replica_data = dict(course_data)
+    replica_data['catalogNumber'] = f"{course_data.get('catalogNumber', '')}{suffix}"
+    if course_data.get('courseId'):
+        replica_data['courseId'] = f"{course_data['courseId']}{suffix}"
+    requirements = course_data.get('requirementsDescription')
+    if requirements:
+        replica_data['requirementsDescription'] = COURSE_CODE_PATTERN.sub(
+            lambda match: f"{match.group(1)} {match.group(2)}{suffix}", requirements
+        )
+    return replica_data
+
+
+def generate_catalog(output_dir: Path, scale: int, subjects: Optional[Iterable[str]] = None,
+                     source_dir: Path = SOURCE_DIR) -> int:
+    """
+    Write a catalog ``scale`` times the size of source_dir into output_dir.
+
+    Args:
+        output_dir: Directory to create (course_data_filtered layout)
+        scale: Copies of every course, including the original
+        subjects: Subject codes to include; all subjects if None
+        source_dir: Catalog to scale
+
+    Returns:
+        Number of course rows written
+    """
+    if scale < 1:
+        raise ValueError("scale must be at least 1")
+
+    subject_dirs = sorted(path for path in source_dir.iterdir() if path.is_dir())
+    if subjects is not None:
+        wanted = set(subjects)
+        subject_dirs = [path for path in subject_dirs if path.name in wanted]
+
+    rows_written = 0
+    for subject_dir in subject_dirs:
+        target_dir = output_dir / subject_dir.name
+        target_dir.mkdir(parents=True, exist_ok=True)
+        for term_file in sorted(subject_dir.glob("*.json")):
+            with open(term_file, 'r', encoding='utf-8') as f:
+                term_courses = json.load(f)
+            scaled = [replicate_course(course_data, replica)
+                      for replica in range(scale) for course_data in term_courses]
+            with open(target_dir / term_file.name, 'w', encoding='utf-8') as f:
+                json.dump(scaled, f, ensure_ascii=False)
+            rows_written += len(scaled)
+    return rows_written
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Generate a scaled synthetic course catalog.")
+    parser.add_argument("--scale", type=int, default=10, help="Copies of every course (default: 10)")
+    parser.add_argument("--output", type=Path, required=True, help="Output directory")
+    parser.add_argument("--subjects", nargs="*", help="Subject codes to include (default: all)")
+    args = parser.parse_args()
+
+    rows = generate_catalog(args.output, args.scale, args.subjects)
+    print(f"Wrote {rows} course rows ({args.scale}x) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
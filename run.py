@@ -8,6 +8,8 @@ if __name__ == '__main__':
     - `host='0.0.0.0'` makes the server accessible on your local network.
     - `port=5001` sets the port (you can change this).
     - `debug=True` enables auto-reloading when you change the code.
+    
+    For production, use `python -m src.api.server` (preloaded, forked workers).
     """
     print("Starting SYDE Course Planner API server...")
     print("Access it at http://127.0.0.1:5001 or your local IP.")
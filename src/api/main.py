@@ -6,9 +6,15 @@ import json
 from flask import Flask, request, jsonify, render_template
 from flask_cors import CORS
 from src.core.planner import SYDECoursePlanner
+from src.core.scheduler import PlanObjective
+from src.utils.term_helpers import is_valid_term_code
+from src.api.responses import FastJSONProvider, compress_response, dumps, etag, parse_fields, plan_response
 
 app = Flask(__name__, template_folder='../../web/templates')
 CORS(app)  # Enable CORS for all routes
+# orjson serialization when installed, and gzip/brotli for large JSON bodies
+app.json = FastJSONProvider(app)
+app.after_request(compress_response)
 
 # --- Global Planner Instance ---
 # Initialize the planner once when the application starts.
@@ -18,11 +24,72 @@ planner = SYDECoursePlanner()
 try:
     planner.initialize()
     print("Planner initialized successfully.")
+    # Most requests ask for the same handful of plans; build them before serving
+    print(f"Warmed plan cache with {planner.warm_plan_cache()} plans.")
 except FileNotFoundError as e:
     print(f"CRITICAL ERROR: Could not initialize planner. {e}")
     # In a real app, you might want to exit or disable the endpoint
     planner = None
 
+def resolve_program_context(program_name):
+    """
+    Resolve the request's program context.
+    Returns (context, None) on success or (None, error response) for an unsupported program.
+    """
+    try:
+        return planner.get_program_context(program_name), None
+    except ValueError as e:
+        return None, (jsonify({"error": str(e)}), 400)
+
+def is_plan_mapping(value):
+    """True for a dict mapping valid term codes to lists of course codes."""
+    return isinstance(value, dict) and all(
+        is_valid_term_code(term_code) and isinstance(courses, list) for term_code, courses in value.items())
+
+def parse_start_term(data):
+    """
+    Validate the 'start_term' of a planning request body.
+    Returns (start_term, None) on success or (None, error response).
+    """
+    if not data or 'start_term' not in data:
+        return None, (jsonify({"error": "Invalid input. JSON body with 'start_term' is required."}), 400)
+    if not is_valid_term_code(data['start_term']):
+        return None, (jsonify({"error": f"Invalid input. '{data['start_term']}' is not a valid term code."}), 400)
+    return data['start_term'], None
+
+# Upper bound on 'limit' for /api/v1/search, /api/v1/autocomplete and /api/v1/similar
+SEARCH_MAX_LIMIT = 100
+
+def parse_limit(default):
+    """
+    Validate the optional 'limit' query parameter.
+    Returns (limit, None) on success or (None, error response).
+    """
+    limit = request.args.get('limit', str(default))
+    if not limit.isdigit() or not 0 < int(limit) <= SEARCH_MAX_LIMIT:
+        return None, (jsonify({"error": f"Invalid input. 'limit' must be between 1 and {SEARCH_MAX_LIMIT}."}), 400)
+    return int(limit), None
+
+# Body keys consumed by parse_search_inputs rather than passed on as plan input
+SEARCH_INPUT_KEYS = ('completed_courses', 'time_budget_ms')
+
+def parse_search_inputs(data):
+    """
+    Validate the optional plan-search inputs shared by /api/v1/auto_plan and /api/v1/plan_alternatives.
+    Returns ({"completed_courses", "time_budget"}, None) on success or (None, error response).
+    """
+    _, error_response = parse_start_term(data)
+    if error_response:
+        return None, error_response
+    completed_courses = data.get('completed_courses') or {}
+    if not is_plan_mapping(completed_courses):
+        return None, (jsonify({"error": "Invalid input. 'completed_courses' must map term codes to lists of course codes."}), 400)
+    time_budget_ms = data.get('time_budget_ms')
+    if time_budget_ms is not None and (not isinstance(time_budget_ms, (int, float)) or time_budget_ms <= 0):
+        return None, (jsonify({"error": "Invalid input. 'time_budget_ms' must be a positive number."}), 400)
+    time_budget = time_budget_ms / 1000 if time_budget_ms is not None else None
+    return {"completed_courses": completed_courses, "time_budget": time_budget}, None
+
 @app.route('/')
 def index():
     """Renders the main user interface."""
@@ -34,16 +101,35 @@ def get_course_plan():
     API endpoint to generate a course plan.
     Expects a JSON body with user input.
     e.g., {"degree": "MEng", "specialization": "...", "semesters": 3, "start_term": "1249"}
+    Optional profile: "interests" (list of strings) and "completed_courses" (list of course codes)
+    rank the elective portions of the course pool by relevance.
+    Optional "fields" (or ?fields=): "summary" keeps only what a course card renders, or a list
+    of pool item fields ("course.title" selects one course field); details come from
+    /api/v1/course_details.
     """
     if planner is None:
         return jsonify({"error": "Planner is not initialized due to a configuration error."}), 500
 
     user_input = request.json
-    if not user_input or 'start_term' not in user_input:
-        return jsonify({"error": "Invalid input. JSON body with 'start_term' is required."}), 400
+    _, error_response = parse_start_term(user_input)
+    if error_response:
+        return error_response
+    
+    interests = user_input.get('interests')
+    if interests is not None and not (isinstance(interests, str) or
+                                      isinstance(interests, list) and all(isinstance(i, str) for i in interests)):
+        return jsonify({"error": "Invalid input. 'interests' must be a string or a list of strings."}), 400
+    completed_courses = user_input.get('completed_courses')
+    if completed_courses is not None and not (isinstance(completed_courses, list) or is_plan_mapping(completed_courses)):
+        return jsonify({"error": "Invalid input. 'completed_courses' must be a list of course codes or map term codes to lists of course codes."}), 400
+    try:
+        fields = parse_fields(user_input.get('fields', request.args.get('fields')))
+    except ValueError as e:
+        return jsonify({"error": f"Invalid input. {e}"}), 400
     
     print(f"Received planning request: {user_input}")
     
+    # The program context is resolved per request from user_input['program']
     plan = planner.plan_courses(user_input)
     
     if "error" in plan:
@@ -51,7 +137,7 @@ def get_course_plan():
         return jsonify(plan), 404
         
     print("Successfully generated a plan framework.")
-    return jsonify(plan)
+    return plan_response(plan, fields)
 
 @app.route('/api/v1/validate_move', methods=['POST'])
 def validate_course_move():
@@ -71,9 +157,255 @@ def validate_course_move():
     if not data or 'course_code' not in data or 'term_code' not in data:
         return jsonify({"error": "Invalid input. 'course_code' and 'term_code' are required."}), 400
 
-    current_plan = data.get('current_plan', {})
+    if not is_valid_term_code(data['term_code']):
+        return jsonify({"error": f"Invalid input. '{data['term_code']}' is not a valid term code."}), 400
+    current_plan = data.get('current_plan') or {}
+    if not is_plan_mapping(current_plan):
+        return jsonify({"error": "Invalid input. 'current_plan' must map term codes to lists of course codes."}), 400
+
     program_context = data.get('program_context', None)
-    result = planner.validate_move(data['course_code'], data['term_code'], current_plan, program_context)
+    context, error_response = resolve_program_context((program_context or {}).get('program'))
+    if error_response:
+        return error_response
+    
+    result = planner.validate_move(data['course_code'], data['term_code'], current_plan, program_context, context)
+    return jsonify(result)
+
+@app.route('/api/v1/validate_plan', methods=['POST'])
+def validate_course_plan():
+    """
+    Validates every course placement in a plan in one request.
+    Expects: {
+        "current_plan": {"1249": ["SYDE 600", "SYDE 610"], "1251": ["SYDE 660A"]},
+        "program_context": {"program": "Systems Design Engineering", "specialization": "..."} // optional
+    }
+    Returns {"valid": ..., "reports": [...]}, one validate_move-style report per course
+    (each with "course_code" and "term_code").
+    """
+    if planner is None:
+        return jsonify({"error": "Planner is not initialized."}), 500
+
+    data = request.json
+    current_plan = (data or {}).get('current_plan')
+    if not is_plan_mapping(current_plan):
+        return jsonify({"error": "Invalid input. 'current_plan' must map term codes to lists of course codes."}), 400
+
+    program_context = data.get('program_context', None)
+    context, error_response = resolve_program_context((program_context or {}).get('program'))
+    if error_response:
+        return error_response
+    
+    result = planner.validate_plan(current_plan, program_context, context)
+    return jsonify(result)
+
+@app.route('/api/v1/drop_targets', methods=['POST'])
+def get_drop_targets():
+    """
+    Valid terms for every course in the plan's pool, so the board can grey out illegal drops locally.
+    Expects the /api/v1/plan body plus the board's current plan: {
+        "program": "Systems Design Engineering", "specialization": "...", "semesters": 3, "start_term": "1249",
+        "current_plan": {"1249": ["SYDE 600"]} // optional
+    }
+    Returns {"terms": [...], "courses": {"SYDE 660A": {"valid_terms": [...], "blocked": {"1251": "first issue"}}}}
+    """
+    if planner is None:
+        return jsonify({"error": "Planner is not initialized."}), 500
+
+    data = request.json
+    _, error_response = parse_start_term(data)
+    if error_response:
+        return error_response
+    current_plan = data.get('current_plan') or {}
+    if not is_plan_mapping(current_plan):
+        return jsonify({"error": "Invalid input. 'current_plan' must map term codes to lists of course codes."}), 400
+
+    user_input = {key: value for key, value in data.items() if key != 'current_plan'}
+    result = planner.drop_targets(user_input, current_plan)
+    if "error" in result:
+        return jsonify(result), 404
+    return jsonify(result)
+
+@app.route('/api/v1/auto_plan', methods=['POST'])
+def auto_plan():
+    """
+    Fills the board automatically with a plan meeting the program's requirements.
+    Expects the /api/v1/plan body plus optional search inputs: {
+        "program": "Systems Design Engineering", "specialization": "...", "semesters": 3, "start_term": "1249",
+        "completed_courses": {"1245": ["SYDE 600"]}, // optional
+        "time_budget_ms": 500 // optional
+    }
+    Returns {"complete": ..., "valid": ..., "current_plan": {...}, "semester_structure": [...],
+             "unmet": [...], "score": {...}, "search": {...}}
+    """
+    if planner is None:
+        return jsonify({"error": "Planner is not initialized."}), 500
+
+    data = request.json
+    search_inputs, error_response = parse_search_inputs(data)
+    if error_response:
+        return error_response
+
+    user_input = {key: value for key, value in data.items() if key not in SEARCH_INPUT_KEYS}
+    result = planner.auto_plan(user_input, search_inputs['completed_courses'], search_inputs['time_budget'])
+    if "error" in result:
+        return jsonify(result), 404
+    return jsonify(result)
+
+@app.route('/api/v1/plan_alternatives', methods=['POST'])
+def plan_alternatives():
+    """
+    The k best distinct plans for the board, ranked by a configurable objective.
+    Expects the /api/v1/auto_plan body plus optional ranking inputs: {
+        "program": "Systems Design Engineering", "specialization": "...", "semesters": 3, "start_term": "1249",
+        "k": 3, // optional, at most 10
+        "objective": {"fewest_terms": 10, "confirmed_offerings": 2, "balanced_load": 1,
+                      "preferred_courses": 3, "pool_priority": 0.1}, // optional, any subset
+        "preferred_courses": ["SYDE 672"] // optional
+    }
+    Returns {"plans": [{"current_plan", "semester_structure", "score", "metrics", "valid"}, ...], "search": {...}}
+    """
+    if planner is None:
+        return jsonify({"error": "Planner is not initialized."}), 500
+
+    data = request.json
+    search_inputs, error_response = parse_search_inputs(data)
+    if error_response:
+        return error_response
+    k = data.get('k', 3)
+    if isinstance(k, bool) or not isinstance(k, int) or k < 1:
+        return jsonify({"error": "Invalid input. 'k' must be a positive integer."}), 400
+    preferred_courses = data.get('preferred_courses') or []
+    if not isinstance(preferred_courses, list) or not all(isinstance(code, str) for code in preferred_courses):
+        return jsonify({"error": "Invalid input. 'preferred_courses' must be a list of course codes."}), 400
+    objective_weights = data.get('objective')
+    if objective_weights is not None and not isinstance(objective_weights, dict):
+        return jsonify({"error": "Invalid input. 'objective' must map weight names to numbers."}), 400
+    try:
+        objective = PlanObjective.from_dict(objective_weights, preferred_courses)
+    except ValueError as e:
+        return jsonify({"error": f"Invalid input. {e}"}), 400
+
+    user_input = {key: value for key, value in data.items()
+                  if key not in SEARCH_INPUT_KEYS + ('k', 'objective', 'preferred_courses')}
+    result = planner.plan_alternatives(user_input, k, objective, search_inputs['completed_courses'],
+                                       search_inputs['time_budget'])
+    if "error" in result:
+        return jsonify(result), 404
+    return jsonify(result)
+
+@app.route('/api/v1/audit_plan', methods=['POST'])
+def audit_plan():
+    """
+    Checks a plan against the program's requirements and reports what is missing.
+    Expects: {
+        "program": "Systems Design Engineering", "specialization": "...",
+        "current_plan": {"1249": ["SYDE 600", "SYDE 660A"]},
+        "completed_courses": {"1245": ["SYDE 522"]} // optional
+    }
+    Returns {"satisfied": ..., "missing": [...], "warnings": [...], "total": {...}, "compulsory": {...},
+             "groups": [...], "departmental": [...], "level": {...}}
+    """
+    if planner is None:
+        return jsonify({"error": "Planner is not initialized."}), 500
+
+    data = request.json
+    if not data or 'program' not in data:
+        return jsonify({"error": "Invalid input. 'program' is required."}), 400
+    current_plan = data.get('current_plan') or {}
+    completed_courses = data.get('completed_courses') or {}
+    if not is_plan_mapping(current_plan) or not is_plan_mapping(completed_courses):
+        return jsonify({"error": "Invalid input. 'current_plan' and 'completed_courses' must map term codes to lists of course codes."}), 400
+
+    user_input = {key: value for key, value in data.items() if key not in ('current_plan', 'completed_courses')}
+    result = planner.audit_plan(user_input, current_plan, completed_courses)
+    if "error" in result:
+        return jsonify(result), 404
+    return jsonify(result)
+
+@app.route('/api/v1/audit_plans', methods=['POST'])
+def audit_plans():
+    """
+    Audits many plans (e.g. a cohort) against one program's requirements.
+    Expects: {
+        "program": "Systems Design Engineering", "specialization": "...",
+        "plans": [{"current_plan": {...}, "completed_courses": {...}}, ...] // completed_courses optional
+    }
+    Returns {"reports": [...], "satisfied": count}, one /api/v1/audit_plan report per plan.
+    """
+    if planner is None:
+        return jsonify({"error": "Planner is not initialized."}), 500
+
+    data = request.json
+    if not data or 'program' not in data:
+        return jsonify({"error": "Invalid input. 'program' is required."}), 400
+    plans = data.get('plans')
+    if not isinstance(plans, list) or not all(
+            isinstance(plan, dict) and is_plan_mapping(plan.get('current_plan') or {})
+            and is_plan_mapping(plan.get('completed_courses') or {}) for plan in plans):
+        return jsonify({"error": "Invalid input. 'plans' must be a list of {'current_plan', 'completed_courses'} objects."}), 400
+
+    user_input = {key: value for key, value in data.items() if key != 'plans'}
+    result = planner.audit_plans(user_input, plans)
+    if "error" in result:
+        return jsonify(result), 404
+    return jsonify(result)
+
+@app.route('/api/v1/plan_sessions', methods=['POST'])
+def create_plan_session():
+    """
+    Starts a server-side plan session; later moves send only deltas.
+    Expects: {
+        "current_plan": {"1249": ["SYDE 600"]}, // optional
+        "program_context": {"program": "Systems Design Engineering", "specialization": "..."} // optional
+    }
+    Returns {"session_id": ..., "current_plan": ..., "valid": ..., "reports": [...], "audit": ...};
+    "audit" is the /api/v1/audit_plan report when program_context names a program, else null.
+    """
+    if planner is None:
+        return jsonify({"error": "Planner is not initialized."}), 500
+
+    data = request.json or {}
+    current_plan = data.get('current_plan') or {}
+    if not isinstance(current_plan, dict) or not all(isinstance(courses, list) for courses in current_plan.values()):
+        return jsonify({"error": "Invalid input. 'current_plan' must map term codes to lists of course codes."}), 400
+
+    result = planner.create_plan_session(current_plan, data.get('program_context'))
+    if "error" in result:
+        return jsonify(result), 400
+    return jsonify(result), 201
+
+@app.route('/api/v1/plan_sessions/<session_id>', methods=['GET', 'DELETE'])
+def plan_session(session_id):
+    """Returns a session's whole plan and reports (GET) or ends the session (DELETE)."""
+    if planner is None:
+        return jsonify({"error": "Planner is not initialized."}), 500
+
+    if request.method == 'DELETE':
+        if not planner.plan_sessions.delete(session_id):
+            return jsonify({"error": "Plan session not found or expired."}), 404
+        return jsonify({"success": True})
+
+    result = planner.get_plan_session(session_id)
+    if result is None:
+        return jsonify({"error": "Plan session not found or expired."}), 404
+    return jsonify(result)
+
+@app.route('/api/v1/plan_sessions/<session_id>/deltas', methods=['POST'])
+def apply_plan_session_delta(session_id):
+    """
+    Applies one change to a session and returns only the reports it changed.
+    Expects: {"action": "add" | "remove", "course_code": "SYDE 660A", "term_code": "1251"}
+         or: {"action": "move", "course_code": "SYDE 660A", "from_term": "1251", "to_term": "1255"}
+    Returns {"valid": ..., "changed": [...], "removed": [...], "audit": ...}.
+    """
+    if planner is None:
+        return jsonify({"error": "Planner is not initialized."}), 500
+
+    result = planner.update_plan_session(session_id, request.json or {})
+    if result is None:
+        return jsonify({"error": "Plan session not found or expired."}), 404
+    if "error" in result:
+        return jsonify(result), 400
     return jsonify(result)
 
 @app.route('/api/v1/programs', methods=['GET'])
@@ -106,7 +438,8 @@ def get_specializations():
 @app.route('/api/v1/switch_program', methods=['POST'])
 def switch_program():
     """
-    Switch to a different engineering program and get updated course pool.
+    Resolve a program's course data ahead of use and return its info.
+    Shared state is not changed; later requests name their program explicitly.
     Expects: {"program_name": "Chemical Engineering"}
     """
     if planner is None:
@@ -128,7 +461,7 @@ def switch_program():
 def get_course_info():
     """
     Get detailed information about a specific course including prerequisites.
-    Expects: {"course_code": "SYDE 660"}
+    Expects: {"course_code": "SYDE 660", "program": "Systems Design Engineering"} // program optional
     """
     if planner is None:
         return jsonify({"error": "Planner is not initialized."}), 500
@@ -137,21 +470,43 @@ def get_course_info():
     if not data or 'course_code' not in data:
         return jsonify({"error": "Invalid input. 'course_code' is required."}), 400
     
+    context, error_response = resolve_program_context(data.get('program'))
+    if error_response:
+        return error_response
+    
     course_code = data['course_code']
-    course = planner.course_loader.get_course(course_code)
+    details = course_details(context, course_code)
     
-    if not course:
+    if not details:
         return jsonify({"error": f"Course {course_code} not found."}), 404
     
-    # Parse prerequisites and antirequisites
-    from src.core.planner import EnhancedPrerequisiteParser
-    parser = EnhancedPrerequisiteParser()
-    requirements = parser.parse_requirements(course.requirements_description)
+    return jsonify(details[0])
+
+# Most course codes per /api/v1/course_details request
+COURSE_DETAILS_MAX_CODES = 100
+# (program context id, course code) -> (context, course, details, etag)
+_course_details = {}
+
+def course_details(context, course_code):
+    """
+    Details of a course as served by /api/v1/course_info, with their entity tag.
+    Built once per program context and course record; returns (details, etag) or None.
+    """
+    course = context.course_loader.get_course(course_code)
+    if not course:
+        return None
+    cached = _course_details.get((id(context), course_code))
+    # The entry holds the context and record, so matching ids are the same objects
+    if cached is not None and cached[0] is context and cached[1] is course:
+        return cached[2], cached[3]
+    
+    # Parse prerequisites and antirequisites (served from the shared parse cache)
+    requirements = planner.prereq_parser.parse_requirements(course.requirements_description)
     
     # Get availability information
-    availability = planner.course_loader.get_course_availability(course_code)
+    availability = context.course_loader.get_course_availability(course_code)
     
-    course_info = {
+    details = {
         'course_code': course.course_code,
         'title': course.title,
         'description': course.description,
@@ -164,8 +519,127 @@ def get_course_info():
         'other_requirements': requirements.get('other_requirements', []),
         'availability': availability
     }
+    tag = etag(dumps(details))
+    _course_details[(id(context), course_code)] = (context, course, details, tag)
+    return details, tag
+
+@app.route('/api/v1/course_details', methods=['GET'])
+def get_course_details():
+    """
+    Details of several courses in one request, each with its own ETag, for pool items
+    served with fields="summary".
+    Query parameters: course_codes (comma-separated, or repeated), program (optional).
+    If-None-Match may list per-course ETags: those courses are returned in 'not_modified'
+    without details, and a request whose courses are all unchanged gets 304.
+    Returns {"courses": [{...details, "etag"}], "not_modified": [codes], "missing": [codes]}.
+    """
+    if planner is None:
+        return jsonify({"error": "Planner is not initialized."}), 500
+    
+    course_codes = []
+    for value in request.args.getlist('course_codes'):
+        course_codes += [code.strip() for code in value.split(',') if code.strip()]
+    course_codes = list(dict.fromkeys(course_codes))
+    if not course_codes:
+        return jsonify({"error": "Invalid input. 'course_codes' is required."}), 400
+    if len(course_codes) > COURSE_DETAILS_MAX_CODES:
+        return jsonify({"error": f"Invalid input. At most {COURSE_DETAILS_MAX_CODES} 'course_codes' per request."}), 400
+    
+    context, error_response = resolve_program_context(request.args.get('program'))
+    if error_response:
+        return error_response
+    
+    courses, not_modified, missing, tags = [], [], [], []
+    for course_code in course_codes:
+        details = course_details(context, course_code)
+        if details is None:
+            missing.append(course_code)
+            continue
+        tags.append(details[1])
+        if request.if_none_match.contains(details[1]):
+            not_modified.append(course_code)
+        else:
+            courses.append(dict(details[0], etag=details[1]))
+    
+    # The whole response is tagged too, so a plain conditional GET of the same URL works
+    response_tag = etag(dumps([course_codes, tags]))
+    if not missing and (not courses or request.if_none_match.contains(response_tag)):
+        response = app.response_class(status=304)
+    else:
+        response = jsonify({'courses': courses, 'not_modified': not_modified, 'missing': missing})
+    response.set_etag(response_tag)
+    return response
+
+@app.route('/api/v1/search', methods=['GET'])
+def search_courses():
+    """
+    Full-text search over every course in the catalog, ranked by BM25.
+    Expects query parameters: q (required), subject, level (e.g. 600), career (UG/GRD),
+    term (courses offered that term), limit (default 20)
+    """
+    if planner is None:
+        return jsonify({"error": "Planner is not initialized."}), 500
+    
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({"error": "Invalid input. Query parameter 'q' is required."}), 400
+    
+    level = request.args.get('level')
+    if level is not None and not level.isdigit():
+        return jsonify({"error": "Invalid input. 'level' must be a course level such as 600."}), 400
+    term = request.args.get('term')
+    if term is not None and not is_valid_term_code(term):
+        return jsonify({"error": f"Invalid input. '{term}' is not a valid term code."}), 400
+    limit, error_response = parse_limit(20)
+    if error_response:
+        return error_response
+    
+    found = planner.catalog.search_index.search(
+        query,
+        subject=request.args.get('subject'),
+        level=int(level) if level is not None else None,
+        career=request.args.get('career'),
+        term=term,
+        limit=limit
+    )
+    return jsonify({"query": query, **found})
+
+@app.route('/api/v1/autocomplete', methods=['GET'])
+def autocomplete_courses():
+    """
+    Typeahead over every course in the catalog: course code, catalog number or title word prefixes.
+    Expects query parameters: q (e.g. "SYDE 6" or "machine"), limit (default 10)
+    """
+    if planner is None:
+        return jsonify({"error": "Planner is not initialized."}), 500
     
-    return jsonify(course_info)
+    query = request.args.get('q', '')
+    limit, error_response = parse_limit(10)
+    if error_response:
+        return error_response
+    
+    return jsonify({"query": query, "results": planner.catalog.autocomplete.complete(query, limit)})
+
+@app.route('/api/v1/similar', methods=['GET'])
+def similar_courses():
+    """
+    Courses whose title and description most resemble a course (TF-IDF cosine similarity).
+    Expects query parameters: course_code (e.g. "SYDE 675"), limit (default 10)
+    """
+    if planner is None:
+        return jsonify({"error": "Planner is not initialized."}), 500
+    
+    course_code = request.args.get('course_code', '').strip()
+    if not course_code:
+        return jsonify({"error": "Invalid input. Query parameter 'course_code' is required."}), 400
+    limit, error_response = parse_limit(10)
+    if error_response:
+        return error_response
+    
+    results = planner.catalog.similarity.similar(course_code, limit)
+    if results is None:
+        return jsonify({"error": f"Course {course_code} not found."}), 404
+    return jsonify({"course_code": course_code, "results": results})
 
 @app.route('/api/v1/requirements_display', methods=['POST'])
 def get_formatted_requirements():
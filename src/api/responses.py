@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API Responses
+=============
+JSON serialization and compression for API responses.
+
+- ``FastJSONProvider`` serializes with orjson when it is installed (stdlib json otherwise),
+  writing bytes straight into the response.
+- ``plan_response`` serializes plans in one ``dumps`` call. Frozen (cached) plans keep
+  their encoded bodies in an LRU, so a repeated plan request does no serialization or
+  compression at all.
+- ``select_pool_fields`` projects pool items onto a ``fields`` selection ("summary": what
+  the board renders; full course details come from /api/v1/course_details).
+- ``compress_response`` (an after_request hook) negotiates brotli (when the brotli package
+  is installed) or gzip from Accept-Encoding for bodies of at least COMPRESS_MIN_BYTES.
+"""
+
+import gzip
+import hashlib
+import json
+from dataclasses import fields as dataclass_fields
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from flask import Response, current_app, request
+from flask.json.provider import DefaultJSONProvider
+
+from src.core.plan_cache import PlanCache
+from src.core.planner import Course, FrozenDict
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used instead
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip is offered
+    brotli = None
+
+# Smaller bodies are sent uncompressed (compression would not pay for its headers)
+COMPRESS_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Encoded bodies kept for frozen plans, per (plan, encoding)
+PLAN_RESPONSE_CACHE_SIZE = 512
+
+# Keys of a course pool item, and of its 'course' record ("course.title" selects one)
+POOL_ITEM_FIELDS = frozenset({
+    'course', 'category', 'priority', 'availability_notes', 'elective_rule', 'prerequisites', 'antirequisites',
+    'corequisites', 'level_requirements', 'other_requirements', 'tags', 'tag', 'tag_color', 'relevance',
+    'profile_score',
+})
+COURSE_FIELDS = frozenset([field.name for field in dataclass_fields(Course)] + ['course_code'])
+# fields="summary": what a course card renders (no description, raw requirements or elective rule)
+PLAN_SUMMARY_FIELDS = (
+    'course.course_code', 'course.title', 'category', 'tags', 'tag', 'tag_color', 'profile_score',
+    'availability_notes', 'prerequisites', 'antirequisites', 'corequisites',
+)
+
+
+def dumps(value: Any, sort_keys: bool = True) -> bytes:
+    """Compact JSON bytes of a value (orjson when installed)."""
+    if orjson is not None:
+        options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(value, default=DefaultJSONProvider.default,
+                            option=options | orjson.OPT_SORT_KEYS if sort_keys else options)
+    return json.dumps(value, default=DefaultJSONProvider.default, ensure_ascii=False, sort_keys=sort_keys,
+                      separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with ``dumps`` (orjson when installed)."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is None or kwargs.keys() - {"separators"}:
+            return super().dumps(obj, **kwargs)
+        return dumps(obj, self.sort_keys).decode("utf-8")
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        if orjson is None or self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        body = dumps(self._prepare_response_obj(args, kwargs), self.sort_keys) + b"\n"
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+_plan_bodies = PlanCache(PLAN_RESPONSE_CACHE_SIZE)
+
+
+def parse_fields(value: Any) -> Optional[Tuple[str, ...]]:
+    """
+    Validate a pool field selection: "summary", "full", a list of field names or a
+    comma-separated string of them.
+
+    Returns:
+        The selected fields, or None for full pool items
+
+    Raises:
+        ValueError: for a malformed selection or an unknown field
+    """
+    if value is None or value == 'full':
+        return None
+    if value == 'summary':
+        return PLAN_SUMMARY_FIELDS
+    if isinstance(value, str):
+        value = [name.strip() for name in value.split(',') if name.strip()]
+    if not isinstance(value, list) or not value or not all(isinstance(name, str) for name in value):
+        raise ValueError("'fields' must be \"summary\", \"full\" or a list of pool item fields.")
+    for name in value:
+        item_field, _, course_field = name.partition('.')
+        if item_field not in POOL_ITEM_FIELDS or (course_field and (item_field != 'course' or course_field not in COURSE_FIELDS)):
+            raise ValueError(f"Unknown field '{name}'.")
+    # Order-insensitive, so equal selections share cached bodies
+    return tuple(sorted(set(value)))
+
+
+def select_pool_fields(plan: Dict[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
+    """A copy of a plan whose pool items keep only the selected fields (missing ones are omitted)."""
+    item_fields = [name for name in fields if '.' not in name]
+    course_fields = [name.partition('.')[2] for name in fields if name.startswith('course.')]
+    if 'course' in item_fields:
+        course_fields = []
+
+    def select(item: Dict[str, Any]) -> Dict[str, Any]:
+        selected = {name: item[name] for name in item_fields if name in item}
+        course = item.get('course')
+        if course_fields and course is not None:
+            selected['course'] = {name: course[name] for name in course_fields if name in course}
+        return selected
+
+    if 'course_pool' not in plan:
+        return plan
+    return dict(plan, course_pool=[select(item) for item in plan['course_pool']])
+
+
+def etag(body: bytes) -> str:
+    """Strong entity tag of a serialized body."""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def negotiate_encoding() -> Optional[str]:
+    """'br', 'gzip' or None: the best encoding the client accepts."""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted.quality('br') > 0:
+        return 'br'
+    if accepted.quality('gzip') > 0:
+        return 'gzip'
+    return None
+
+
+def encode_body(body: bytes, encoding: Optional[str]) -> bytes:
+    """Compress a body for a Content-Encoding (None leaves it as is)."""
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    return body
+
+
+def _encoded_response(body: bytes, encoding: Optional[str]) -> Response:
+    response = current_app.response_class(body, mimetype="application/json")
+    response.vary.add('Accept-Encoding')
+    if encoding is not None:
+        response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def plan_response(plan: Dict[str, Any], fields: Optional[Sequence[str]] = None) -> Response:
+    """
+    JSON response for a plan, compressed as negotiated. Frozen plans are shared and never
+    change, so their encoded bodies are cached per field selection and encoding.
+
+    Args:
+        plan: Plan from SYDECoursePlanner.plan_courses
+        fields: Pool item fields to keep (see parse_fields); None sends full items
+    """
+    sort_keys = current_app.json.sort_keys
+    encoding = negotiate_encoding()
+    cacheable = isinstance(plan, FrozenDict)
+    key = (id(plan), sort_keys, encoding, fields)
+    if cacheable:
+        cached = _plan_bodies.get(key)
+        # The entry holds the plan itself, so a matching id is the same plan
+        if cached is not None and cached[0] is plan:
+            return _encoded_response(cached[1], encoding)
+
+    body = dumps(plan if fields is None else select_pool_fields(plan, fields), sort_keys) + b"\n"
+    if len(body) < COMPRESS_MIN_BYTES:
+        encoding = None
+    body = encode_body(body, encoding)
+    if cacheable:
+        _plan_bodies.put(key, (plan, body))
+    return _encoded_response(body, encoding)
+
+
+def compress_response(response: Response) -> Response:
+    """after_request hook: compress JSON bodies of at least COMPRESS_MIN_BYTES as negotiated."""
+    if (response.direct_passthrough or 'Content-Encoding' in response.headers
+            or not response.is_json or response.status_code < 200 or response.status_code >= 300):
+        return response
+    response.vary.add('Accept-Encoding')
+    body = response.get_data()
+    encoding = negotiate_encoding() if len(body) >= COMPRESS_MIN_BYTES else None
+    if encoding is not None:
+        response.set_data(encode_body(body, encoding))
+        response.headers['Content-Encoding'] = encoding
+    return response
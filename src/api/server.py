@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Prefork API Server
+==================
+Production entry point: load everything once in a master process, then fork workers
+that share it copy-on-write.
+
+Before forking, the master imports the app (which initializes the planner and warms the
+plan cache), builds every program context and decodes every lazily loaded course record,
+sends a few warm-up requests through the app, and calls ``gc.freeze()``. Frozen objects
+are moved out of the collector's generations, so collections in the workers never walk
+(and write to) the pages holding the catalogs, parsed requirements and indexes, and
+those pages stay shared between workers.
+
+Each worker serves the inherited listening socket with a threaded WSGI server. The
+master restarts workers that exit and prints each worker's RSS, PSS (its fair share of
+shared pages) and shared memory at startup, every ``--stats-interval`` seconds and on
+SIGUSR1. Requires ``os.fork`` (Linux/macOS); memory figures come from /proc.
+
+Usage:
+    python -m src.api.server [--host 0.0.0.0] [--port 5001] [--workers N] [--stats-interval SECONDS]
+"""
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Fields of /proc/<pid>/smaps_rollup reported for each worker (kB)
+SMAPS_FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty")
+
+
+def memory_usage(pid: int) -> Dict[str, int]:
+    """
+    Memory of a process in kB: rss, pss, shared and private (pages shared with or private
+    to other processes). Falls back to VmRSS alone without smaps_rollup; {} without /proc.
+    """
+    proc = Path("/proc") / str(pid)
+    values: Dict[str, int] = {}
+    try:
+        for line in (proc / "smaps_rollup").read_text().splitlines():
+            name, _, rest = line.partition(":")
+            if name in SMAPS_FIELDS:
+                values[name] = int(rest.split()[0])
+    except (OSError, ValueError):
+        try:
+            for line in (proc / "status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    return {"rss": int(line.split()[1])}
+        except (OSError, ValueError):
+            pass
+        return {}
+    return {
+        "rss": values.get("Rss", 0),
+        "pss": values.get("Pss", 0),
+        "shared": values.get("Shared_Clean", 0) + values.get("Shared_Dirty", 0),
+        "private": values.get("Private_Clean", 0) + values.get("Private_Dirty", 0),
+    }
+
+
+def preload(app, planner) -> None:
+    """Load, decode and warm everything the workers will read, so it is built once before forking."""
+    from src.core.planner import PROGRAM_SUBJECT_MAPPING
+
+    for program_name in PROGRAM_SUBJECT_MAPPING:
+        planner.get_program_context(program_name)
+    courses = planner.catalog.materialize()
+    print(f"Decoded {courses} resident courses; indexes cover {len(planner.catalog.search_index)} courses.")
+
+    # First requests import and cache whatever the request path builds lazily
+    client = app.test_client()
+    client.get('/api/v1/programs')
+    client.post('/api/v1/plan', json={'program': 'Systems Design Engineering', 'start_term': '1249', 'semesters': 3})
+    client.get('/api/v1/search', query_string={'q': 'design'})
+
+
+class PreforkServer:
+    """Master side of a prefork WSGI server: one listening socket, ``workers`` forked children."""
+
+    def __init__(self, app, host: str = "0.0.0.0", port: int = 5001, workers: int = 2,
+                 stats_interval: float = 60.0):
+        self.app = app
+        self.host = host
+        self.workers = workers
+        self.stats_interval = stats_interval
+        self.socket: Optional[socket.socket] = None
+        self.port = port
+        self.pids: Dict[int, int] = {}  # pid -> worker number
+        self._running = False
+
+    def start(self) -> None:
+        """Bind the socket, freeze the loaded heap and fork the workers (returns in the master)."""
+        if not hasattr(os, "fork"):
+            raise RuntimeError("The prefork server requires os.fork (Linux or macOS).")
+        family = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        self.socket = socket.socket(family, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind((self.host, self.port))
+        self.socket.listen(128)
+        self.port = self.socket.getsockname()[1]
+
+        # Everything allocated so far is shared with the workers; keep the collector off it
+        gc.collect()
+        gc.freeze()
+        self._running = True
+        for number in range(self.workers):
+            self._spawn(number)
+
+    def _spawn(self, number: int) -> None:
+        pid = os.fork()
+        if pid:
+            self.pids[pid] = number
+            return
+        # Worker: Ctrl-C reaches the whole process group; the master stops workers with SIGTERM
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGUSR1, signal.SIG_DFL)
+        exit_code = 0
+        try:
+            from werkzeug.serving import make_server
+            make_server(self.host, self.port, self.app, threaded=True, fd=self.socket.fileno()).serve_forever()
+        except BaseException as e:
+            print(f"Worker {number} (pid {os.getpid()}) failed: {e}", file=sys.stderr)
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def worker_stats(self) -> List[Dict[str, int]]:
+        """Memory usage (kB) of every worker, by worker number."""
+        return [dict(worker=number, pid=pid, **memory_usage(pid))
+                for pid, number in sorted(self.pids.items(), key=lambda item: item[1])]
+
+    def report(self, write: Callable[[str], None] = print) -> None:
+        """Print one line per worker plus the master's own usage."""
+        master = memory_usage(os.getpid())
+        write(f"master pid {os.getpid()}: rss {master.get('rss', 0) / 1024:.1f} MB")
+        for stats in self.worker_stats():
+            write(f"worker {stats['worker']} pid {stats['pid']}: rss {stats.get('rss', 0) / 1024:.1f} MB, "
+                  f"pss {stats.get('pss', 0) / 1024:.1f} MB, shared {stats.get('shared', 0) / 1024:.1f} MB, "
+                  f"private {stats.get('private', 0) / 1024:.1f} MB")
+
+    def serve_forever(self) -> None:
+        """Supervise the workers until SIGINT/SIGTERM: restart exited ones and report memory."""
+        def request_stop(signum, frame):
+            self._running = False
+
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGUSR1, lambda signum, frame: self.report())
+
+        next_report = time.monotonic() + min(self.stats_interval, 5.0) if self.stats_interval > 0 else None
+        try:
+            while self._running:
+                self._reap(respawn=True)
+                if next_report is not None and time.monotonic() >= next_report:
+                    self.report()
+                    next_report = time.monotonic() + self.stats_interval
+                time.sleep(0.5)
+        finally:
+            self.stop()
+
+    def _reap(self, respawn: bool) -> None:
+        while self.pids:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.pids.clear()
+                return
+            if pid == 0:
+                return
+            number = self.pids.pop(pid, None)
+            if number is not None and respawn and self._running:
+                print(f"Worker {number} (pid {pid}) exited with status {status}; restarting")
+                self._spawn(number)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Terminate the workers (SIGKILL after ``timeout`` seconds) and close the socket."""
+        self._running = False
+        for pid in list(self.pids):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.monotonic() + timeout
+        while self.pids and time.monotonic() < deadline:
+            self._reap(respawn=False)
+            time.sleep(0.05)
+        for pid in list(self.pids):
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        self.pids.clear()
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+        gc.unfreeze()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the planner API from preloaded, forked workers.")
+    parser.add_argument("--host", default="0.0.0.0", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=5001, help="Port to listen on")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="Worker processes (default: CPU count)")
+    parser.add_argument("--stats-interval", type=float, default=60.0,
+                        help="Seconds between worker memory reports (0 reports only on SIGUSR1)")
+    args = parser.parse_args()
+
+    # Collections during loading only slow it down; everything loaded here stays alive
+    gc.disable()
+    from src.api.main import app, planner
+    if planner is None:
+        raise SystemExit("Planner failed to initialize; not starting workers.")
+    preload(app, planner)
+    gc.enable()
+
+    server = PreforkServer(app, args.host, args.port, args.workers, args.stats_interval)
+    server.start()
+    print(f"Serving on http://{args.host}:{server.port} with {args.workers} workers (master pid {os.getpid()})")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
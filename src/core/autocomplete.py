@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Course Autocomplete
+===================
+Prefix index for typeahead over every course in the catalog.
+
+Three sorted key arrays are searched with bisect:
+
+    codes      compact course codes ("syde675", so "SYDE 6" and "syde6" both match)
+    numbers    catalog numbers ("675", "660a")
+    words      title words ("machine", "learning", ...)
+
+The keys matching a prefix are one contiguous slice of an array, and each array is
+sorted by key and then course code, so the first results of a slice are already in
+rank order (shortest completion first) and a lookup costs O(log n + limit). Code
+matches come before catalog number matches, which come before title matches. In a
+multi-word query every earlier word must also prefix a word of the course's title.
+
+Usage:
+    python -m src.core.autocomplete PREFIX [--limit N]
+"""
+
+import argparse
+import re
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+from .search_index import TOKEN_PATTERN
+
+# Sorts after every character of a normalized key, closing a prefix's key range
+KEY_END = "{"
+DEFAULT_AUTOCOMPLETE_LIMIT = 10
+
+
+def title_words(text: str) -> List[str]:
+    """Lower-case alphanumeric words of a title or query (stop words kept: "the" may be typing "theory")."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def normalize_code(text: str) -> str:
+    """Lower-case alphanumerics of a course code or query ("SYDE 660A" -> "syde660a")."""
+    return re.sub(r"[^a-z0-9]", "", text.lower())
+
+
+class _SortedKeys:
+    """Sorted (key, course row) pairs with prefix range lookup."""
+
+    def __init__(self, entries: Iterable[Tuple[str, int]], course_codes: Sequence[str]):
+        entries = sorted(set(entries), key=lambda entry: (entry[0], course_codes[entry[1]]))
+        self.keys: List[str] = [key for key, _ in entries]
+        self.rows: List[int] = [row for _, row in entries]
+
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        start = bisect_left(self.keys, prefix)
+        return start, bisect_left(self.keys, prefix + KEY_END, start)
+
+    def matches(self, prefix: str) -> Iterator[int]:
+        """Course rows whose key starts with prefix, in rank order (rows may repeat)."""
+        start, end = self._range(prefix)
+        return iter(self.rows[start:end])
+
+    def row_set(self, prefix: str) -> Set[int]:
+        """Course rows whose key starts with prefix, unordered."""
+        start, end = self._range(prefix)
+        return set(self.rows[start:end])
+
+
+class CourseAutocomplete:
+    """Typeahead over course codes, catalog numbers and title words (see the module docstring)."""
+
+    def __init__(self, courses: Iterable[Tuple[str, str]]):
+        """
+        Args:
+            courses: (course_code, title) for every course
+        """
+        courses = sorted(dict(courses).items())
+        self.course_codes: List[str] = [course_code for course_code, _ in courses]
+        self.titles: List[str] = [title for _, title in courses]
+        self.codes = _SortedKeys(((normalize_code(code), row) for row, code in enumerate(self.course_codes)),
+                                 self.course_codes)
+        self.numbers = _SortedKeys(((normalize_code(code.split(" ", 1)[-1]), row)
+                                    for row, code in enumerate(self.course_codes)), self.course_codes)
+        self.words = _SortedKeys(((word, row) for row, title in enumerate(self.titles)
+                                  for word in title_words(title or "")), self.course_codes)
+
+    def __len__(self) -> int:
+        return len(self.course_codes)
+
+    def complete(self, query: str, limit: int = DEFAULT_AUTOCOMPLETE_LIMIT) -> List[Dict[str, Any]]:
+        """
+        Top courses for a typed prefix.
+
+        Args:
+            query: Partial course code ("SYDE 6"), catalog number ("67") or title words
+                ("machine lea")
+            limit: Number of results to return
+
+        Returns:
+            [{course_code, title, match: 'code' | 'number' | 'title'}, ...] best first
+        """
+        results: List[Dict[str, Any]] = []
+        seen = set()
+
+        def take(rows: Iterator[int], match: str) -> bool:
+            for row in rows:
+                if row not in seen:
+                    seen.add(row)
+                    results.append({'course_code': self.course_codes[row], 'title': self.titles[row], 'match': match})
+                    if len(results) >= limit:
+                        return True
+            return False
+
+        compact = normalize_code(query)
+        words = title_words(query)
+        if limit <= 0 or not compact:
+            return results
+        if take(self.codes.matches(compact), 'code') or take(self.numbers.matches(compact), 'number'):
+            return results
+        if words:
+            rows = self.words.matches(words[-1])
+            if len(words) > 1:
+                # Courses whose title has a word starting with each earlier query word
+                allowed = self.words.row_set(words[0]).intersection(*(self.words.row_set(word) for word in words[1:-1]))
+                rows = (row for row in rows if row in allowed) if allowed else iter(())
+            take(rows, 'title')
+        return results
+
+
+def main() -> None:
+    from .planner import CourseCatalog
+
+    parser = argparse.ArgumentParser(description="Complete a course code or title prefix.")
+    parser.add_argument("prefix", help="Typed text")
+    parser.add_argument("--limit", type=int, default=DEFAULT_AUTOCOMPLETE_LIMIT, help="Number of results")
+    args = parser.parse_args()
+
+    catalog = CourseCatalog()
+    start = time.perf_counter()
+    autocomplete = catalog.autocomplete
+    build_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    results = autocomplete.complete(args.prefix, args.limit)
+    query_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Indexed {len(autocomplete)} courses in {build_ms:.0f} ms; completed in {query_ms:.3f} ms")
+    for result in results:
+        print(f"{result['match']:8} {result['course_code']:12} {result['title']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Availability Matrix
+===================
+Dense course x term offering matrix built once from the catalog's availability lists.
+
+Confirmed-offering checks become a single array lookup, and "is this course offered in
+any of these terms" for many courses at once is one vectorized reduction.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from ..utils.term_helpers import next_term_code, term_ordinal, term_year
+from .forecasting import OfferingForecaster, history_from_matrix
+
+
+class AvailabilityMatrix:
+    """Boolean matrix of confirmed offerings: rows are courses, columns are term codes."""
+
+    def __init__(self, course_availability: Mapping[str, Iterable[Dict[str, str]]]):
+        course_codes = list(course_availability)
+        term_codes = sorted({offering["term_code"] for code in course_codes for offering in course_availability[code]},
+                            key=term_ordinal)
+
+        self.course_index: Dict[str, int] = {code: i for i, code in enumerate(course_codes)}
+        self.term_codes: List[str] = term_codes
+        self.term_index: Dict[str, int] = {term: j for j, term in enumerate(term_codes)}
+
+        self.offered = np.zeros((len(course_codes), len(term_codes)), dtype=bool)
+        for code, row in self.course_index.items():
+            for offering in course_availability[code]:
+                self.offered[row, self.term_index[offering["term_code"]]] = True
+        self.offered.setflags(write=False)
+
+    def is_offered(self, course_code: str, term_code: str) -> bool:
+        """Confirmed offering of one course in one term."""
+        row = self.course_index.get(course_code)
+        column = self.term_index.get(term_code)
+        if row is None or column is None:
+            return False
+        return bool(self.offered[row, column])
+
+    def lookup(self, course_codes: Sequence[str], term_codes: Sequence[str]) -> np.ndarray:
+        """
+        Confirmed offerings for every (course, term) pair.
+
+        Returns:
+            Writable bool array of shape (len(course_codes), len(term_codes)); unknown
+            courses or terms are False.
+        """
+        rows = np.array([self.course_index.get(code, -1) for code in course_codes], dtype=np.intp)
+        columns = np.array([self.term_index.get(term, -1) for term in term_codes], dtype=np.intp)
+
+        result = np.zeros((len(rows), len(columns)), dtype=bool)
+        known_rows, known_columns = rows >= 0, columns >= 0
+        if known_rows.any() and known_columns.any():
+            result[np.ix_(known_rows, known_columns)] = self.offered[np.ix_(rows[known_rows], columns[known_columns])]
+        return result
+
+
+# Offering status codes used by OfferingPredictionTable
+NOT_OFFERED, CONFIRMED, PREDICTED_ANNUAL, PREDICTED_BIENNIAL, PREDICTED_SPORADIC = range(5)
+STATUS_LABELS = (
+    "Not Offered",
+    "Confirmed",
+    "Predicted (Annual)",
+    "Predicted (Likely Biennial)",
+    "Predicted (Sporadic)",
+)
+
+# Status of a predicted offering by the pattern of the course's forecasting model
+PATTERN_STATUS = {'annual': PREDICTED_ANNUAL, 'biennial': PREDICTED_BIENNIAL, 'sporadic': PREDICTED_SPORADIC}
+
+
+class OfferingPredictionTable:
+    """
+    Predicted status and confidence for every course in every term after the newest
+    data term, up to ``years_ahead`` years, forecast once from an AvailabilityMatrix.
+
+    Each course's offering model is fitted on its whole history (see forecasting.py).
+    A course is predicted in a future term when its forecast probability reaches the
+    forecaster's threshold; the status names the pattern of its model (Annual, Likely
+    Biennial or Sporadic) and the confidence is the probability.
+    """
+
+    def __init__(self, availability_matrix: AvailabilityMatrix, years_ahead: int = 5,
+                 forecaster: Optional[OfferingForecaster] = None):
+        self.availability_matrix = availability_matrix
+        self.newest_term = availability_matrix.term_codes[-1] if availability_matrix.term_codes else None
+
+        self.term_codes: List[str] = []
+        if self.newest_term is not None:
+            term_code = next_term_code(self.newest_term)
+            last_year = term_year(self.newest_term) + years_ahead
+            while term_year(term_code) <= last_year:
+                self.term_codes.append(term_code)
+                term_code = next_term_code(term_code)
+        self.term_index: Dict[str, int] = {term: j for j, term in enumerate(self.term_codes)}
+
+        history, observed, _ = history_from_matrix(availability_matrix)
+        self.forecaster = (forecaster or OfferingForecaster()).fit(history, observed)
+        self._model_status = np.array([PATTERN_STATUS[model.pattern] for model in self.forecaster.models],
+                                      dtype=np.int8)
+
+        course_codes = list(availability_matrix.course_index)
+        self.status, self.confidence = self.compute(course_codes, self.term_codes)
+        self.status.setflags(write=False)
+        self.confidence.setflags(write=False)
+
+    def compute(self, course_codes: Sequence[str], term_codes: Sequence[str]):
+        """
+        Forecast arbitrary courses and (future) terms; courses without history and terms
+        that are not after the newest data term are NOT_OFFERED with confidence 0.
+
+        Returns:
+            (status codes int8 array, confidence float32 array), both (courses x terms)
+        """
+        status = np.full((len(course_codes), len(term_codes)), NOT_OFFERED, dtype=np.int8)
+        confidence = np.zeros((len(course_codes), len(term_codes)), dtype=np.float32)
+        if self.newest_term is None:
+            return status, confidence
+
+        index = self.availability_matrix.course_index
+        rows = np.array([index.get(code, -1) for code in course_codes], dtype=np.intp)
+        steps = np.array([term_ordinal(term_code) for term_code in term_codes], dtype=np.intp) \
+            - term_ordinal(self.newest_term)
+        known, future = np.flatnonzero(rows >= 0), np.flatnonzero(steps > 0)
+        if not len(known) or not len(future):
+            return status, confidence
+
+        probabilities = self.forecaster.forecast(int(steps.max()), rows[known])[:, steps[future] - 1]
+        model_status = self._model_status[self.forecaster.model_index[rows[known]]]
+        confidence[np.ix_(known, future)] = probabilities
+        status[np.ix_(known, future)] = np.where(probabilities >= self.forecaster.threshold,
+                                                 model_status[:, None], NOT_OFFERED)
+        return status, confidence
+
+    def status_of(self, course_code: str, term_code: str) -> int:
+        """Predicted status code of one course in one future term."""
+        row = self.availability_matrix.course_index.get(course_code)
+        column = self.term_index.get(term_code)
+        if row is not None and column is not None:
+            return int(self.status[row, column])
+        return int(self.lookup([course_code], [term_code])[0][0, 0])
+
+    def lookup(self, course_codes: Sequence[str], term_codes: Sequence[str]):
+        """
+        Predictions for every (course, term) pair; terms past the table's horizon are
+        computed on the fly, terms that are not in the future are NOT_OFFERED.
+        """
+        index = self.availability_matrix.course_index
+        rows = np.array([index.get(code, -1) for code in course_codes], dtype=np.intp)
+        status = np.full((len(course_codes), len(term_codes)), NOT_OFFERED, dtype=np.int8)
+        confidence = np.zeros((len(course_codes), len(term_codes)), dtype=np.float32)
+
+        known = rows >= 0
+        beyond_horizon = []
+        newest_ordinal = term_ordinal(self.newest_term) if self.newest_term is not None else None
+        for column, term_code in enumerate(term_codes):
+            table_column = self.term_index.get(term_code)
+            if table_column is not None:
+                status[known, column] = self.status[rows[known], table_column]
+                confidence[known, column] = self.confidence[rows[known], table_column]
+            elif newest_ordinal is not None and term_ordinal(term_code) > newest_ordinal:
+                beyond_horizon.append(column)
+
+        if beyond_horizon:
+            extra_status, extra_confidence = self.compute(course_codes, [term_codes[c] for c in beyond_horizon])
+            status[:, beyond_horizon] = extra_status
+            confidence[:, beyond_horizon] = extra_confidence
+        return status, confidence
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Catalog Snapshot
+================
+Compile the filtered course catalog (``data/course_data_filtered``) into a single
+versioned binary file that can be memory-mapped at startup.
+
+Layout (little-endian):
+
+    header            magic, format version, source fingerprint, section counts/offsets
+    string table      (n_strings + 1) uint32 offsets followed by one UTF-8 blob
+    course records    fixed-width records, grouped by subject
+    availability      (term_code, term_name) string ids, referenced by course records
+    subject table     (subject, first record, record count)
+
+Every string is stored once and referenced by id, so records stay fixed width and a
+course can be decoded without touching any other record. Pages are only read when a
+course is accessed, and forked workers share them through the page cache.
+
+Usage:
+    python -m src.core.catalog_snapshot [--source DIR] [--output FILE]
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from collections.abc import MutableMapping
+
+MAGIC = b"SYDECAT\x00"
+FORMAT_VERSION = 1
+
+# magic, version, fingerprint, n_strings, n_courses, n_availability, n_subjects,
+# string offsets position, string data position, course position,
+# availability position, subject position
+HEADER = struct.Struct("<8sI32sIIIIQQQQQ")
+# code, course_id, subject, catalog, title, description, requirements (-1 for None),
+# term_code, term_name, career, credit_weight, availability start, availability count
+COURSE_RECORD = struct.Struct("<iiiiiiiiiidII")
+AVAILABILITY_RECORD = struct.Struct("<ii")
+SUBJECT_RECORD = struct.Struct("<iII")
+STRING_OFFSET = struct.Struct("<I")
+
+NO_STRING = -1
+
+
+def source_fingerprint(source_dir: Path) -> bytes:
+    """Hash the name, size and mtime of every term file under the catalog directory."""
+    digest = hashlib.sha256()
+    if not source_dir.exists():
+        return digest.digest()
+
+    subject_entries = sorted((e for e in os.scandir(source_dir) if e.is_dir()), key=lambda e: e.name)
+    for subject_entry in subject_entries:
+        term_entries = sorted((e for e in os.scandir(subject_entry.path) if e.name.endswith(".json")),
+                              key=lambda e: e.name)
+        for term_entry in term_entries:
+            stat = term_entry.stat()
+            digest.update(f"{subject_entry.name}/{term_entry.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.digest()
+
+
+class CatalogSnapshotWriter:
+    """Accumulate subjects and write them out as a catalog snapshot."""
+
+    def __init__(self):
+        self._string_ids: Dict[str, int] = {}
+        self._strings: List[bytes] = []
+        self._courses: List[Tuple] = []
+        self._availability: List[Tuple[int, int]] = []
+        self._subjects: List[Tuple[int, int, int]] = []
+
+    def _intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._string_ids[value] = string_id
+            self._strings.append(value.encode("utf-8"))
+        return string_id
+
+    def add_subject(self, subject_code: str,
+                    courses: Iterable[Tuple[str, Dict[str, Any], List[Dict[str, str]]]]) -> None:
+        """
+        Add one subject to the snapshot.
+
+        Args:
+            subject_code: Subject directory name (e.g., "SYDE")
+            courses: (course_code, course fields, availability list) in load order
+        """
+        first_record = len(self._courses)
+        for course_code, fields, availability in courses:
+            availability_start = len(self._availability)
+            for offering in availability:
+                self._availability.append((self._intern(offering["term_code"]), self._intern(offering["term_name"])))
+
+            self._courses.append((
+                self._intern(course_code),
+                self._intern(fields["course_id"]),
+                self._intern(fields["subject_code"]),
+                self._intern(fields["catalog_number"]),
+                self._intern(fields["title"]),
+                self._intern(fields["description"]),
+                self._intern(fields["requirements_description"]),
+                self._intern(fields["term_code"]),
+                self._intern(fields["term_name"]),
+                self._intern(fields["academic_career"]),
+                float(fields["credit_weight"]),
+                availability_start,
+                len(availability),
+            ))
+        self._subjects.append((self._intern(subject_code), first_record, len(self._courses) - first_record))
+
+    def write(self, output_path: Path, fingerprint: bytes) -> None:
+        """Write the snapshot atomically (temp file + rename)."""
+        string_offsets = bytearray()
+        position = 0
+        for encoded in self._strings:
+            string_offsets += STRING_OFFSET.pack(position)
+            position += len(encoded)
+        string_offsets += STRING_OFFSET.pack(position)
+        string_data = b"".join(self._strings)
+
+        string_offsets_pos = HEADER.size
+        string_data_pos = string_offsets_pos + len(string_offsets)
+        course_pos = string_data_pos + len(string_data)
+        availability_pos = course_pos + COURSE_RECORD.size * len(self._courses)
+        subject_pos = availability_pos + AVAILABILITY_RECORD.size * len(self._availability)
+
+        header = HEADER.pack(
+            MAGIC, FORMAT_VERSION, fingerprint,
+            len(self._strings), len(self._courses), len(self._availability), len(self._subjects),
+            string_offsets_pos, string_data_pos, course_pos, availability_pos, subject_pos,
+        )
+
+        output_path = Path(output_path)
+        temp_path = output_path.with_name(output_path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            f.write(header)
+            f.write(string_offsets)
+            f.write(string_data)
+            for record in self._courses:
+                f.write(COURSE_RECORD.pack(*record))
+            for record in self._availability:
+                f.write(AVAILABILITY_RECORD.pack(*record))
+            for record in self._subjects:
+                f.write(SUBJECT_RECORD.pack(*record))
+        os.replace(temp_path, output_path)
+
+
+class CatalogSnapshot:
+    """Read-only, memory-mapped view over a catalog snapshot file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, self.fingerprint,
+         self.n_strings, self.n_courses, self.n_availability, n_subjects,
+         self._string_offsets_pos, self._string_data_pos, self._course_pos,
+         self._availability_pos, subject_pos) = HEADER.unpack_from(self._buffer, 0)
+
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a catalog snapshot")
+        self.format_version = version
+
+        self._string_cache: Dict[int, str] = {}
+        self.subjects: Dict[str, Tuple[int, int]] = {}
+        for i in range(n_subjects):
+            subject_id, first_record, count = SUBJECT_RECORD.unpack_from(self._buffer, subject_pos + i * SUBJECT_RECORD.size)
+            self.subjects[self.string(subject_id)] = (first_record, count)
+
+    @classmethod
+    def open_if_fresh(cls, path: Path, source_dir: Path) -> Optional["CatalogSnapshot"]:
+        """Open the snapshot only if it exists and matches the current JSON catalog."""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            snapshot = cls(path)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Warning: Could not open catalog snapshot {path}: {e}")
+            return None
+
+        if snapshot.format_version != FORMAT_VERSION or snapshot.fingerprint != source_fingerprint(source_dir):
+            print(f"Catalog snapshot {path} is stale; falling back to JSON files")
+            snapshot.close()
+            return None
+        return snapshot
+
+    def close(self) -> None:
+        self._buffer.close()
+
+    def string(self, string_id: int) -> Optional[str]:
+        """Decode a string table entry (cached after first access)."""
+        if string_id == NO_STRING:
+            return None
+        value = self._string_cache.get(string_id)
+        if value is None:
+            start, end = struct.unpack_from("<II", self._buffer, self._string_offsets_pos + string_id * STRING_OFFSET.size)
+            value = self._buffer[self._string_data_pos + start:self._string_data_pos + end].decode("utf-8")
+            self._string_cache[string_id] = value
+        return value
+
+    def subject_records(self, subject_code: str) -> range:
+        """Record indices belonging to a subject, in load order."""
+        first_record, count = self.subjects.get(subject_code, (0, 0))
+        return range(first_record, first_record + count)
+
+    def _record(self, index: int) -> Tuple:
+        return COURSE_RECORD.unpack_from(self._buffer, self._course_pos + index * COURSE_RECORD.size)
+
+    def course_code(self, index: int) -> str:
+        """Course code of a record without decoding the rest of it."""
+        code_id, = struct.unpack_from("<i", self._buffer, self._course_pos + index * COURSE_RECORD.size)
+        return self.string(code_id)
+
+    def requirements_description(self, index: int) -> Optional[str]:
+        """Requirements text of a record without building the full field dict."""
+        requirements_id, = struct.unpack_from("<i", self._buffer, self._course_pos + index * COURSE_RECORD.size + 6 * 4)
+        return self.string(requirements_id)
+
+    def course_fields(self, index: int) -> Dict[str, Any]:
+        """Keyword arguments for building a ``Course`` from a record."""
+        record = self._record(index)
+        return {
+            "course_id": self.string(record[1]),
+            "subject_code": self.string(record[2]),
+            "catalog_number": self.string(record[3]),
+            "title": self.string(record[4]),
+            "description": self.string(record[5]),
+            "credit_weight": record[10],
+            "requirements_description": self.string(record[6]),
+            "term_code": self.string(record[7]),
+            "term_name": self.string(record[8]),
+            "academic_career": self.string(record[9]),
+        }
+
+    def availability(self, index: int) -> List[Dict[str, str]]:
+        """Offering list of a record, in the same shape as the JSON loader builds."""
+        record = self._record(index)
+        start, count = record[11], record[12]
+        offerings = []
+        for i in range(start, start + count):
+            term_id, name_id = AVAILABILITY_RECORD.unpack_from(self._buffer, self._availability_pos + i * AVAILABILITY_RECORD.size)
+            offerings.append({"term_code": self.string(term_id), "term_name": self.string(name_id)})
+        return offerings
+
+
+class LazyRecordMap(MutableMapping):
+    """
+    Mapping whose values are built from snapshot records on first access.
+
+    Keys registered with ``add_pending`` hold only a record index until they are
+    read; values assigned normally behave like a plain dict entry.
+    """
+
+    def __init__(self, factory: Callable[[int], Any]):
+        self._factory = factory
+        self._values: Dict[str, Any] = {}
+        self._pending: Dict[str, int] = {}
+
+    def add_pending(self, key: str, record_index: int) -> None:
+        if key not in self._values and key not in self._pending:
+            self._pending[key] = record_index
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            record_index = self._pending.get(key)
+            if record_index is None:
+                # Either unknown, or another thread materialized it in the meantime
+                return self._values[key]
+            # Publish the value before dropping the pending entry so concurrent
+            # readers always find the key in one of the two dicts
+            value = self._values.setdefault(key, self._factory(record_index))
+            self._pending.pop(key, None)
+            return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._pending.pop(key, None)
+        self._values[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._pending:
+            del self._pending[key]
+        else:
+            del self._values[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or key in self._pending
+
+    def __iter__(self) -> Iterator[str]:
+        pending = list(self._pending)
+        materialized = list(self._values)
+        yield from materialized
+        seen = set(materialized)
+        yield from (key for key in pending if key not in seen)
+
+    def __len__(self) -> int:
+        return len(self._values) + len(self._pending)
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._pending.clear()
+
+
+def main() -> None:
+    from .planner import DATA_DIR, CourseCatalog
+
+    parser = argparse.ArgumentParser(description="Compile the filtered course catalog into a binary snapshot.")
+    parser.add_argument("--source", type=Path, default=DATA_DIR / "course_data_filtered",
+                        help="Catalog directory with one folder of term JSON files per subject")
+    parser.add_argument("--output", type=Path, default=DATA_DIR / "course_catalog.snapshot",
+                        help="Snapshot file to write")
+    args = parser.parse_args()
+
+    catalog = CourseCatalog(base_course_data_dir=args.source, snapshot_path=None)
+    stats = catalog.build_snapshot(args.output)
+    print(f"Wrote {args.output} ({stats['subjects']} subjects, {stats['courses']} courses, "
+          f"{args.output.stat().st_size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Degree Audit
+============
+Checks whether a student's completed and planned courses satisfy a program's
+requirements, and reports what is missing, without counting one course twice.
+
+A program's parsed requirements (as built by SYDECoursePlanner) compile once into
+DegreeRules. Compulsory courses, departmental minimums and the course total are counts
+over the plan's courses. Choice and elective groups that list courses compete for the
+same courses, so they are checked together as a flow network:
+
+    source -> course (capacity 1) -> group (capacity n_to_choose) -> sink
+
+where 500-level courses enter through one node whose capacity is what max_500_level
+leaves after the compulsory 500-level courses. A maximum flow gives every course to at
+most one group; a group is satisfied when its edge to the sink is saturated. Compulsory
+courses may fill a group (a specialization's required workshop variant fills the
+workshop choice group). Groups without a course list only count toward the total.
+
+DegreeAudit keeps its flow between changes. Adding a course can raise the maximum flow by
+at most one unit and removing one can lower it by at most one, so each change costs one
+cancelled path and one or two breadth-first searches over a network of a few dozen
+nodes, cheap enough to run after every move. audit_course_sets audits many plans against
+the same rules (e.g. a cohort), each distinct set of courses once.
+
+Usage:
+    python -m src.core.degree_audit PLANS.json --program NAME [--specialization NAME]
+"""
+
+import argparse
+import json
+import re
+from collections import Counter, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .scheduler import COURSE_CODE_PATTERN, SUBJECT_MINIMUM_PATTERN
+
+# Legacy 'complex' elective rules state their minimums only in the description, e.g.
+# "At least 2 from Specified list, and at least 1 from Elective list."
+LIST_MINIMUM_PATTERN = re.compile(r'at least (\d+) from (specified|elective) list', re.IGNORECASE)
+
+SOURCE = '<source>'
+SINK = '<sink>'
+LEVEL5 = '<500-level>'
+
+
+@dataclass(frozen=True)
+class RequirementGroup:
+    """At least ``minimum`` distinct courses from ``courses``, none of them counted for another group."""
+    name: str
+    kind: str  # 'choice' or 'elective'
+    courses: FrozenSet[str]
+    minimum: int
+
+
+@dataclass(frozen=True)
+class DepartmentalMinimum:
+    """At least ``minimum`` courses in any of ``subjects``."""
+    description: str
+    subjects: Tuple[str, ...]
+    minimum: int
+
+
+class DegreeRules:
+    """A program's requirements compiled for auditing (see the module docstring)."""
+
+    def __init__(self, requirements: Dict[str, Any], course_level: Callable[[str], int],
+                 program_subjects: Iterable[str] = ()):
+        """
+        Args:
+            requirements: Parsed requirements ('requirements_summary' of a plan)
+            course_level: Level digit of a course code (5 for 500-level)
+            program_subjects: Subject codes of the program, for min_dept_courses
+        """
+        self.course_level = course_level
+        self.total_courses: int = requirements.get('total_courses', 8)
+        self.compulsory: FrozenSet[str] = frozenset(requirements.get('compulsory_courses', []))
+
+        groups: List[RequirementGroup] = []
+        for group in requirements.get('compulsory_choices', []):
+            groups.append(RequirementGroup(group.get('group_name', 'Choice Group'), 'choice',
+                                           _course_codes(group.get('courses', [])), group.get('n_to_choose', 1)))
+        for group in requirements.get('elective_requirements', []):
+            name = group.get('group_name') or 'Electives'
+            if group.get('courses'):
+                groups.append(RequirementGroup(name, 'elective', _course_codes(group['courses']),
+                                               group.get('n_to_choose', 1)))
+            list_minimums = {kind.lower(): int(count)
+                             for count, kind in LIST_MINIMUM_PATTERN.findall(group.get('description', ''))}
+            for kind in ('specified', 'elective'):
+                if group.get(f'{kind}_list'):
+                    groups.append(RequirementGroup(f"{name} ({kind.capitalize()} list)", 'elective',
+                                                   _course_codes(group[f'{kind}_list']), list_minimums.get(kind, 1)))
+        # Groups naming no course codes (e.g. "6 Engineering graduate courses") only count toward the total
+        self.groups: Tuple[RequirementGroup, ...] = tuple(group for group in groups if group.courses)
+        self.groups_of: Dict[str, Tuple[int, ...]] = {}
+        for index, group in enumerate(self.groups):
+            for code in group.courses:
+                self.groups_of[code] = self.groups_of.get(code, ()) + (index,)
+
+        constraints = requirements.get('constraints') or {}
+        self.max_500_level: Optional[int] = (constraints.get('level_constraints') or {}).get('max_500_level')
+
+        departmental = constraints.get('departmental_constraints') or {}
+        program_subjects = tuple(program_subjects)
+        minimums = []
+        for key, minimum in departmental.items():
+            match = SUBJECT_MINIMUM_PATTERN.fullmatch(key)
+            if key == 'min_dept_courses':
+                subjects = program_subjects
+            elif match:
+                subjects = (match.group(1).upper(),)
+            else:
+                continue  # not expressible as a course count over known subjects
+            minimums.append(DepartmentalMinimum(departmental.get('description', key), subjects, minimum))
+        self.departmental: Tuple[DepartmentalMinimum, ...] = tuple(minimums)
+
+    def is_level5(self, course_code: str) -> bool:
+        """True for a 500-level course while the program limits them."""
+        return self.max_500_level is not None and self.course_level(course_code) == 5
+
+
+def _course_codes(entries: Iterable[str]) -> FrozenSet[str]:
+    """Course codes in requirement list entries (codes or legacy descriptions)."""
+    return frozenset(code for entry in entries for code in COURSE_CODE_PATTERN.findall(entry))
+
+
+class DegreeAudit:
+    """Requirement status of one changing set of courses."""
+
+    def __init__(self, rules: DegreeRules, courses: Iterable[str] = ()):
+        self.rules = rules
+        self.counts: Counter = Counter()  # course -> placements (a course counts once however often it appears)
+        self.capacity: Dict[Any, Dict[Any, int]] = {}  # forward edges
+        self.residual: Dict[Any, Dict[Any, int]] = {}  # residual[v][u] of a forward edge u -> v is its flow
+        self.incoming: Dict[Any, set] = {}
+
+        if rules.max_500_level is not None:
+            self._add_edge(SOURCE, LEVEL5, rules.max_500_level)
+        for index, group in enumerate(rules.groups):
+            self._add_edge(('group', index), SINK, group.minimum)
+        for code in courses:
+            self.add(code)
+
+    @property
+    def courses(self) -> FrozenSet[str]:
+        return frozenset(self.counts)
+
+    # --- Changes ---
+
+    def add(self, course_code: str) -> None:
+        """Count one more placement of a course."""
+        self.counts[course_code] += 1
+        if self.counts[course_code] == 1:
+            self._update_course(course_code, 1)
+
+    def remove(self, course_code: str) -> None:
+        """Drop one placement of a course."""
+        if not self.counts[course_code]:
+            raise ValueError(f"{course_code} is not in the audited plan")
+        self.counts[course_code] -= 1
+        if not self.counts[course_code]:
+            del self.counts[course_code]
+            self._update_course(course_code, 0)
+
+    def _update_course(self, course_code: str, present: int) -> None:
+        """Open (1) or close (0) a course's edge from the source side of the network."""
+        rules = self.rules
+        if course_code in rules.compulsory and rules.is_level5(course_code):
+            used = sum(1 for code in rules.compulsory if code in self.counts and rules.is_level5(code))
+            self._set_capacity(SOURCE, LEVEL5, max(0, rules.max_500_level - used))
+        if course_code not in rules.groups_of:
+            return
+        entry = LEVEL5 if rules.is_level5(course_code) and course_code not in rules.compulsory else SOURCE
+        if course_code not in self.capacity:
+            self._add_edge(entry, course_code, 0)
+            for index in rules.groups_of[course_code]:
+                self._add_edge(course_code, ('group', index), 1)
+        self._set_capacity(entry, course_code, present)
+
+    # --- Flow network ---
+
+    def _add_edge(self, u: Any, v: Any, capacity: int) -> None:
+        self.capacity.setdefault(u, {})[v] = capacity
+        self.residual.setdefault(u, {})[v] = capacity
+        self.residual.setdefault(v, {})[u] = 0
+        self.incoming.setdefault(v, set()).add(u)
+
+    def _flow(self, u: Any, v: Any) -> int:
+        return self.residual[v][u]
+
+    def _set_capacity(self, u: Any, v: Any, capacity: int) -> None:
+        """Change an edge's capacity and restore a maximum flow."""
+        while self._flow(u, v) > capacity:
+            self._cancel_unit(u, v)
+        self.capacity[u][v] = capacity
+        self.residual[u][v] = capacity - self._flow(u, v)
+        while self._augment():
+            pass
+
+    def _cancel_unit(self, u: Any, v: Any) -> None:
+        """Take one unit of flow off a source-sink path through the edge u -> v."""
+        path = [u, v]
+        while path[-1] != SINK:
+            node = path[-1]
+            path.append(next(w for w in self.capacity[node] if self._flow(node, w) > 0))
+        while path[0] != SOURCE:
+            node = path[0]
+            path.insert(0, next(w for w in self.incoming[node] if self._flow(w, node) > 0))
+        for a, b in zip(path, path[1:]):
+            self.residual[a][b] += 1
+            self.residual[b][a] -= 1
+
+    def _augment(self) -> bool:
+        """Push one unit along a shortest residual source-sink path; False if there is none."""
+        parents = {SOURCE: None}
+        queue = deque([SOURCE])
+        while queue and SINK not in parents:
+            node = queue.popleft()
+            for neighbor, residual in self.residual.get(node, {}).items():
+                if residual > 0 and neighbor not in parents:
+                    parents[neighbor] = node
+                    queue.append(neighbor)
+        if SINK not in parents:
+            return False
+        node = SINK
+        while parents[node] is not None:
+            parent = parents[node]
+            self.residual[parent][node] -= 1
+            self.residual[node][parent] += 1
+            node = parent
+        return True
+
+    # --- Report ---
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Requirement status of the current courses.
+
+        Returns:
+            {'satisfied', 'missing': [messages], 'warnings': [messages],
+             'total': {'required', 'counted'}, 'compulsory': {'required', 'missing'},
+             'groups': [{'name', 'kind', 'required', 'assigned', 'missing', 'options'}],
+             'departmental': [{'description', 'subjects', 'required', 'count', 'missing'}],
+             'level': {'max_500_level', 'counted', 'uncounted'} or None}
+        """
+        rules = self.rules
+        courses = self.courses
+        missing: List[str] = []
+        warnings: List[str] = []
+
+        missing_compulsory = sorted(rules.compulsory - courses)
+        missing.extend(f"Compulsory course {code} is missing" for code in missing_compulsory)
+
+        groups = []
+        assigned_courses = set()
+        for index, group in enumerate(rules.groups):
+            node = ('group', index)
+            assigned = sorted(code for code in self.incoming.get(node, ()) if self._flow(code, node) > 0)
+            assigned_courses.update(assigned)
+            shortfall = group.minimum - len(assigned)
+            groups.append({
+                'name': group.name,
+                'kind': group.kind,
+                'required': group.minimum,
+                'assigned': assigned,
+                'missing': shortfall,
+                'options': sorted(group.courses - courses) if shortfall > 0 else [],
+            })
+            if shortfall > 0:
+                missing.append(f"{group.name}: {shortfall} more course(s) needed")
+
+        level = None
+        counted = len(courses)
+        if rules.max_500_level is not None:
+            # Compulsory and group courses are the ones worth counting under the limit
+            level5 = sorted((code for code in courses if rules.is_level5(code)),
+                            key=lambda code: (code not in rules.compulsory, code not in assigned_courses, code))
+            uncounted = level5[rules.max_500_level:]
+            counted -= len(uncounted)
+            level = {'max_500_level': rules.max_500_level, 'counted': level5[:rules.max_500_level],
+                     'uncounted': uncounted}
+            if uncounted:
+                warnings.append(f"Only {rules.max_500_level} 500-level course(s) count toward the degree; "
+                                f"not counted: {', '.join(uncounted)}")
+
+        departmental = []
+        for minimum in rules.departmental:
+            count = sum(1 for code in courses if code.split(' ')[0] in minimum.subjects)
+            shortfall = max(0, minimum.minimum - count)
+            departmental.append({'description': minimum.description, 'subjects': list(minimum.subjects),
+                                 'required': minimum.minimum, 'count': count, 'missing': shortfall})
+            if shortfall:
+                missing.append(f"{minimum.description} ({shortfall} more needed)")
+
+        if counted < rules.total_courses:
+            missing.append(f"{rules.total_courses - counted} more course(s) needed "
+                           f"toward the {rules.total_courses}-course total")
+
+        return {
+            'satisfied': not missing,
+            'missing': missing,
+            'warnings': warnings,
+            'total': {'required': rules.total_courses, 'counted': counted},
+            'compulsory': {'required': sorted(rules.compulsory), 'missing': missing_compulsory},
+            'groups': groups,
+            'departmental': departmental,
+            'level': level,
+        }
+
+
+def audit_course_sets(rules: DegreeRules, course_sets: Iterable[Iterable[str]]) -> List[Dict[str, Any]]:
+    """
+    Audit many plans' courses against the same rules (bulk mode).
+
+    Plans with the same set of courses share one report object.
+    """
+    reports: Dict[FrozenSet[str], Dict[str, Any]] = {}
+    results = []
+    for courses in course_sets:
+        key = frozenset(courses)
+        if key not in reports:
+            reports[key] = DegreeAudit(rules, key).report()
+        results.append(reports[key])
+    return results
+
+
+def main() -> None:
+    from .planner import SYDECoursePlanner
+
+    parser = argparse.ArgumentParser(description="Audit a cohort's plans against a program's requirements.")
+    parser.add_argument("plans", type=Path,
+                        help="JSON list of plans, each {'current_plan': {...}, 'completed_courses': {...}}")
+    parser.add_argument("--program", required=True, help="Program name, e.g. 'Systems Design Engineering'")
+    parser.add_argument("--specialization", help="Specialization name")
+    args = parser.parse_args()
+
+    planner = SYDECoursePlanner()
+    planner.initialize()
+    user_input = {'program': args.program}
+    if args.specialization:
+        user_input['specialization'] = args.specialization
+    result = planner.audit_plans(user_input, json.loads(args.plans.read_text()))
+    if 'error' in result:
+        raise SystemExit(result['error'])
+
+    reports = result['reports']
+    print(f"{result['satisfied']} of {len(reports)} plans satisfy the requirements")
+    for message, count in Counter(message for report in reports for message in report['missing']).most_common(10):
+        print(f"{count:6d}  {message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Offering Forecaster
+===================
+Per-course offering models fitted over the whole availability matrix at once.
+
+The history is a dense course x term array covering every term from the oldest to the
+newest data term (terms without data are unobserved, not "not offered"). Each candidate
+model predicts a course's chance of running in term t from the same-phase terms
+t - L, t - 2L, ... for a period L of one or two years, weighting older terms by a decay
+factor and shrinking toward the course's overall offering rate r:
+
+    p(t) = (sum_j w^(j-1) x(t - jL) + a * r) / (sum_j w^(j-1) + a)
+
+The sums follow a recurrence over term columns, S(t) = x(t - L) + w * S(t - L), so one pass
+gives every course's one-step-ahead prediction of every historical term from the terms
+before it. Fitting scores each model per course by the Brier score of those predictions
+and keeps the best one. Forecasts continue the same recurrence past the newest term,
+feeding back the predicted probabilities of future terms.
+
+The backtest holds out the newest terms, fits on the rest and compares the forecasts,
+and the previous rule (offered in the same season within the last three years), with
+what was actually offered.
+
+Usage:
+    python -m src.core.forecasting [--holdout TERMS] [--subjects SYDE ECE ...]
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.term_helpers import TERMS_PER_YEAR, term_code_from_ordinal, term_ordinal
+
+
+@dataclass(frozen=True)
+class OfferingModel:
+    """Same-phase offering model: period in terms, decay of older same-phase terms, and the pattern it stands for."""
+    period: int
+    decay: float
+    pattern: str
+
+
+# Candidates in tie-break order (the first of equally good models is kept). Decays,
+# prior strength and threshold were chosen with the backtest below (a third, three-year
+# period lowered held-out accuracy and was dropped).
+MODELS = (
+    OfferingModel(TERMS_PER_YEAR, 0.9, 'annual'),        # every year in the season, steady
+    OfferingModel(TERMS_PER_YEAR, 0.2, 'sporadic'),      # the latest years dominate (new, dropped or irregular courses)
+    OfferingModel(2 * TERMS_PER_YEAR, 0.9, 'biennial'),  # every other year
+)
+# Weight of the overall offering rate in each prediction (pseudo-observations)
+PRIOR_STRENGTH = 1.0
+# Forecast probability at which a course counts as offered
+OFFERED_THRESHOLD = 0.5
+# Same-season years consulted by the previous rule (baseline_forecast)
+BASELINE_LOOKBACK_YEARS = 3
+
+
+def history_from_matrix(availability_matrix) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Dense offering history of an AvailabilityMatrix.
+
+    Returns:
+        (history float32 courses x terms, observed bool per term, term codes), with one
+        column per term from the oldest to the newest data term
+    """
+    if not availability_matrix.term_codes:
+        return np.zeros((len(availability_matrix.course_index), 0), dtype=np.float32), np.zeros(0, dtype=bool), []
+    ordinals = np.array([term_ordinal(term_code) for term_code in availability_matrix.term_codes])
+    first = ordinals[0]
+    num_terms = int(ordinals[-1] - first + 1)
+    history = np.zeros((availability_matrix.offered.shape[0], num_terms), dtype=np.float32)
+    history[:, ordinals - first] = availability_matrix.offered
+    observed = np.zeros(num_terms, dtype=bool)
+    observed[ordinals - first] = True
+    return history, observed, [term_code_from_ordinal(int(first) + j) for j in range(num_terms)]
+
+
+def _run_model(model: OfferingModel, history: np.ndarray, observed: np.ndarray, horizon: int,
+               prior_strength: float) -> np.ndarray:
+    """
+    A model's predictions for every history term (from the terms before it) and for
+    ``horizon`` terms after it (feeding back its own forecasts).
+
+    Returns:
+        float32 array (courses x (terms + horizon))
+    """
+    num_courses, num_terms = history.shape
+    total = num_terms + horizon
+    period, decay = model.period, model.decay
+
+    # Overall offering rate before each term (the whole history for forecasts)
+    weights = observed.astype(np.float32)
+    offered_before = np.zeros((num_courses, num_terms + 1), dtype=np.float32)
+    offered_before[:, 1:] = np.cumsum(history * weights, axis=1)
+    observed_before = np.concatenate(([0.0], np.cumsum(weights))).astype(np.float32)
+    before = np.minimum(np.arange(total), num_terms)
+    rate = offered_before[:, before] / np.maximum(observed_before[before], 1.0)
+
+    values = np.zeros((num_courses, total), dtype=np.float32)  # offered (history) or forecast (future)
+    values[:, :num_terms] = history * weights
+    value_weights = np.ones(total, dtype=np.float32)
+    value_weights[:num_terms] = weights
+
+    sums = np.zeros((num_courses, total), dtype=np.float32)
+    counts = np.zeros(total, dtype=np.float32)
+    predictions = np.zeros((num_courses, total), dtype=np.float32)
+    for t in range(total):
+        if t >= period:
+            sums[:, t] = values[:, t - period] + decay * sums[:, t - period]
+            counts[t] = value_weights[t - period] + decay * counts[t - period]
+        predictions[:, t] = (sums[:, t] + prior_strength * rate[:, t]) / (counts[t] + prior_strength)
+        if t >= num_terms:
+            values[:, t] = predictions[:, t]
+    return predictions
+
+
+class OfferingForecaster:
+    """Chooses and runs one OfferingModel per course (see the module docstring)."""
+
+    def __init__(self, models: Sequence[OfferingModel] = MODELS, prior_strength: float = PRIOR_STRENGTH,
+                 threshold: float = OFFERED_THRESHOLD):
+        self.models = tuple(models)
+        self.prior_strength = prior_strength
+        self.threshold = threshold
+        self.history = np.zeros((0, 0), dtype=np.float32)
+        self.observed = np.zeros(0, dtype=bool)
+        self.model_index = np.zeros(0, dtype=np.intp)
+
+    def fit(self, history: np.ndarray, observed: np.ndarray) -> 'OfferingForecaster':
+        """
+        Pick each course's model by the Brier score of its one-step-ahead predictions.
+
+        Args:
+            history: courses x terms, 1 where the course was offered (consecutive terms)
+            observed: per term, False for terms without data
+        """
+        self.history = np.asarray(history, dtype=np.float32)
+        self.observed = np.asarray(observed, dtype=bool)
+        scores = np.empty((len(self.models), self.history.shape[0]), dtype=np.float32)
+        for m, model in enumerate(self.models):
+            predictions = _run_model(model, self.history, self.observed, 0, self.prior_strength)
+            scores[m] = (((predictions - self.history) ** 2) * self.observed).sum(axis=1)
+        # Rounding keeps floating-point noise from overriding the tie-break order
+        self.model_index = np.argmin(np.round(scores, 4), axis=0) if len(self.models) else self.model_index
+        return self
+
+    def forecast(self, horizon: int, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Offering probabilities for the ``horizon`` terms after the history.
+
+        Args:
+            rows: Course rows to forecast (all courses if None)
+
+        Returns:
+            float32 array (rows x horizon)
+        """
+        rows = np.arange(self.history.shape[0]) if rows is None else np.asarray(rows, dtype=np.intp)
+        probabilities = np.zeros((len(rows), horizon), dtype=np.float32)
+        num_terms = self.history.shape[1]
+        for m, model in enumerate(self.models):
+            selected = np.flatnonzero(self.model_index[rows] == m)
+            if len(selected):
+                predictions = _run_model(model, self.history[rows[selected]], self.observed, horizon,
+                                         self.prior_strength)
+                probabilities[selected] = predictions[:, num_terms:]
+        return probabilities
+
+
+def baseline_forecast(history: np.ndarray, observed: np.ndarray, horizon: int) -> np.ndarray:
+    """
+    The previous rule's confidence for the ``horizon`` terms after the history: the share of
+    the last three same-season terms (within the history) the course ran in. The rule
+    predicted an offering whenever the confidence is positive.
+    """
+    num_courses, num_terms = history.shape
+    confidence = np.zeros((num_courses, horizon), dtype=np.float32)
+    for step in range(horizon):
+        target = num_terms + step
+        for years_back in range(1, BASELINE_LOOKBACK_YEARS + 1):
+            column = target - years_back * TERMS_PER_YEAR
+            if 0 <= column < num_terms:
+                confidence[:, step] += history[:, column]
+    return confidence / BASELINE_LOOKBACK_YEARS
+
+
+def backtest(history: np.ndarray, observed: np.ndarray, holdout: int,
+             forecaster: Optional[OfferingForecaster] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Fit on all but the newest ``holdout`` terms and score forecasts of those terms.
+
+    Only courses offered at least once in the training terms are scored (no model can
+    forecast a course's first offering), and only held-out terms with data.
+
+    Returns:
+        {'forecaster': metrics, 'baseline': metrics} with accuracy, precision, recall, f1,
+        brier, courses, terms and runtime_ms
+    """
+    forecaster = forecaster or OfferingForecaster()
+    train, actual = history[:, :-holdout], history[:, -holdout:] > 0
+    train_observed, test_observed = observed[:-holdout], observed[-holdout:]
+    rows = np.flatnonzero(train.any(axis=1))
+
+    start = time.perf_counter()
+    probabilities = forecaster.fit(train, train_observed).forecast(holdout)
+    forecaster_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    baseline = baseline_forecast(train, train_observed, holdout)
+    baseline_ms = (time.perf_counter() - start) * 1000
+
+    actual = actual[rows][:, test_observed]
+    return {
+        'forecaster': _metrics(probabilities[rows][:, test_observed], probabilities[rows][:, test_observed]
+                               >= forecaster.threshold, actual, forecaster_ms),
+        'baseline': _metrics(baseline[rows][:, test_observed], baseline[rows][:, test_observed] > 0,
+                             actual, baseline_ms),
+    }
+
+
+def _metrics(probabilities: np.ndarray, predicted: np.ndarray, actual: np.ndarray, runtime_ms: float) -> Dict[str, float]:
+    true_positives = float((predicted & actual).sum())
+    precision = true_positives / max(float(predicted.sum()), 1.0)
+    recall = true_positives / max(float(actual.sum()), 1.0)
+    return {
+        'accuracy': float((predicted == actual).mean()) if actual.size else 0.0,
+        'precision': precision,
+        'recall': recall,
+        'f1': 2 * precision * recall / (precision + recall) if precision + recall else 0.0,
+        'brier': float(((probabilities - actual) ** 2).mean()) if actual.size else 0.0,
+        'courses': actual.shape[0],
+        'terms': actual.shape[1],
+        'runtime_ms': runtime_ms,
+    }
+
+
+def main() -> None:
+    from .planner import CourseCatalog, PROGRAM_SUBJECT_MAPPING
+
+    parser = argparse.ArgumentParser(description="Backtest offering forecasts on held-out newest terms.")
+    parser.add_argument("--holdout", type=int, default=TERMS_PER_YEAR, help="Newest terms to hold out (default: one year)")
+    parser.add_argument("--subjects", nargs="+", help="Subject codes (default: every program's subjects)")
+    args = parser.parse_args()
+
+    subjects = args.subjects or sorted({code for codes in PROGRAM_SUBJECT_MAPPING.values() for code in codes})
+    catalog = CourseCatalog()
+    catalog.ensure_subjects(subjects)
+    history, observed, term_codes = history_from_matrix(catalog.availability_matrix)
+    if not 0 < args.holdout < len(term_codes):
+        raise SystemExit(f"--holdout must be between 1 and {len(term_codes) - 1}")
+
+    results = backtest(history, observed, args.holdout)
+    print(f"Trained on {term_codes[0]}-{term_codes[-args.holdout - 1]}, "
+          f"held out {term_codes[-args.holdout]}-{term_codes[-1]} ({len(subjects)} subjects)")
+    print(f"{'':12}{'accuracy':>10}{'precision':>10}{'recall':>10}{'f1':>8}{'brier':>8}{'courses':>9}{'ms':>8}")
+    for name, metrics in results.items():
+        print(f"{name:12}{metrics['accuracy']:10.3f}{metrics['precision']:10.3f}{metrics['recall']:10.3f}"
+              f"{metrics['f1']:8.3f}{metrics['brier']:8.3f}{metrics['courses']:9d}{metrics['runtime_ms']:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
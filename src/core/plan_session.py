@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Plan Sessions
+=============
+Server-side plans that are validated once and then kept valid incrementally.
+
+A session holds the plan (term -> courses) together with the state validation reads:
+where each course is placed (so "placed before term t" is a lookup instead of a
+prefix set rebuilt per request), the set of placed courses and the per-term counts.
+Applying an add/remove/move delta updates that state and re-validates only the
+placements the change can affect, found through the catalog's requirement graph:
+
+    - every placement in the terms the course left or entered (capacity)
+    - placements of courses that list it as a prerequisite or antirequisite
+    - placements of courses it lists as a prerequisite or antirequisite
+    - its own placements
+
+Each report equals what CourseValidator.validate_plan gives for the current plan. A
+session given a DegreeAudit keeps it in step with the plan, so every response also
+carries the program-requirement audit (see degree_audit.py).
+Sessions expire after a period without use (PlanSessionStore).
+"""
+
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from collections.abc import Container
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from ..utils.term_helpers import term_ordinal
+from .degree_audit import DegreeAudit
+
+Placement = Tuple[str, str]  # (course_code, term_code)
+
+
+class _PriorCourses(Container):
+    """Courses placed in a term before term_code, answered from the session's placement index."""
+
+    def __init__(self, course_terms: Dict[str, Counter], term_code: str):
+        self.course_terms = course_terms
+        self.term_ordinal = term_ordinal(term_code)
+
+    def __contains__(self, course_code: object) -> bool:
+        terms = self.course_terms.get(course_code)
+        return bool(terms) and min(term_ordinal(term_code) for term_code in terms) < self.term_ordinal
+
+
+class PlanSession:
+    """One student's plan plus its current validation reports."""
+
+    def __init__(self, course_validator, complete_report: Callable[[Dict[str, Any], str, str], Dict[str, Any]],
+                 planned_courses: Dict[str, List[str]], max_courses_per_term: int = 3,
+                 degree_audit: Optional[DegreeAudit] = None):
+        """
+        Args:
+            course_validator: CourseValidator of the session's program
+            complete_report: Adds request-level fields to a placement report (course info,
+                offering status, program requirement checks); called as (report, course_code, term_code)
+            planned_courses: Initial plan, term_code -> list of course codes
+            max_courses_per_term: Maximum courses allowed per term (default: 3)
+            degree_audit: Empty audit of the program's requirements, updated with every placement
+        """
+        self.course_validator = course_validator
+        self.degree_audit = degree_audit
+        self.requirement_graph = course_validator.requirement_graph
+        self.complete_report = complete_report
+        self.max_courses_per_term = max_courses_per_term
+        self.lock = threading.Lock()
+
+        self.planned: Dict[str, List[str]] = {}
+        self.placement_counts: Counter = Counter()
+        self.course_terms: Dict[str, Counter] = {}  # course -> Counter of the terms it is placed in
+        self.placed_courses: Set[str] = set()
+        self.reports: Dict[Placement, Dict[str, Any]] = {}
+        self.invalid: Set[Placement] = set()
+
+        for term_code, courses in planned_courses.items():
+            for course_code in courses:
+                self._place(course_code, term_code)
+        self._revalidate(self._placements())
+
+    @property
+    def valid(self) -> bool:
+        """True if every placement is currently valid."""
+        return not self.invalid
+
+    def state(self) -> Dict[str, Any]:
+        """The whole plan and every report, in term order."""
+        return {
+            'current_plan': {term_code: list(courses) for term_code, courses in self.planned.items() if courses},
+            'valid': self.valid,
+            'reports': [self.reports[placement] for placement in self._placements()],
+            'audit': self._audit(),
+        }
+
+    # --- Deltas ---
+
+    def add(self, course_code: str, term_code: str) -> Dict[str, Any]:
+        """Place a course in a term; returns the reports that changed."""
+        self._place(course_code, term_code)
+        return self._result(self._affected(course_code, term_code), [])
+
+    def remove(self, course_code: str, term_code: str) -> Dict[str, Any]:
+        """Take a course out of a term; returns the reports that changed."""
+        self._unplace(course_code, term_code)
+        return self._result(self._affected(course_code, term_code), [(course_code, term_code)])
+
+    def move(self, course_code: str, from_term: str, to_term: str) -> Dict[str, Any]:
+        """Move a course between terms; returns the reports that changed."""
+        term_ordinal(to_term)
+        if from_term != to_term and course_code in self.planned.get(to_term, ()):
+            raise ValueError(f"{course_code} is already planned in term {to_term}")
+        self._unplace(course_code, from_term)
+        self._place(course_code, to_term)
+        affected = self._affected(course_code, from_term) | self._affected(course_code, to_term)
+        return self._result(affected, [(course_code, from_term)])
+
+    # --- State ---
+
+    def _place(self, course_code: str, term_code: str) -> None:
+        """Record a placement (a course may appear in a term only once)."""
+        term_ordinal(term_code)  # reject malformed term codes before changing anything
+        courses = self.planned.setdefault(term_code, [])
+        if course_code in courses:
+            raise ValueError(f"{course_code} is already planned in term {term_code}")
+        courses.append(course_code)
+        self.placement_counts[course_code] += 1
+        self.course_terms.setdefault(course_code, Counter())[term_code] += 1
+        self.placed_courses.add(course_code)
+        if self.degree_audit is not None:
+            self.degree_audit.add(course_code)
+
+    def _unplace(self, course_code: str, term_code: str) -> None:
+        """Drop a placement and its report."""
+        courses = self.planned.get(term_code, [])
+        if course_code not in courses:
+            raise ValueError(f"{course_code} is not planned in term {term_code}")
+        courses.remove(course_code)
+
+        self.placement_counts[course_code] -= 1
+        terms = self.course_terms[course_code]
+        terms[term_code] -= 1
+        if not terms[term_code]:
+            del terms[term_code]
+        if not self.placement_counts[course_code]:
+            del self.placement_counts[course_code]
+            del self.course_terms[course_code]
+            self.placed_courses.discard(course_code)
+
+        self.reports.pop((course_code, term_code), None)
+        self.invalid.discard((course_code, term_code))
+        if self.degree_audit is not None:
+            self.degree_audit.remove(course_code)
+
+    def _placements(self) -> List[Placement]:
+        """Every placement, in term order."""
+        return [(course_code, term_code)
+                for term_code in sorted(self.planned, key=term_ordinal)
+                for course_code in self.planned[term_code]]
+
+    def _placements_of(self, course_codes) -> Set[Placement]:
+        """Current placements of any of the given courses."""
+        return {(course_code, term_code)
+                for course_code in course_codes
+                for term_code in self.course_terms.get(course_code, ())}
+
+    def _affected(self, course_code: str, term_code: str) -> Set[Placement]:
+        """Placements whose report can change when course_code enters or leaves term_code."""
+        graph = self.requirement_graph
+        related = (graph.courses_requiring(course_code) | graph.courses_excluding(course_code)
+                   | graph.prerequisites.get(course_code, frozenset())
+                   | graph.antirequisites.get(course_code, frozenset())) & self.placed_courses
+        affected = self._placements_of(related | {course_code})
+        affected.update((code, term_code) for code in self.planned.get(term_code, ()))
+        return affected
+
+    # --- Validation ---
+
+    def _validate(self, course_code: str, term_code: str) -> Dict[str, Any]:
+        """Report for one placement, checked against the rest of the plan."""
+        others = self.placed_courses
+        if self.placement_counts[course_code] == 1 and \
+                course_code in self.requirement_graph.antirequisites.get(course_code, ()):
+            others = self.placed_courses - {course_code}
+        report = self.course_validator._validate_placement(
+            course_code, term_code, _PriorCourses(self.course_terms, term_code), others,
+            self.planned, len(self.planned[term_code]) - 1, self.max_courses_per_term
+        )
+        report['course_code'] = course_code
+        report['term_code'] = term_code
+        return self.complete_report(report, course_code, term_code)
+
+    def _revalidate(self, placements) -> List[Dict[str, Any]]:
+        """Re-check placements; returns the reports that changed."""
+        changed = []
+        for placement in sorted(placements, key=lambda p: (term_ordinal(p[1]), p[0])):
+            report = self._validate(*placement)
+            if self.reports.get(placement) != report:
+                self.reports[placement] = report
+                changed.append(report)
+            if report['valid']:
+                self.invalid.discard(placement)
+            else:
+                self.invalid.add(placement)
+        return changed
+
+    def _result(self, affected: Set[Placement], removed: List[Placement]) -> Dict[str, Any]:
+        """Delta response: changed reports, removed placements and overall validity."""
+        changed = self._revalidate(affected)
+        return {
+            'valid': self.valid,
+            'changed': changed,
+            'removed': [{'course_code': course_code, 'term_code': term_code} for course_code, term_code in removed],
+            'audit': self._audit(),
+        }
+
+    def _audit(self) -> Optional[Dict[str, Any]]:
+        """Program-requirement audit of the current plan, or None without a DegreeAudit."""
+        return self.degree_audit.report() if self.degree_audit is not None else None
+
+
+class PlanSessionStore:
+    """
+    Thread-safe session registry with TTL eviction.
+
+    Sessions are kept in least-recently-used order, so expired ones are always at the
+    front and each sweep stops at the first live session.
+    """
+
+    def __init__(self, ttl_seconds: float = 1800, max_sessions: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, Tuple[float, PlanSession]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, session: PlanSession) -> str:
+        """Register a session and return its id."""
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self._evict_expired()
+            self._sessions[session_id] = (time.monotonic(), session)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session_id
+
+    def get(self, session_id: str) -> Optional[PlanSession]:
+        """A live session (refreshing its expiry), or None if unknown or expired."""
+        with self._lock:
+            self._evict_expired()
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            self._sessions[session_id] = (time.monotonic(), entry[1])
+            self._sessions.move_to_end(session_id)
+            return entry[1]
+
+    def delete(self, session_id: str) -> bool:
+        """Forget a session; returns whether it existed."""
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _evict_expired(self) -> None:
+        """Drop sessions unused for longer than the TTL (caller holds the lock)."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._sessions:
+            last_used, _ = next(iter(self._sessions.values()))
+            if last_used > cutoff:
+                break
+            self._sessions.popitem(last=False)
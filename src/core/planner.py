@@ -13,12 +13,31 @@ Usage:
 import json
 import os
 import re
-from typing import List, Dict, Any, Optional, Tuple
+from typing import AbstractSet, Collection, List, Dict, Any, Iterable, Optional, Tuple
 from dataclasses import dataclass, asdict
-from collections import defaultdict
+from collections import ChainMap, Counter, defaultdict
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 import itertools
+import threading
+
+import numpy as np
+
 from .requirements_formatter import RequirementsFormatter
+from .catalog_snapshot import CatalogSnapshot, CatalogSnapshotWriter, LazyRecordMap, source_fingerprint
+from .requirement_graph import RequirementGraph
+from .plan_cache import PlanCache
+from .plan_session import PlanSession, PlanSessionStore
+from .scheduler import PlanObjective, PlanScheduler, SchedulingProblem
+from .degree_audit import DegreeAudit, DegreeRules, audit_course_sets
+from .requirement_roles import RequirementRoleIndex
+from .search_index import CourseSearchIndex
+from .autocomplete import CourseAutocomplete
+from .similarity import CourseSimilarityIndex
+from ..utils.term_helpers import TermSequenceManager, term_name, term_ordinal, term_ordinals, term_sequence
+from .availability import (AvailabilityMatrix, OfferingPredictionTable, STATUS_LABELS,
+                           CONFIRMED, NOT_OFFERED)
 
 # --- Path Configuration ---
 # Get the absolute path to the project's root directory
@@ -31,6 +50,28 @@ except NameError:
     PROJECT_ROOT = Path('.').resolve()
 
 DATA_DIR = PROJECT_ROOT / "data"
+CATALOG_SNAPSHOT_FILE = DATA_DIR / "course_catalog.snapshot"
+# How many years past the newest term file offering predictions are precomputed for
+PREDICTION_YEARS_AHEAD = 5
+# Maximum number of generated plans kept by SYDECoursePlanner.plan_cache
+PLAN_CACHE_SIZE = 256
+# Schedule windows (start_term, semesters) pre-built for every program/specialization by
+# warm_plan_cache, in addition to the upcoming terms; '1249'/3 is what requirements_display plans
+PLAN_CACHE_WARMUP_WINDOWS = (("1249", 3),)
+# Plan sessions unused for this long are discarded
+PLAN_SESSION_TTL_SECONDS = 30 * 60
+# Default and largest search time for auto_plan, in seconds
+AUTO_PLAN_TIME_BUDGET_SECONDS = 0.5
+AUTO_PLAN_MAX_TIME_BUDGET_SECONDS = 5.0
+# Partial plans kept per term by plan_alternatives' beam search, and the most plans it returns
+PLAN_ALTERNATIVES_BEAM_WIDTH = 32
+PLAN_ALTERNATIVES_MAX = 10
+# Pool categories plan_courses reorders by relevance to a student's interests/completed courses
+PROFILE_RANKED_CATEGORIES = ('specified_elective', 'general_elective')
+# Weight of the completed courses' centroid against the interests text in a profile vector
+PROFILE_COMPLETED_COURSES_WEIGHT = 0.5
+# Course codes as students type them in a profile ("SYDE600", "syde 660a")
+PROFILE_COURSE_CODE_PATTERN = re.compile(r'\s*([A-Za-z]{2,6})\s*(\d{3}[A-Za-z]?)\s*')
 
 # --- Data Classes ---
 @dataclass
@@ -51,6 +92,13 @@ class Course:
     def course_code(self) -> str:
         return f"{self.subject_code} {self.catalog_number}"
 
+
+def course_record(course: Course) -> Dict[str, Any]:
+    """A course's fields plus its course_code as a new dict (a flat copy, far cheaper than asdict)."""
+    record = dict(vars(course))
+    record['course_code'] = course.course_code
+    return record
+
 @dataclass
 class CourseRequirement:
     """Course requirement structure"""
@@ -140,6 +188,30 @@ class PrerequisiteParser:
             return [f"{subj} {num}" for subj, num in course_codes]
         return []
 
+class FrozenDict(dict):
+    """Read-only dict; still a dict, so it serializes with json/jsonify as usual."""
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only")
+    
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists into FrozenDicts/tuples."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+# Process-wide parse results, keyed by the requirements text itself (dict hashing);
+# values are frozen so every caller can share them.
+_PARSED_REQUIREMENTS_CACHE: Dict[Optional[str], FrozenDict] = {}
+
 class EnhancedPrerequisiteParser:
     """Enhanced parser for prerequisite and antirequisite information from course requirements."""
     
@@ -155,9 +227,29 @@ class EnhancedPrerequisiteParser:
         """
         Parse course requirements description into structured format.
         
+        Each distinct text is parsed once per process; the result is shared and read-only
+        (FrozenDict with tuples instead of lists).
+        
         Returns:
             Dict with 'prerequisites', 'antirequisites', 'corequisites', 'level_requirements', etc.
         """
+        parsed = _PARSED_REQUIREMENTS_CACHE.get(requirements_description)
+        if parsed is None:
+            parsed = freeze(self._parse_requirements_uncached(requirements_description))
+            _PARSED_REQUIREMENTS_CACHE[requirements_description] = parsed
+        return parsed
+    
+    def warm_cache(self, requirements_descriptions: Iterable[Optional[str]]) -> int:
+        """Parse any texts not cached yet; returns how many were parsed."""
+        parsed_count = 0
+        for requirements_description in requirements_descriptions:
+            if requirements_description not in _PARSED_REQUIREMENTS_CACHE:
+                self.parse_requirements(requirements_description)
+                parsed_count += 1
+        return parsed_count
+    
+    def _parse_requirements_uncached(self, requirements_description: str) -> Dict[str, Any]:
+        """Run the regex passes for one requirements text."""
         if not requirements_description:
             return {
                 'prerequisites': [],
@@ -346,54 +438,204 @@ PROGRAM_SUBJECT_MAPPING = {
     "Management Science and Engineering": ["MSE", "MSCI"]
 }
 
-class EngineeringCourseLoader:
-    """Load and manage engineering course data for multiple programs with predictive capabilities."""
+@dataclass(frozen=True)
+class ProgramCatalogView:
+    """Read-only view of one program's subjects over the shared CourseCatalog store."""
+    program_name: str
+    subject_codes: Tuple[str, ...]
+    courses: Mapping[str, Course]
+    course_availability: Mapping[str, List[Dict[str, str]]]
+    term_files: Tuple[str, ...]
+    course_count: int
+
+class CourseCatalog:
+    """
+    Shared, resident store of course data indexed by subject.
+
+    Each subject is read (from the snapshot or its JSON files) at most once per
+    process; program views chain the per-subject dictionaries together, so building
+    or switching between them does no I/O.
+    """
     
-    def __init__(self, base_course_data_dir: Path = DATA_DIR / "course_data_filtered"):
+    def __init__(self, base_course_data_dir: Path = DATA_DIR / "course_data_filtered",
+                 snapshot_path: Optional[Path] = CATALOG_SNAPSHOT_FILE):
         self.base_course_data_dir = base_course_data_dir
-        self.current_program = None
-        self.current_subject_codes = []
-        self.courses: Dict[str, Course] = {}
-        self.course_availability: Dict[str, List[Dict[str, str]]] = defaultdict(list)
-        self.prerequisite_parser = PrerequisiteParser()
-        self.all_term_files = []
+        # Binary snapshot of the catalog (see catalog_snapshot.py); None means read the JSON files
+        self.snapshot = CatalogSnapshot.open_if_fresh(snapshot_path, base_course_data_dir) if snapshot_path else None
+        self.subject_courses: Dict[str, Dict[str, Course]] = {}
+        self.subject_availability: Dict[str, Dict[str, List[Dict[str, str]]]] = {}
+        self.subject_term_files: Dict[str, List[str]] = {}
+        self._program_views: Dict[str, ProgramCatalogView] = {}
+        self._load_lock = threading.Lock()
+        self.requirements_parser = EnhancedPrerequisiteParser()
+        self.requirement_graph = RequirementGraph()
+        self.availability_matrix = AvailabilityMatrix({})
+        self.offering_predictions = OfferingPredictionTable(self.availability_matrix, PREDICTION_YEARS_AHEAD)
+        self._search_index: Optional[CourseSearchIndex] = None
+        self._autocomplete: Optional[CourseAutocomplete] = None
+        self._similarity: Optional[CourseSimilarityIndex] = None
+        self._version: Optional[str] = None
 
-    def load_courses_for_program(self, program_name: str) -> None:
-        """Load courses for a specific engineering program."""
+    @property
+    def version(self) -> str:
+        """Fingerprint of the course data this catalog serves (snapshot header, or the term files' stats)."""
+        if self._version is None:
+            fingerprint = self.snapshot.fingerprint if self.snapshot is not None else source_fingerprint(self.base_course_data_dir)
+            self._version = fingerprint.hex()
+        return self._version
+
+    @property
+    def search_index(self) -> CourseSearchIndex:
+        """Search index over every subject in the catalog, built on first use."""
+        if self._search_index is None:
+            with self._load_lock:
+                if self._search_index is None:
+                    self._search_index = CourseSearchIndex(self._catalog_documents())
+        return self._search_index
+
+    @property
+    def autocomplete(self) -> CourseAutocomplete:
+        """Typeahead prefix index over the search index's courses, built on first use."""
+        if self._autocomplete is None:
+            search_index = self.search_index
+            with self._load_lock:
+                if self._autocomplete is None:
+                    self._autocomplete = CourseAutocomplete(zip(search_index.course_codes, search_index.titles))
+        return self._autocomplete
+
+    @property
+    def similarity(self) -> CourseSimilarityIndex:
+        """TF-IDF similarity index over every subject in the catalog, built on first use."""
+        if self._similarity is None:
+            with self._load_lock:
+                if self._similarity is None:
+                    self._similarity = CourseSimilarityIndex(self._catalog_documents())
+        return self._similarity
+
+    def _catalog_documents(self) -> Iterable[Tuple[str, Dict[str, Any], List[str]]]:
+        """(course code, Course fields, offered term codes) for every course of every subject."""
+        if self.snapshot is not None:
+            for subject_code in self.snapshot.subjects:
+                for record_index in self.snapshot.subject_records(subject_code):
+                    yield (self.snapshot.course_code(record_index), self.snapshot.course_fields(record_index),
+                           [offering["term_code"] for offering in self.snapshot.availability(record_index)])
+            return
+        if not self.base_course_data_dir.exists():
+            return
+        for subject_dir in sorted(d for d in self.base_course_data_dir.iterdir() if d.is_dir()):
+            courses, availability = self._load_subject_courses(subject_dir.name, subject_dir)
+            for course_code, course in courses.items():
+                yield course_code, asdict(course), [offering["term_code"] for offering in availability[course_code]]
+
+    def ensure_subjects(self, subject_codes: List[str]) -> None:
+        """Load any of the given subjects that are not resident yet."""
+        missing = [code for code in subject_codes if code not in self.subject_courses]
+        if not missing:
+            return
+        
+        with self._load_lock:
+            loaded: Dict[str, Mapping[str, Course]] = {}
+            for subject_code in missing:
+                if subject_code in self.subject_courses or subject_code in loaded:
+                    continue
+                subject_dir = self.base_course_data_dir / subject_code
+                if self.snapshot is not None and subject_code in self.snapshot.subjects:
+                    courses, availability = self._load_subject_from_snapshot(subject_code)
+                elif subject_dir.exists():
+                    courses, availability = self._load_subject_courses(subject_code, subject_dir)
+                else:
+                    print(f"Warning: Subject directory not found: {subject_dir}")
+                    courses, availability = {}, {}
+                
+                # Parse every distinct requirements text up front so requests only hit the cache,
+                # then index the subject's prerequisite/antirequisite edges
+                requirements_texts = self._subject_requirements_texts(subject_code, courses)
+                self.requirements_parser.warm_cache(set(requirements_texts.values()))
+                self.requirement_graph.add_courses(
+                    (course_code, self.requirements_parser.parse_requirements(text))
+                    for course_code, text in requirements_texts.items()
+                )
+                
+                self.subject_term_files[subject_code] = sorted([f.stem for f in subject_dir.glob("*.json")], reverse=True)
+                self.subject_availability[subject_code] = availability
+                loaded[subject_code] = courses
+            
+            # Rebuilt once per batch over every resident subject, then swapped in whole
+            self.availability_matrix = AvailabilityMatrix(ChainMap(*self.subject_availability.values()))
+            self.offering_predictions = OfferingPredictionTable(self.availability_matrix, PREDICTION_YEARS_AHEAD)
+            # Published last: other threads treat a subject as loaded once its courses exist
+            self.subject_courses.update(loaded)
+
+    def materialize(self) -> int:
+        """
+        Decode every lazily loaded course and availability record of the resident subjects
+        (e.g., before forking workers, so they share the objects instead of each building them).
+        
+        Returns:
+            Number of resident courses
+        """
+        count = 0
+        for subject_code, courses in self.subject_courses.items():
+            availability = self.subject_availability[subject_code]
+            for course_code in courses:
+                courses[course_code]
+                availability.get(course_code)
+                count += 1
+        return count
+
+    def program_view(self, program_name: str) -> ProgramCatalogView:
+        """Get the (cached) view of a program's courses, loading its subjects on first use."""
+        view = self._program_views.get(program_name)
+        if view is not None:
+            return view
+        
         if program_name not in PROGRAM_SUBJECT_MAPPING:
             raise ValueError(f"Program '{program_name}' not supported. Available programs: {list(PROGRAM_SUBJECT_MAPPING.keys())}")
         
         subject_codes = PROGRAM_SUBJECT_MAPPING[program_name]
-        
-        # Clear existing data if switching programs
-        if self.current_program != program_name:
-            self.courses.clear()
-            self.course_availability.clear()
-            self.current_program = program_name
-            self.current_subject_codes = subject_codes
-        
         print(f"Loading courses for {program_name} (Subject codes: {subject_codes})...")
-        
-        # Load courses from all relevant subject directories
-        for subject_code in subject_codes:
-            subject_dir = self.base_course_data_dir / subject_code
-            if not subject_dir.exists():
-                print(f"Warning: Subject directory not found: {subject_dir}")
-                continue
-                
-            self._load_subject_courses(subject_code, subject_dir)
-        
-        # Get all term files from the first subject directory for term sequence
-        if subject_codes:
-            first_subject_dir = self.base_course_data_dir / subject_codes[0]
-            if first_subject_dir.exists():
-                self.all_term_files = sorted([f.stem for f in first_subject_dir.glob("*.json")], reverse=True)
-        
-        print(f"Loaded {len(self.courses)} unique courses for {program_name}")
+        self.ensure_subjects(subject_codes)
+        
+        courses = ChainMap(*(self.subject_courses[code] for code in subject_codes))
+        view = ProgramCatalogView(
+            program_name=program_name,
+            subject_codes=tuple(subject_codes),
+            courses=MappingProxyType(courses),
+            course_availability=MappingProxyType(ChainMap(*(self.subject_availability[code] for code in subject_codes))),
+            # Term sequence comes from the first subject directory
+            term_files=tuple(self.subject_term_files[subject_codes[0]]) if subject_codes else (),
+            course_count=len(courses)
+        )
+        self._program_views[program_name] = view
+        print(f"Loaded {view.course_count} unique courses for {program_name}")
+        return view
 
-    def _load_subject_courses(self, subject_code: str, subject_dir: Path) -> None:
+    def _subject_requirements_texts(self, subject_code: str, courses: Mapping[str, Course]) -> Dict[str, Optional[str]]:
+        """Course code -> requirements text for a subject, read straight from snapshot records when possible."""
+        if isinstance(courses, LazyRecordMap):
+            texts = {}
+            for index in self.snapshot.subject_records(subject_code):
+                texts.setdefault(self.snapshot.course_code(index), self.snapshot.requirements_description(index))
+            return texts
+        return {course_code: course.requirements_description for course_code, course in courses.items()}
+
+    def _load_subject_from_snapshot(self, subject_code: str) -> Tuple[Dict[str, Course], Dict[str, List[Dict[str, str]]]]:
+        """Register a subject's snapshot records; Course objects are built on first access."""
+        courses = LazyRecordMap(lambda index: Course(**self.snapshot.course_fields(index)))
+        availability = LazyRecordMap(self.snapshot.availability)
+        for record_index in self.snapshot.subject_records(subject_code):
+            course_code = self.snapshot.course_code(record_index)
+            courses.add_pending(course_code, record_index)
+            availability.add_pending(course_code, record_index)
+        return courses, availability
+
+    def _load_subject_courses(self, subject_code: str, subject_dir: Path) -> Tuple[Dict[str, Course], Dict[str, List[Dict[str, str]]]]:
         """Load courses for a specific subject."""
-        for json_file in subject_dir.glob("*.json"):
+        courses: Dict[str, Course] = {}
+        course_availability: Dict[str, List[Dict[str, str]]] = defaultdict(list)
+        
+        # Newest term first, so each course keeps its most recent title/description
+        for json_file in sorted(subject_dir.glob("*.json"), reverse=True):
             term_code = json_file.stem
             try:
                 with open(json_file, 'r', encoding='utf-8') as f:
@@ -414,15 +656,65 @@ class EngineeringCourseLoader:
                     )
                     
                     course_code = course.course_code
-                    if course_code not in self.courses:
-                        self.courses[course_code] = course
+                    if course_code not in courses:
+                        courses[course_code] = course
                     
-                    self.course_availability[course_code].append({
+                    course_availability[course_code].append({
                         "term_code": term_code,
                         "term_name": course.term_name
                     })
             except Exception as e:
                 print(f"Error loading {json_file}: {e}")
+        
+        return courses, dict(course_availability)
+
+    def build_snapshot(self, output_path: Path = CATALOG_SNAPSHOT_FILE) -> Dict[str, int]:
+        """Compile every subject under the catalog directory into a binary snapshot."""
+        writer = CatalogSnapshotWriter()
+        subject_dirs = sorted(d for d in self.base_course_data_dir.iterdir() if d.is_dir())
+        total_courses = 0
+        for subject_dir in subject_dirs:
+            # Reuse the JSON loading path so the snapshot holds exactly what it would produce
+            courses, availability = self._load_subject_courses(subject_dir.name, subject_dir)
+            writer.add_subject(subject_dir.name, (
+                (course_code, asdict(course), availability[course_code])
+                for course_code, course in courses.items()
+            ))
+            total_courses += len(courses)
+
+        writer.write(output_path, source_fingerprint(self.base_course_data_dir))
+        return {"subjects": len(subject_dirs), "courses": total_courses}
+
+class EngineeringCourseLoader:
+    """Load and manage engineering course data for multiple programs with predictive capabilities."""
+    
+    def __init__(self, base_course_data_dir: Path = DATA_DIR / "course_data_filtered",
+                 snapshot_path: Optional[Path] = CATALOG_SNAPSHOT_FILE,
+                 catalog: Optional[CourseCatalog] = None):
+        self.base_course_data_dir = base_course_data_dir
+        self.catalog = catalog or CourseCatalog(base_course_data_dir, snapshot_path)
+        self.current_program = None
+        self.current_subject_codes = []
+        self.courses: Mapping[str, Course] = {}
+        self.course_availability: Mapping[str, List[Dict[str, str]]] = {}
+        self.prerequisite_parser = PrerequisiteParser()
+        self.all_term_files = []
+        self.total_courses = 0
+
+    @property
+    def snapshot(self) -> Optional[CatalogSnapshot]:
+        return self.catalog.snapshot
+
+    def load_courses_for_program(self, program_name: str) -> None:
+        """Point the loader at a program's courses in the shared catalog (no I/O once resident)."""
+        view = self.catalog.program_view(program_name)
+        
+        self.current_program = program_name
+        self.current_subject_codes = list(view.subject_codes)
+        self.courses = view.courses
+        self.course_availability = view.course_availability
+        self.all_term_files = list(view.term_files)
+        self.total_courses = view.course_count
 
     def get_course(self, course_code: str) -> Optional[Course]:
         """Get course by course code"""
@@ -432,45 +724,6 @@ class EngineeringCourseLoader:
         """Get all terms when a course was offered"""
         return self.course_availability.get(course_code, [])
 
-    def get_offering_status_for_term(self, course_code: str, term_code: str) -> Dict[str, Any]:
-        """
-        Get offering status for a specific course in a specific term.
-        Returns dictionary with 'is_offered' boolean and 'status' string.
-        """
-        availability = self.course_availability.get(course_code, [])
-        for offering in availability:
-            if offering["term_code"] == term_code:
-                return {"is_offered": True, "status": "Confirmed"}
-        
-        # If not directly offered, try to predict based on historical patterns
-        return self._predict_course_offering(course_code, term_code)
-
-    def _predict_course_offering(self, course_code: str, term_code: str) -> Dict[str, Any]:
-        """Predict if a course will be offered in a given term based on historical patterns."""
-        availability = self.course_availability.get(course_code, [])
-        if not availability:
-            return {"is_offered": False, "status": "No historical data"}
-
-        # Analyze historical offering patterns
-        term_patterns = defaultdict(int)
-        for offering in availability:
-            historical_term = offering["term_code"]
-            if len(historical_term) == 4:  # Format: YYSM where S=season, M=month
-                season_month = historical_term[2:]
-                term_patterns[season_month] += 1
-
-        # Extract season/month from target term
-        if len(term_code) == 4:
-            target_season_month = term_code[2:]
-            if target_season_month in term_patterns:
-                confidence = term_patterns[target_season_month] / len(availability)
-                if confidence >= 0.6:  # 60% confidence threshold
-                    return {"is_offered": True, "status": f"Predicted (Historical: {confidence:.0%})"}
-                else:
-                    return {"is_offered": False, "status": f"Unlikely (Historical: {confidence:.0%})"}
-
-        return {"is_offered": False, "status": "Cannot predict"}
-
     def get_all_courses(self) -> List[Course]:
         """Get all loaded courses"""
         return list(self.courses.values())
@@ -484,7 +737,7 @@ class EngineeringCourseLoader:
         return {
             "program_name": self.current_program,
             "subject_codes": self.current_subject_codes,
-            "total_courses": len(self.courses),
+            "total_courses": self.total_courses,
             "available_terms": self.all_term_files
         }
     
@@ -504,33 +757,55 @@ class EngineeringCourseLoader:
         """Check and predict if a course is offered in a specific term."""
         
         # 1. Check for confirmed offering
-        for offering in self.course_availability.get(course_code, []):
-            if offering["term_code"] == target_term_code:
-                return {"is_offered": True, "status": "Confirmed"}
-
-        # 2. If target term is in the future, try to predict
-        if target_term_code > self.all_term_files[0]:
-            target_year = int(target_term_code[:-1])
-            target_season = target_term_code[-1]
-            
-            # Look at the last 3 years for the same season
-            historical_offerings = []
-            for i in range(1, 4):
-                past_year = str(target_year - i)
-                past_term_code = past_year + target_season
-                if any(o["term_code"] == past_term_code for o in self.course_availability.get(course_code, [])):
-                    historical_offerings.append(True)
-                else:
-                    historical_offerings.append(False)
-            
-            if historical_offerings[0]:
-                return {"is_offered": True, "status": "Predicted (Annual)"}
-            if historical_offerings[1]:
-                return {"is_offered": True, "status": "Predicted (Likely Biennial)"}
-            if any(historical_offerings):
-                 return {"is_offered": True, "status": "Predicted (Sporadic)"}
+        if self.catalog.availability_matrix.is_offered(course_code, target_term_code):
+            return {"is_offered": True, "status": STATUS_LABELS[CONFIRMED]}
+
+        # 2. If target term is in the future, use the precomputed prediction
+        if self._is_future_term(target_term_code):
+            status = self.catalog.offering_predictions.status_of(course_code, target_term_code)
+            if status != NOT_OFFERED:
+                return {"is_offered": True, "status": STATUS_LABELS[status]}
+
+        return {"is_offered": False, "status": STATUS_LABELS[NOT_OFFERED]}
+
+    def _is_future_term(self, term_code: str) -> bool:
+        """True if the term is newer than the latest term file (False for malformed codes)."""
+        if not self.all_term_files:
+            return False
+        try:
+            return term_ordinal(term_code) > term_ordinal(self.all_term_files[0])
+        except ValueError:
+            return False
+
+    def predict_offerings(self, course_codes: List[str], term_codes: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bulk offering status for every (course, term) pair.
+        
+        Returns:
+            (status codes, confidence) arrays of shape (len(course_codes), len(term_codes));
+            codes index availability.STATUS_LABELS, confirmed offerings have confidence 1.
+        """
+        confirmed = self.catalog.availability_matrix.lookup(course_codes, term_codes)
+        status = np.where(confirmed, CONFIRMED, NOT_OFFERED).astype(np.int8)
+        confidence = confirmed.astype(np.float32)
+        
+        future_columns = [column for column, term_code in enumerate(term_codes) if self._is_future_term(term_code)]
+        if future_columns:
+            predicted_status, predicted_confidence = self.catalog.offering_predictions.lookup(
+                course_codes, [term_codes[column] for column in future_columns]
+            )
+            future_confirmed = confirmed[:, future_columns]
+            status[:, future_columns] = np.where(future_confirmed, CONFIRMED, predicted_status)
+            confidence[:, future_columns] = np.where(future_confirmed, 1.0, predicted_confidence)
+        return status, confidence
 
-        return {"is_offered": False, "status": "Not Offered"}
+    def offered_mask(self, course_codes: List[str], term_codes: List[str]) -> np.ndarray:
+        """
+        Vectorized "offered (confirmed or predicted) in any of these terms" for many courses.
+        Agrees with get_offering_status_for_term(...)['is_offered'] for every pair.
+        """
+        status, _ = self.predict_offerings(course_codes, term_codes)
+        return (status != NOT_OFFERED).any(axis=1)
 
 class EngineeringProgramLoader:
     """Load and manage engineering program data using unified format"""
@@ -686,41 +961,93 @@ class SYDEProgramLoader:
         
         return None
 
+DEFAULT_PROGRAM = "Systems Design Engineering"
+
+@dataclass(frozen=True)
+class ProgramContext:
+    """
+    Per-program planning state resolved against the shared catalog.
+    
+    Contexts are built once per program and never modified afterwards, so any number
+    of concurrent requests can use the same context.
+    """
+    program_name: str
+    course_loader: EngineeringCourseLoader
+    course_validator: 'CourseValidator'
+
 class SYDECoursePlanner:
     """Main course planning engine for SYDE students."""
     
     def __init__(self):
-        self.course_loader = EngineeringCourseLoader()
+        self.catalog = CourseCatalog()
+        self.course_loader = EngineeringCourseLoader(catalog=self.catalog)
         self.program_loader = SYDEProgramLoader()
         self.engineering_program_loader = EngineeringProgramLoader()
         self.course_validator = None  # Initialize after course_loader
         self.term_manager = TermSequenceManager()
         self.requirements_formatter = RequirementsFormatter()
+        self.prereq_parser = EnhancedPrerequisiteParser()
+        self._program_contexts: Dict[str, ProgramContext] = {}
+        self._context_lock = threading.Lock()
+        self.plan_cache = PlanCache(PLAN_CACHE_SIZE)
+        self.plan_sessions = PlanSessionStore(PLAN_SESSION_TTL_SECONDS)
         
     def initialize(self) -> None:
         """Initialize the planner by loading data."""
         print("Initializing SYDE Course Planner...")
-        self.course_loader.load_courses_for_program("Systems Design Engineering") # Default to SYDE for now
+        default_context = self.get_program_context(DEFAULT_PROGRAM)  # Default to SYDE for now
         self.program_loader.load_programs()
         self.engineering_program_loader.load_programs()
         
-        # Initialize course validator after course loader
-        self.course_validator = CourseValidator(self.course_loader)
+        # Default-program loader/validator, kept for callers that don't pass a context
+        self.course_loader = default_context.course_loader
+        self.course_validator = default_context.course_validator
+        # Course search, typeahead and similarity cover the whole catalog, so they are indexed once up front
+        print(f"Indexed {len(self.catalog.search_index)} courses for search")
+        print(f"Indexed {len(self.catalog.autocomplete)} courses for autocomplete")
+        print(f"Indexed {len(self.catalog.similarity)} courses for similarity")
         print("Initialization complete!\n")
     
+    def get_program_context(self, program_name: Optional[str] = None) -> ProgramContext:
+        """
+        Get the shared, read-only context for a program (the default program if None).
+        
+        Raises:
+            ValueError: If the program has no subject mapping.
+        """
+        program_name = program_name or DEFAULT_PROGRAM
+        context = self._program_contexts.get(program_name)
+        if context is not None:
+            return context
+        
+        with self._context_lock:
+            context = self._program_contexts.get(program_name)
+            if context is None:
+                course_loader = EngineeringCourseLoader(catalog=self.catalog)
+                course_loader.load_courses_for_program(program_name)
+                context = ProgramContext(
+                    program_name=program_name,
+                    course_loader=course_loader,
+                    course_validator=CourseValidator(course_loader)
+                )
+                self._program_contexts[program_name] = context
+        return context
+    
     def switch_program(self, program_name: str) -> Dict[str, Any]:
-        """Switch to a different engineering program and reload course data."""
+        """
+        Resolve a program's context and report its course data.
+        
+        Shared state is not modified; later requests select the program by passing it
+        explicitly (e.g., 'program' in plan_courses input).
+        """
         try:
             print(f"Switching to program: {program_name}")
-            self.course_loader.load_courses_for_program(program_name)
-            
-            # Reinitialize course validator with new course data
-            self.course_validator = CourseValidator(self.course_loader)
+            context = self.get_program_context(program_name)
             
             return {
                 "success": True,
                 "message": f"Successfully switched to {program_name}",
-                "program_info": self.course_loader.get_current_program_info()
+                "program_info": context.course_loader.get_current_program_info()
             }
         except Exception as e:
             return {
@@ -728,7 +1055,7 @@ class SYDECoursePlanner:
                 "error": f"Failed to switch program: {str(e)}"
             }
     
-    def plan_courses(self, user_input: Dict[str, Any]) -> Dict[str, Any]:
+    def plan_courses(self, user_input: Dict[str, Any], context: Optional[ProgramContext] = None) -> Dict[str, Any]:
         """
         Generates the necessary data for the frontend planning board.
         
@@ -737,37 +1064,144 @@ class SYDECoursePlanner:
                 'degree': 'MEng',
                 'semesters': 3,
                 'specialization': '...',
-                'start_term': '1249' // e.g., Fall 2024
+                'start_term': '1249', // e.g., Fall 2024
+                'interests': ['machine learning', ...], // optional profile
+                'completed_courses': ['SYDE 600', ...] // optional profile, or term code -> courses
             }
+            context: Program context to plan against; resolved from user_input['program'] if None
         
         Returns:
             A dictionary containing the course pool and an empty semester structure.
+            Successful plans are cached (see plan_cache) and shared read-only between callers;
+            with a profile, the elective portions of the pool are ranked by relevance to it
+            (see _rank_pool_for_profile).
         """
+        if context is None:
+            try:
+                context = self.get_program_context(user_input.get('program'))
+            except ValueError as e:
+                return {"error": str(e)}
+        
+        cache_key = self._plan_cache_key(user_input, context)
+        plan = self.plan_cache.get(cache_key) if cache_key is not None else None
+        if plan is None:
+            plan = self._build_plan(user_input, context)
+            if 'error' not in plan:
+                plan = freeze(plan)
+                if cache_key is not None:
+                    self.plan_cache.put(cache_key, plan)
+        
+        # The profile is not part of the cache key: each request ranks its own copy of the shared pool
+        if 'error' not in plan and (user_input.get('interests') or user_input.get('completed_courses')):
+            plan = self._rank_pool_for_profile(plan, user_input, context)
+        return plan
+    
+    def _rank_pool_for_profile(self, plan: Dict[str, Any], user_input: Dict[str, Any],
+                               context: ProgramContext) -> Dict[str, Any]:
+        """
+        Copy of a (shared, frozen) plan with the elective portions of its course pool ordered
+        by relevance to the request's profile.
         
-        # Check if using new program format or legacy format
-        if 'program' in user_input:
-            # New format: use engineering program loader
-            program = self.engineering_program_loader.get_program(user_input['program'])
-            if not program:
-                return {"error": "Program not found"}
-            
-            # Parse requirements for new format
-            requirements = self._parse_engineering_program_requirements(program, user_input)
-        else:
-            # Legacy format: use SYDE program loader
-            program = self.program_loader.get_program(
-                user_input['degree'], 
-                user_input.get('specialization')
-            )
-            
-            if not program:
-                available_programs = [p['program_name'] for p in self.program_loader.programs]
-                return {
-                    'error': f"Program not found for degree: {user_input['degree']}, specialization: {user_input.get('specialization')}",
-                    'available_programs': available_programs
-                }
-            
-            requirements = self._parse_program_requirements(program, user_input)
+        The profile vector combines the TF-IDF vector of the interests with the centroid of
+        the completed courses; every elective is scored in one sparse matrix-vector product.
+        Electives keep their place among the pool's groups and are ordered within their group
+        by score, with completed courses last. Ranked items gain a 'profile_score'.
+        """
+        interests = user_input.get('interests') or []
+        if isinstance(interests, str):
+            interests = [interests]
+        completed = self._profile_course_codes(user_input.get('completed_courses'))
+        
+        similarity = context.course_loader.catalog.similarity
+        vector = similarity.text_vector(' '.join(interests))
+        if completed:
+            vector = vector + PROFILE_COMPLETED_COURSES_WEIGHT * similarity.centroid(completed)
+        vector = vector / max(float(np.linalg.norm(vector)), 1e-12)
+        
+        pool = plan['course_pool']
+        ranked = [i for i, item in enumerate(pool) if item['category'] in PROFILE_RANKED_CATEGORIES]
+        scores = similarity.scores([pool[i]['course']['course_code'] for i in ranked], vector).tolist()
+        
+        items = list(pool)
+        rank_scores = [0.0] * len(pool)
+        for i, score in zip(ranked, scores):
+            items[i] = dict(pool[i], profile_score=round(score, 4))
+            rank_scores[i] = -1.0 if pool[i]['course']['course_code'] in completed else score
+        groups = [self._course_sort_key(item)[0] for item in pool]
+        order = sorted(range(len(pool)), key=lambda i: (groups[i], -rank_scores[i], i))
+        
+        return dict(plan, course_pool=[items[i] for i in order],
+                    profile={'interests': list(interests), 'completed_courses': sorted(completed)})
+    
+    def _profile_course_codes(self, completed_courses: Any) -> AbstractSet[str]:
+        """Normalized codes of a profile's completed courses (a list, or term code -> list)."""
+        if isinstance(completed_courses, Mapping):
+            completed_courses = [code for codes in completed_courses.values() for code in codes]
+        codes = set()
+        for course_code in completed_courses or []:
+            match = PROFILE_COURSE_CODE_PATTERN.fullmatch(str(course_code))
+            if match:
+                codes.add(f"{match.group(1).upper()} {match.group(2).upper()}")
+        return codes
+    
+    def _plan_cache_key(self, user_input: Dict[str, Any], context: ProgramContext) -> Optional[Tuple]:
+        """
+        Cache key for a planning request: everything the plan depends on, plus the catalog
+        version so plans built from other course data never match. None if uncacheable.
+        """
+        key = (
+            context.program_name,
+            user_input.get('program'),
+            user_input.get('degree'),
+            # A missing specialization and an explicit None take different code paths
+            user_input['specialization'] if 'specialization' in user_input else (),
+            str(user_input.get('start_term')),
+            user_input.get('semesters'),
+            self.catalog.version,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def warm_plan_cache(self, windows: Optional[Iterable[Tuple[str, int]]] = None) -> int:
+        """
+        Pre-build plans for every program and specialization over common schedule windows.
+        
+        Args:
+            windows: (start_term, semesters) pairs; defaults to PLAN_CACHE_WARMUP_WINDOWS plus
+                three-semester plans starting in each of the next three terms after the newest data
+        
+        Returns:
+            Number of plans built
+        """
+        if windows is None:
+            windows = list(PLAN_CACHE_WARMUP_WINDOWS)
+            for start_term in self.catalog.offering_predictions.term_codes[:3]:
+                windows.append((start_term, 3))
+        windows = list(windows)
+        
+        built = 0
+        for program_name in self.engineering_program_loader.get_all_programs():
+            if program_name not in PROGRAM_SUBJECT_MAPPING:
+                continue
+            specializations = [None] + self.engineering_program_loader.get_specializations(program_name)
+            for specialization in specializations:
+                for start_term, semesters in windows:
+                    user_input = {'program': program_name, 'start_term': start_term, 'semesters': semesters}
+                    if specialization is not None:
+                        user_input['specialization'] = specialization
+                    plan = self.plan_courses(user_input)
+                    if 'error' not in plan:
+                        built += 1
+        return built
+    
+    def _build_plan(self, user_input: Dict[str, Any], context: ProgramContext) -> Dict[str, Any]:
+        """Build the plan for plan_courses (uncached)."""
+        program, requirements = self._program_requirements(user_input)
+        if program is None:
+            return requirements
         
         # Generate the user's study schedule
         user_schedule = self._generate_semester_schedule_codes(
@@ -775,7 +1209,7 @@ class SYDECoursePlanner:
             user_input['semesters']
         )
         
-        course_pool = self._build_course_pool(requirements, user_schedule)
+        course_pool = self._build_course_pool(requirements, user_schedule, context.course_loader)
         
         # Generate the semester structure for the frontend
         semester_structure = self._generate_semester_structure(
@@ -802,8 +1236,40 @@ class SYDECoursePlanner:
         
         return plan
     
+    def _program_requirements(self, user_input: Dict[str, Any]) -> Tuple[Optional[Dict], Dict[str, Any]]:
+        """
+        Find the requested program and parse its requirements.
+        
+        Returns:
+            (program, requirements), or (None, {'error', ...}) if the program is not found
+        """
+        # Check if using new program format or legacy format
+        if 'program' in user_input:
+            # New format: use engineering program loader
+            program = self.engineering_program_loader.get_program(user_input['program'])
+            if not program:
+                return None, {"error": "Program not found"}
+            
+            # Parse requirements for new format
+            return program, self._parse_engineering_program_requirements(program, user_input)
+        
+        # Legacy format: use SYDE program loader
+        program = self.program_loader.get_program(
+            user_input['degree'], 
+            user_input.get('specialization')
+        )
+        
+        if not program:
+            available_programs = [p['program_name'] for p in self.program_loader.programs]
+            return None, {
+                'error': f"Program not found for degree: {user_input['degree']}, specialization: {user_input.get('specialization')}",
+                'available_programs': available_programs
+            }
+        
+        return program, self._parse_program_requirements(program, user_input)
+    
     def validate_move(self, course_code: str, term_code: str, current_plan: Dict[str, List[str]] = None, 
-                     program_context: Dict[str, Any] = None) -> Dict[str, Any]:
+                     program_context: Dict[str, Any] = None, context: Optional[ProgramContext] = None) -> Dict[str, Any]:
         """
         Validate if a course can be moved to a specific term.
         
@@ -812,6 +1278,7 @@ class SYDECoursePlanner:
             term_code: Target term code (e.g., "1255")
             current_plan: Dict mapping term_code -> list of course codes in current plan
             program_context: Dict with program and specialization info for validating program requirements
+            context: Program context to validate against; resolved from program_context['program'] if None
             
         Returns:
             Validation result with success status and detailed information
@@ -822,29 +1289,367 @@ class SYDECoursePlanner:
                 'error': 'Course validator not initialized'
             }
         
+        if context is None:
+            try:
+                context = self.get_program_context((program_context or {}).get('program'))
+            except ValueError as e:
+                return {
+                    'valid': False,
+                    'error': str(e)
+                }
+        
         # For validation, we need to properly distinguish between completed and planned courses
         # In this context, current_plan contains the courses currently placed in semesters
         # We'll treat all courses as planned since this is a planning tool
         planned_courses = current_plan or {}
         completed_courses = {}  # In a real system, this would contain actually completed courses
         
-        validation_result = self.course_validator.validate_course_placement(
+        validation_result = context.course_validator.validate_course_placement(
             course_code=course_code,
             target_term=term_code,
             completed_courses=completed_courses,
             planned_courses=planned_courses
         )
         
+        return self._complete_validation(validation_result, course_code, term_code, program_context, context)
+    
+    def validate_plan(self, current_plan: Dict[str, List[str]], program_context: Dict[str, Any] = None,
+                      context: Optional[ProgramContext] = None) -> Dict[str, Any]:
+        """
+        Validate every course in a plan in one pass (see CourseValidator.validate_plan).
+        
+        Args:
+            current_plan: Dict mapping term_code -> list of course codes in the plan
+            program_context: Dict with program and specialization info for validating program requirements
+            context: Program context to validate against; resolved from program_context['program'] if None
+            
+        Returns:
+            {'valid': all placements valid, 'reports': one validate_move-style result per course}
+        """
+        if not self.course_validator:
+            return {
+                'valid': False,
+                'error': 'Course validator not initialized'
+            }
+        
+        if context is None:
+            try:
+                context = self.get_program_context((program_context or {}).get('program'))
+            except ValueError as e:
+                return {
+                    'valid': False,
+                    'error': str(e)
+                }
+        
+        reports = context.course_validator.validate_plan(current_plan or {})
+        for report in reports:
+            self._complete_validation(report, report['course_code'], report['term_code'], program_context, context)
+        
+        return {
+            'valid': all(report['valid'] for report in reports),
+            'reports': reports
+        }
+    
+    def drop_targets(self, user_input: Dict[str, Any], current_plan: Dict[str, List[str]] = None,
+                     context: Optional[ProgramContext] = None) -> Dict[str, Any]:
+        """
+        Valid drop terms for every course in a plan's pool (see CourseValidator.drop_targets).
+        
+        Args:
+            user_input: Planning input as for plan_courses (program, specialization, start_term, semesters)
+            current_plan: Dict mapping term_code -> list of course codes currently on the board
+            context: Program context to plan against; resolved from user_input['program'] if None
+            
+        Returns:
+            {'terms': board term codes, 'courses': {course_code: {'valid_terms', 'blocked'}}}
+            where each term agrees with validate_move for moving that course there.
+        """
+        if context is None:
+            try:
+                context = self.get_program_context(user_input.get('program'))
+            except ValueError as e:
+                return {"error": str(e)}
+        
+        plan = self.plan_courses(user_input, context)
+        if 'error' in plan:
+            return plan
+        
+        course_codes = [item['course']['course_code'] for item in plan['course_pool']]
+        term_codes = [semester['term_code'] for semester in plan['semester_structure']]
+        targets = context.course_validator.drop_targets(course_codes, term_codes, current_plan or {})
+        
+        # Program requirement checks don't depend on the term; they only block otherwise valid terms
+        program_context = self._board_program_context(user_input)
+        for course_code, target in targets.items():
+            program_validation = self._validate_program_requirements(course_code, program_context)
+            if not program_validation['valid'] and target['valid_terms']:
+                for term_code in target['valid_terms']:
+                    target['blocked'][term_code] = program_validation['issues'][0]
+                target['valid_terms'] = []
+        
+        return {
+            'terms': term_codes,
+            'courses': targets
+        }
+    
+    def auto_plan(self, user_input: Dict[str, Any], completed_courses: Dict[str, List[str]] = None,
+                  time_budget: Optional[float] = None, context: Optional[ProgramContext] = None) -> Dict[str, Any]:
+        """
+        Fill the plan's board automatically (see scheduler.py).
+        
+        Args:
+            user_input: Planning input as for plan_courses (program, specialization, start_term, semesters)
+            completed_courses: Dict mapping term_code -> list of completed course codes
+            time_budget: Search time in seconds (default AUTO_PLAN_TIME_BUDGET_SECONDS, at most
+                AUTO_PLAN_MAX_TIME_BUDGET_SECONDS)
+            context: Program context to plan against; resolved from user_input['program'] if None
+            
+        Returns:
+            {'complete', 'valid', 'current_plan', 'semester_structure', 'unmet', 'score', 'search'}
+            where 'valid' confirms every placement with CourseValidator.validate_plan
+        """
+        if context is None:
+            try:
+                context = self.get_program_context(user_input.get('program'))
+            except ValueError as e:
+                return {"error": str(e)}
+        
+        plan = self.plan_courses(user_input, context)
+        if 'error' in plan:
+            return plan
+        
+        problem = self._scheduling_problem(plan, user_input, completed_courses, context)
+        result = PlanScheduler(context.course_validator, self._search_time_budget(time_budget)).schedule(problem)
+        
+        current_plan = result.pop('plan')
+        reports = context.course_validator.validate_plan(current_plan, completed_courses or {})
+        result['valid'] = all(report['valid'] for report in reports)
+        result['current_plan'] = current_plan
+        result['semester_structure'] = [dict(semester, courses=list(current_plan[semester['term_code']]))
+                                        for semester in plan['semester_structure']]
+        return result
+    
+    def plan_alternatives(self, user_input: Dict[str, Any], k: int = 3, objective: Optional[PlanObjective] = None,
+                          completed_courses: Dict[str, List[str]] = None, time_budget: Optional[float] = None,
+                          context: Optional[ProgramContext] = None) -> Dict[str, Any]:
+        """
+        The k best distinct plans for the board under a ranking objective (see PlanScheduler.alternatives).
+        
+        Args:
+            user_input: Planning input as for plan_courses (program, specialization, start_term, semesters)
+            k: Number of plans (at most PLAN_ALTERNATIVES_MAX)
+            objective: Ranking weights and preferred courses; PlanObjective defaults if None
+            completed_courses: Dict mapping term_code -> list of completed course codes
+            time_budget: Search time in seconds (as for auto_plan)
+            context: Program context to plan against; resolved from user_input['program'] if None
+            
+        Returns:
+            {'plans': [{'current_plan', 'semester_structure', 'score', 'metrics', 'valid'}, ...],
+             'search': {...}}, best plan first
+        """
+        if context is None:
+            try:
+                context = self.get_program_context(user_input.get('program'))
+            except ValueError as e:
+                return {"error": str(e)}
+        
+        plan = self.plan_courses(user_input, context)
+        if 'error' in plan:
+            return plan
+        
+        problem = self._scheduling_problem(plan, user_input, completed_courses, context)
+        scheduler = PlanScheduler(context.course_validator, self._search_time_budget(time_budget))
+        result = scheduler.alternatives(problem, max(1, min(k, PLAN_ALTERNATIVES_MAX)), objective,
+                                        PLAN_ALTERNATIVES_BEAM_WIDTH)
+        
+        plans = []
+        for alternative in result['plans']:
+            current_plan = alternative['plan']
+            reports = context.course_validator.validate_plan(current_plan, completed_courses or {})
+            plans.append({
+                'current_plan': current_plan,
+                'semester_structure': [dict(semester, courses=list(current_plan[semester['term_code']]))
+                                       for semester in plan['semester_structure']],
+                'score': alternative['score'],
+                'metrics': alternative['metrics'],
+                'valid': all(report['valid'] for report in reports),
+            })
+        return {'plans': plans, 'search': result['search']}
+    
+    def _search_time_budget(self, time_budget: Optional[float]) -> float:
+        """Requested search time clamped to [0, AUTO_PLAN_MAX_TIME_BUDGET_SECONDS] (default AUTO_PLAN_TIME_BUDGET_SECONDS)."""
+        if time_budget is None:
+            return AUTO_PLAN_TIME_BUDGET_SECONDS
+        return min(max(time_budget, 0.0), AUTO_PLAN_MAX_TIME_BUDGET_SECONDS)
+    
+    def _scheduling_problem(self, plan: Dict[str, Any], user_input: Dict[str, Any],
+                            completed_courses: Optional[Dict[str, List[str]]],
+                            context: ProgramContext) -> SchedulingProblem:
+        """Compile a plan's requirements, pool and board into a SchedulingProblem."""
+        program_context = self._board_program_context(user_input)
+        course_pool = [item for item in plan['course_pool']
+                       if self._validate_program_requirements(item['course']['course_code'], program_context)['valid']]
+        return SchedulingProblem(
+            context.course_validator, plan['requirements_summary'], course_pool,
+            [semester['term_code'] for semester in plan['semester_structure']],
+            completed_courses, PROGRAM_SUBJECT_MAPPING.get(context.program_name, ())
+        )
+    
+    def _board_program_context(self, user_input: Dict[str, Any]) -> Dict[str, Any]:
+        """Program context for program requirement checks of a planning request."""
+        specialization = user_input.get('specialization')
+        return {
+            'program': user_input.get('program'),
+            'specialization': specialization.replace('_', ' ') if specialization else None
+        }
+    
+    def audit_plan(self, user_input: Dict[str, Any], current_plan: Dict[str, List[str]],
+                   completed_courses: Dict[str, List[str]] = None,
+                   context: Optional[ProgramContext] = None) -> Dict[str, Any]:
+        """
+        Check a plan against the program's requirements (see degree_audit.py).
+        
+        Args:
+            user_input: Program selection as for plan_courses (program, specialization)
+            current_plan: Dict mapping term_code -> list of planned course codes
+            completed_courses: Dict mapping term_code -> list of completed course codes
+            context: Program context; resolved from user_input['program'] if None
+            
+        Returns:
+            DegreeAudit.report() of the completed and planned courses, or {'error'}
+        """
+        result = self.audit_plans(user_input, [{'current_plan': current_plan,
+                                                'completed_courses': completed_courses}], context)
+        return result if 'error' in result else result['reports'][0]
+    
+    def audit_plans(self, user_input: Dict[str, Any], plans: List[Dict[str, Any]],
+                    context: Optional[ProgramContext] = None) -> Dict[str, Any]:
+        """
+        Audit many plans against one program's requirements (e.g. a cohort), compiling them once.
+        
+        Args:
+            user_input: Program selection as for plan_courses (program, specialization)
+            plans: [{'current_plan': {...}, 'completed_courses': {...}}, ...] ('completed_courses' optional)
+            context: Program context; resolved from user_input['program'] if None
+            
+        Returns:
+            {'reports': [one DegreeAudit.report() per plan], 'satisfied': count}, or {'error'}
+        """
+        rules = self._degree_rules(user_input, context)
+        if isinstance(rules, dict):
+            return rules
+        reports = audit_course_sets(rules, (self._audited_courses(plan.get('current_plan'), plan.get('completed_courses'))
+                                            for plan in plans))
+        return {'reports': reports, 'satisfied': sum(1 for report in reports if report['satisfied'])}
+    
+    def _degree_rules(self, user_input: Dict[str, Any], context: Optional[ProgramContext] = None):
+        """Compiled DegreeRules of the requested program, or {'error'}."""
+        if context is None:
+            try:
+                context = self.get_program_context(user_input.get('program'))
+            except ValueError as e:
+                return {"error": str(e)}
+        if 'program' not in user_input and 'degree' not in user_input:
+            user_input = dict(user_input, program=context.program_name)
+        
+        program, requirements = self._program_requirements(user_input)
+        if program is None:
+            return requirements
+        return DegreeRules(requirements, self._get_course_level, PROGRAM_SUBJECT_MAPPING.get(context.program_name, ()))
+    
+    def _audited_courses(self, current_plan: Optional[Dict[str, List[str]]],
+                         completed_courses: Optional[Dict[str, List[str]]]) -> List[str]:
+        """Every completed and planned course code."""
+        return [code for courses in itertools.chain((completed_courses or {}).values(), (current_plan or {}).values())
+                for code in courses]
+    
+    def create_plan_session(self, current_plan: Dict[str, List[str]], program_context: Dict[str, Any] = None,
+                            context: Optional[ProgramContext] = None) -> Dict[str, Any]:
+        """
+        Start a server-side plan session (see plan_session.py).
+        
+        Sessions for a named program also keep a degree audit of the plan up to date.
+        
+        Returns:
+            {'session_id', 'current_plan', 'valid', 'reports', 'audit'} with one validate_move-style
+            report per course, or {'error'} for an unsupported program or malformed plan
+        """
+        if context is None:
+            try:
+                context = self.get_program_context((program_context or {}).get('program'))
+            except ValueError as e:
+                return {"error": str(e)}
+        
+        def complete_report(report, course_code, term_code):
+            return self._complete_validation(report, course_code, term_code, program_context, context)
+        
+        degree_audit = None
+        if (program_context or {}).get('program'):
+            rules = self._degree_rules(program_context, context)
+            if not isinstance(rules, dict):  # programs without requirement data are validated without an audit
+                degree_audit = DegreeAudit(rules)
+        
+        try:
+            session = PlanSession(context.course_validator, complete_report, current_plan or {},
+                                  degree_audit=degree_audit)
+        except ValueError as e:
+            return {"error": str(e)}
+        
+        session_id = self.plan_sessions.create(session)
+        return dict(session.state(), session_id=session_id)
+    
+    def update_plan_session(self, session_id: str, delta: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Apply one delta to a session and return only the reports it changed.
+        
+        Args:
+            delta: {'action': 'add'|'remove', 'course_code', 'term_code'} or
+                   {'action': 'move', 'course_code', 'from_term', 'to_term'}
+        
+        Returns:
+            {'valid', 'changed': [reports], 'removed': [{'course_code', 'term_code'}]},
+            {'error'} for an invalid delta, or None if the session is unknown or expired
+        """
+        session = self.plan_sessions.get(session_id)
+        if session is None:
+            return None
+        
+        action = delta.get('action')
+        try:
+            with session.lock:
+                if action == 'add':
+                    return session.add(delta['course_code'], delta['term_code'])
+                if action == 'remove':
+                    return session.remove(delta['course_code'], delta['term_code'])
+                if action == 'move':
+                    return session.move(delta['course_code'], delta['from_term'], delta['to_term'])
+        except KeyError as e:
+            return {"error": f"Missing field for '{action}': {e.args[0]}"}
+        except ValueError as e:
+            return {"error": str(e)}
+        return {"error": f"Unknown action: {action}. Expected 'add', 'remove' or 'move'."}
+    
+    def get_plan_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Current plan and reports of a session, or None if unknown or expired."""
+        session = self.plan_sessions.get(session_id)
+        if session is None:
+            return None
+        with session.lock:
+            return dict(session.state(), session_id=session_id)
+    
+    def _complete_validation(self, validation_result: Dict[str, Any], course_code: str, term_code: str,
+                             program_context: Optional[Dict[str, Any]], context: ProgramContext) -> Dict[str, Any]:
+        """Add program-requirement checks, course info and offering status to a placement result."""
         # Add program-specific validation if context is provided
         if program_context:
             program_validation = self._validate_program_requirements(course_code, program_context)
             if not program_validation['valid']:
                 validation_result['valid'] = False
                 validation_result['issues'].extend(program_validation['issues'])
-            validation_result['warnings'].extend(program_validation.get('warnings', []))
+            validation_result.setdefault('warnings', []).extend(program_validation.get('warnings', []))
         
         # Get course information for additional context
-        course = self.course_loader.get_course(course_code)
+        course = context.course_loader.get_course(course_code)
         if course:
             validation_result['course_info'] = {
                 'title': course.title,
@@ -854,51 +1659,27 @@ class SYDECoursePlanner:
             }
         
         # Add offering status
-        offering_status = self.course_loader.get_offering_status_for_term(course_code, term_code)
+        offering_status = context.course_loader.get_offering_status_for_term(course_code, term_code)
         validation_result['offering_status'] = offering_status
         
         return validation_result
 
     def _generate_semester_schedule_codes(self, start_term_code: str, num_semesters: int) -> List[str]:
         """Generates a list of term codes for the student's study period."""
-        codes = []
-        current_term = start_term_code
-        for _ in range(num_semesters):
-            codes.append(current_term)
-            year_code = int(current_term[:-1])
-            term_digit = int(current_term[-1])
-            if term_digit == 9: # Fall
-                current_term = str(year_code + 1) + '1'
-            else:
-                current_term = str(year_code) + str(term_digit + 4)
-        return codes
+        return term_sequence(start_term_code, num_semesters)
 
     def _generate_semester_structure(self, start_term_code: str, num_semesters: int) -> List[Dict[str, str]]:
         """Creates a list of semester objects for the frontend planning board."""
-        structure = []
-        current_term = start_term_code
-        
-        term_map = {1: "Winter", 5: "Spring", 9: "Fall"}
-
-        for _ in range(num_semesters):
-            year = 1900 + int(current_term[:-1])
-            season_digit = int(current_term[-1])
-            
-            structure.append({
-                "term_code": current_term,
-                "term_name": f"{term_map[season_digit]} {year}",
-                "name": f"{term_map[season_digit]} {year}",
+        return [
+            {
+                "term_code": term_code,
+                "term_name": term_name(term_code),
+                "name": term_name(term_code),
                 "capacity": 3,  # Default capacity for MEng programs
                 "courses": []
-            })
-            
-            # Calculate next term
-            if season_digit == 9: # Fall
-                current_term = str(int(current_term[:-1]) + 1) + '1' # Next Winter
-            else:
-                current_term = current_term[:-1] + str(season_digit + 4)
-                
-        return structure
+            }
+            for term_code in term_sequence(start_term_code, num_semesters)
+        ]
 
     def _parse_program_requirements(self, program: Dict, user_input: Dict) -> Dict[str, Any]:
         """Parse program requirements into structured format, handling duplicates."""
@@ -1086,7 +1867,8 @@ class SYDECoursePlanner:
                 })
         return choices
 
-    def _build_course_pool(self, requirements: Dict, user_schedule: List[str]) -> List[Dict]:
+    def _build_course_pool(self, requirements: Dict, user_schedule: List[str],
+                           course_loader: EngineeringCourseLoader) -> List[Dict]:
         """
         Build a pool of courses that are relevant and available during the student's schedule.
         """
@@ -1097,24 +1879,21 @@ class SYDECoursePlanner:
             if not course: return None
 
             # --- Smart Availability Check ---
-            is_available_in_schedule = False
-            availability_notes = []
-            for term_code in user_schedule:
-                status = self.course_loader.get_offering_status_for_term(course.course_code, term_code)
-                if status["is_offered"]:
-                    is_available_in_schedule = True
-                    availability_notes.append(f"{term_code}: {status['status']}")
-            
             # Only add course to the pool if it's available at some point during the user's study period
-            if not is_available_in_schedule:
+            statuses = schedule_statuses.get(course.course_code)
+            if statuses is None or not statuses.any():
                 return None
+            
+            availability_notes = [
+                f"{term_code}: {STATUS_LABELS[status]}"
+                for term_code, status in zip(user_schedule, statuses.tolist())
+                if status != NOT_OFFERED
+            ]
 
-            # Parse course requirements for prerequisite/antirequisite display
-            prereq_parser = EnhancedPrerequisiteParser()
-            parsed_requirements = prereq_parser.parse_requirements(course.requirements_description)
+            # Parse course requirements for prerequisite/antirequisite display (cached per text)
+            parsed_requirements = self.prereq_parser.parse_requirements(course.requirements_description)
 
-            course_dict = asdict(course)
-            course_dict['course_code'] = course.course_code
+            course_dict = course_record(course)
             
             # Keep nested structure for frontend compatibility
             return {
@@ -1130,37 +1909,32 @@ class SYDECoursePlanner:
                 'other_requirements': parsed_requirements.get('other_requirements', [])
             }
 
-        all_courses_from_rules = set(requirements.get('compulsory_courses', []))
-        for choice in requirements.get('compulsory_choices', []):
-            all_courses_from_rules.update(choice.get('courses', []))
-        for elective_rule in requirements.get('elective_requirements', []):
-            all_courses_from_rules.update(elective_rule.get('courses', []))
-            all_courses_from_rules.update(elective_rule.get('specified_list', []))
-            all_courses_from_rules.update(elective_rule.get('elective_list', []))
+        # Every course's category/tags, compiled once from the requirement rules
+        roles = RequirementRoleIndex(requirements, self._get_course_level)
+        all_courses_from_rules = roles.course_codes
+
+        # One table lookup for the offering status of every candidate (rule courses + graduate courses) in every term
+        graduate_courses = [course for course in course_loader.get_courses_by_level((6, 9))
+                            if course.course_code not in all_courses_from_rules]
+        candidate_codes = [code for code in all_courses_from_rules if course_loader.get_course(code)]
+        candidate_codes += [course.course_code for course in graduate_courses]
+        status_matrix, _ = course_loader.predict_offerings(candidate_codes, user_schedule)
+        schedule_statuses = dict(zip(candidate_codes, status_matrix))
+        # Text similarity of every candidate to the program's requirement courses, used to rank electives
+        relevance = dict(zip(candidate_codes, course_loader.catalog.similarity.relevance(
+            candidate_codes, all_courses_from_rules).tolist()))
 
-        # Process all courses mentioned in rules with proper categorization
-        for course_code in all_courses_from_rules:
-            course = self.course_loader.get_course(course_code)
+        # Rule courses with their requirement roles, then general graduate courses
+        rule_courses = [course_loader.get_course(course_code) for course_code in all_courses_from_rules]
+        for course in itertools.chain(rule_courses, graduate_courses):
             if course:
-                # Determine category and priority based on requirements
-                category, priority = self._categorize_course(course_code, requirements)
-                item = create_pool_item(course, category, priority)
+                role = roles.role(course.course_code)
+                item = create_pool_item(course, role.category, role.priority)
                 if item: 
                     # Add requirement tags and visual formatting
-                    item['tags'] = self._get_course_tags(course_code, requirements)
-                    item['tag'], item['tag_color'] = self._get_course_tag_and_color(course_code, requirements)
-                    course_pool.append(item)
-            
-        # Add general graduate courses
-        existing_codes = {item['course']['course_code'] for item in course_pool}
-        graduate_courses = self.course_loader.get_courses_by_level((6, 9))
-        for course in graduate_courses:
-            if course.course_code not in existing_codes:
-                item = create_pool_item(course, 'general_elective', 5)
-                if item: 
-                    # Add tags for general graduate courses
-                    item['tags'] = self._get_course_tags(course.course_code, requirements)
-                    item['tag'], item['tag_color'] = self._get_course_tag_and_color(course.course_code, requirements)
+                    item['tags'] = list(role.tags)
+                    item['tag'], item['tag_color'] = role.tag, role.tag_color
+                    item['relevance'] = round(relevance[course.course_code], 4)
                     course_pool.append(item)
         
         # Deduplicate and sort with improved logic
@@ -1175,91 +1949,6 @@ class SYDECoursePlanner:
             return int(match.group(1))
         return 0
 
-    def _categorize_course(self, course_code: str, requirements: Dict) -> Tuple[str, int]:
-        """Categorize a course and assign priority based on requirements."""
-        # Check if it's compulsory
-        if course_code in requirements.get('compulsory_courses', []):
-            return 'compulsory', 10
-        
-        # Check if it's in compulsory choices
-        for choice_group in requirements.get('compulsory_choices', []):
-            if course_code in choice_group.get('courses', []):
-                return 'compulsory_choice', 9
-        
-        # Check if it's in elective requirements
-        for elective_group in requirements.get('elective_requirements', []):
-            if course_code in elective_group.get('courses', []):
-                return 'specified_elective', 8
-            if course_code in elective_group.get('specified_list', []):
-                return 'specified_elective', 7
-            if course_code in elective_group.get('elective_list', []):
-                return 'general_elective', 6
-        
-        # Default category
-        return 'general_elective', 5
-
-    def _get_course_tags(self, course_code: str, requirements: Dict) -> List[str]:
-        """Get tags for a course based on its role in requirements."""
-        tags = []
-        
-        # Check if it's compulsory
-        if course_code in requirements.get('compulsory_courses', []):
-            tags.append('Required')
-            tags.append('Core')
-        
-        # Check if it's in compulsory choices
-        for choice_group in requirements.get('compulsory_choices', []):
-            if course_code in choice_group.get('courses', []):
-                tags.append('Choice Required')
-                n_to_choose = choice_group.get('n_to_choose', 1)
-                tags.append(f'Choose {n_to_choose}')
-        
-        # Check if it's in elective requirements
-        for elective_group in requirements.get('elective_requirements', []):
-            group_name = elective_group.get('group_name', 'Elective')
-            if course_code in elective_group.get('courses', []):
-                tags.append('Elective')
-                tags.append(group_name)
-            elif course_code in elective_group.get('specified_list', []):
-                tags.append('Specified Elective')
-                tags.append(group_name)
-            elif course_code in elective_group.get('elective_list', []):
-                tags.append('General Elective')
-        
-        # Add level tags
-        course_level = self._get_course_level(course_code)
-        if course_level >= 6:
-            tags.append('Graduate Level')
-        elif course_level == 5:
-            tags.append('Advanced Undergraduate')
-        
-        return tags
-
-    def _get_course_tag_and_color(self, course_code: str, requirements: Dict) -> Tuple[str, str]:
-        """Get the primary tag and color for a course based on its requirements role."""
-        # Check if it's compulsory
-        if course_code in requirements.get('compulsory_courses', []):
-            return 'Required', '#dc3545'  # Red
-        
-        # Check if it's in compulsory choices
-        for choice_group in requirements.get('compulsory_choices', []):
-            if course_code in choice_group.get('courses', []):
-                return 'Core', '#fd7e14'  # Orange
-        
-        # Check if it's in elective requirements (specified courses)
-        for elective_group in requirements.get('elective_requirements', []):
-            if course_code in elective_group.get('courses', []):
-                return 'Elective', '#28a745'  # Green
-        
-        # Check course level for graduate designation
-        course_level = self._get_course_level(course_code)
-        if course_level >= 6:
-            return 'Graduate', '#6f42c1'  # Purple
-        elif course_level == 5:
-            return 'Advanced', '#17a2b8'  # Teal
-        
-        return 'General', '#6c757d'  # Gray
-
     def _course_sort_key(self, course_item: Dict) -> Tuple:
         """
         Generate a sort key for course ordering.
@@ -1299,10 +1988,12 @@ class SYDECoursePlanner:
         course_level = self._get_course_level(course_code)
         level_priority = 0 if course_level >= 6 else 1  # Graduate first
         
-        # Quaternary sort: by course number within same subject
-        # Lower numbers first (e.g., SYDE 600 before SYDE 660)
+        # Quaternary sort: electives and other courses closest to the program's requirement courses first
+        relevance_priority = -course_item.get('relevance', 0.0) if sort_priority >= 5 else 0.0
         
-        return (sort_priority, subject_priority, level_priority, subject, number)
+        return (sort_priority, subject_priority, level_priority, relevance_priority,
+                subject, number,  # Then by subject and course number (SYDE 600 before SYDE 660)
+                course_code)  # Finally by code: variants (SYDE 660A-E) must not keep per-process set order
 
     def _validate_program_requirements(self, course_code: str, program_context: Dict[str, Any]) -> Dict[str, Any]:
         """Validate if a course meets program-specific requirements"""
@@ -1405,8 +2096,7 @@ class SYDECoursePlanner:
                 for course_code in elective_rule.get('courses', []):
                     course = self.course_loader.get_course(course_code)
                     if course:
-                        course_dict = asdict(course)
-                        course_dict['course_code'] = course.course_code
+                        course_dict = course_record(course)
                         course_pool.append({
                             'course': course_dict,
                             'category': 'specified_elective',
@@ -1423,8 +2113,7 @@ class SYDECoursePlanner:
                         for course_code in elective_rule[list_name]:
                             course = self.course_loader.get_course(course_code)
                             if course:
-                                course_dict = asdict(course)
-                                course_dict['course_code'] = course.course_code
+                                course_dict = course_record(course)
                                 course_pool.append({
                                     'course': course_dict,
                                     'category': f'complex_{list_name}',
@@ -1439,6 +2128,8 @@ class CourseValidator:
     def __init__(self, course_loader: 'EngineeringCourseLoader'):
         self.course_loader = course_loader
         self.prereq_parser = EnhancedPrerequisiteParser()
+        # Built once by the catalog as subjects load
+        self.requirement_graph = course_loader.catalog.requirement_graph
 
     def _get_course_level(self, course_code: str) -> int:
         """Get the level of a course from its course code."""
@@ -1467,6 +2158,240 @@ class CourseValidator:
         Returns:
             Validation result with success status, issues, and recommendations
         """
+        if planned_courses is None:
+            planned_courses = {}
+        
+        # Get all courses completed before target term
+        prior_courses = self._get_courses_before_term(target_term, completed_courses, planned_courses)
+        
+        # Every course already completed or planned, in any term
+        placed_courses = set(prior_courses)
+        for courses in completed_courses.values():
+            placed_courses.update(courses)
+        for courses in planned_courses.values():
+            placed_courses.update(courses)
+        
+        courses_in_term = len(completed_courses.get(target_term, [])) + len(planned_courses.get(target_term, []))
+        
+        return self._validate_placement(course_code, target_term, prior_courses, placed_courses,
+                                        self._merge_term_courses(completed_courses, planned_courses),
+                                        courses_in_term, max_courses_per_term)
+    
+    def validate_plan(self, 
+                      planned_courses: Dict[str, List[str]],
+                      completed_courses: Dict[str, List[str]] = None,
+                      max_courses_per_term: int = 3) -> List[Dict[str, Any]]:
+        """
+        Validate every placement in a plan in one pass.
+        
+        Each planned course is checked as validate_course_placement would check it against
+        the rest of the plan (the plan without that placement). The prior-course set of each
+        term is built once, as a running union over the terms in order, and shared by every
+        course placed in that term.
+        
+        Args:
+            planned_courses: Dict mapping term_code -> list of planned course codes
+            completed_courses: Dict mapping term_code -> list of completed course codes
+            max_courses_per_term: Maximum courses allowed per term (default: 3)
+            
+        Returns:
+            One validation result per planned course (with 'course_code' and 'term_code'),
+            in term order
+        """
+        if completed_courses is None:
+            completed_courses = {}
+        
+        term_courses = self._merge_term_courses(completed_courses, planned_courses)
+        placement_counts = Counter(code for courses in term_courses.values() for code in courses)
+        placed_courses = set(placement_counts)
+        
+        prior_by_term: Dict[str, frozenset] = {}
+        prior_courses: frozenset = frozenset()
+        for term_code in sorted(term_courses, key=term_ordinal):
+            prior_by_term[term_code] = prior_courses
+            prior_courses = prior_courses | frozenset(term_courses[term_code])
+        
+        reports = []
+        for term_code in sorted(planned_courses, key=term_ordinal):
+            for course_code in planned_courses[term_code]:
+                # The rest of the plan lacks this course unless it is placed elsewhere too; that
+                # only matters to a course listing itself as an antirequisite
+                others = placed_courses
+                if placement_counts[course_code] == 1 and \
+                        course_code in self.requirement_graph.antirequisites.get(course_code, ()):
+                    others = placed_courses - {course_code}
+                report = self._validate_placement(course_code, term_code, prior_by_term[term_code], others,
+                                                  term_courses, len(term_courses[term_code]) - 1,
+                                                  max_courses_per_term)
+                report['course_code'] = course_code
+                report['term_code'] = term_code
+                reports.append(report)
+        return reports
+    
+    def drop_targets(self,
+                     course_codes: List[str],
+                     term_codes: List[str],
+                     planned_courses: Dict[str, List[str]],
+                     completed_courses: Dict[str, List[str]] = None,
+                     max_courses_per_term: int = 3) -> Dict[str, Dict[str, Any]]:
+        """
+        Valid terms for moving each course into, against the current plan.
+        
+        Cell (course, term) agrees with validate_course_placement(course, term, completed,
+        plan without that course): valid if it has no issues, otherwise blocked by its first
+        issue. Offering, capacity, prerequisite and dependent-course checks are evaluated for
+        all cells at once as (courses x terms) arrays; antirequisite conflicts don't depend on
+        the term and are checked once per course.
+        
+        Args:
+            course_codes: Courses to place (e.g., the course pool)
+            term_codes: Candidate terms
+            planned_courses: Dict mapping term_code -> list of planned course codes
+            completed_courses: Dict mapping term_code -> list of completed course codes
+            max_courses_per_term: Maximum courses allowed per term (default: 3)
+            
+        Returns:
+            {course_code: {'valid_terms': [term codes], 'blocked': {term_code: first issue}}}
+        """
+        if completed_courses is None:
+            completed_courses = {}
+        
+        term_courses = self._merge_term_courses(completed_courses, planned_courses)
+        term_ints = term_ordinals(term_codes).astype(np.float64)
+        
+        # Earliest term each course is placed in (completed placements separately, since
+        # moving a course only lifts its planned placements)
+        earliest: Dict[str, int] = {}
+        for term_code, courses in term_courses.items():
+            for code in courses:
+                earliest[code] = min(earliest.get(code, term_ordinal(term_code)), term_ordinal(term_code))
+        earliest_completed: Dict[str, int] = {}
+        for term_code, courses in completed_courses.items():
+            for code in courses:
+                earliest_completed[code] = min(earliest_completed.get(code, term_ordinal(term_code)), term_ordinal(term_code))
+        completed_set = set(earliest_completed)
+        placed_courses = set(earliest)
+        
+        # Offering status
+        status, _ = self.course_loader.predict_offerings(course_codes, term_codes)
+        not_offered = status == NOT_OFFERED
+        
+        # Capacity: courses in each term, not counting the moved course's own placements
+        term_counts = np.array([len(term_courses.get(term_code, [])) for term_code in term_codes])
+        own_counts = np.array([[planned_courses.get(term_code, []).count(code) for term_code in term_codes]
+                               for code in course_codes]).reshape(len(course_codes), len(term_codes))
+        other_counts = term_counts[np.newaxis, :] - own_counts
+        over_capacity = other_counts >= max_courses_per_term
+        
+        # Prerequisites: a group is satisfied in term t if one of its courses is placed before t,
+        # i.e., if its earliest placement < t; thresholds are padded to (courses x groups)
+        requirements_by_course = []
+        group_thresholds = []
+        for code in course_codes:
+            course = self.course_loader.get_course(code)
+            requirements = self.prereq_parser.parse_requirements(course.requirements_description if course else None)
+            requirements_by_course.append(requirements)
+            thresholds: Dict[str, float] = {}
+            if self._get_course_level(code) != 5:  # 500-level prerequisites are only recommended
+                for i, prereq in enumerate(requirements['prerequisites']):
+                    if prereq['type'] == 'required':
+                        group_codes = [prereq['courses'][0]['full_code']]
+                    elif prereq['type'] == 'one_of':
+                        group_codes = [course_entry['full_code'] for course_entry in prereq['courses']]
+                    else:
+                        continue
+                    placements = [
+                        (earliest_completed if group_code == code else earliest).get(group_code, np.inf)
+                        for group_code in group_codes
+                    ]
+                    thresholds[prereq.get('description', f"Requirement {i+1}")] = min(placements, default=np.inf)
+            group_thresholds.append(thresholds)
+        
+        max_groups = max((len(thresholds) for thresholds in group_thresholds), default=0)
+        threshold_matrix = np.full((len(course_codes), max(max_groups, 1)), -np.inf)
+        for row, thresholds in enumerate(group_thresholds):
+            threshold_matrix[row, :len(thresholds)] = list(thresholds.values())
+        unsatisfied = threshold_matrix[:, :, np.newaxis] >= term_ints[np.newaxis, np.newaxis, :]
+        prerequisite_blocked = unsatisfied.any(axis=1)
+        first_unsatisfied = unsatisfied.argmax(axis=1)
+        
+        # Antirequisites (term independent) and dependents placed in earlier terms
+        antirequisite_conflicts = []
+        dependent_placements = []
+        for code, requirements in zip(course_codes, requirements_by_course):
+            others = placed_courses
+            if code in requirements['antirequisites'] and code not in completed_set:
+                others = placed_courses - {code}
+            antirequisite_conflicts.append(self._antirequisite_conflicts(code, requirements['antirequisites'], others))
+            
+            dependents = self.requirement_graph.courses_requiring(code)
+            placements = []
+            if dependents:
+                for term_code, courses in term_courses.items():
+                    for dependent_course in sorted(dependents.intersection(courses)):
+                        if dependent_course != code and dependent_course in self.course_loader.courses:
+                            placements.append((term_ordinal(term_code), term_code, dependent_course))
+            dependent_placements.append(placements)
+        
+        antirequisite_blocked = np.array([bool(conflicts) for conflicts in antirequisite_conflicts], dtype=bool)
+        earliest_dependent = np.array([min((p[0] for p in placements), default=np.inf)
+                                       for placements in dependent_placements])
+        dependent_blocked = earliest_dependent[:, np.newaxis] < term_ints[np.newaxis, :]
+        
+        # First blocking check per cell (1-based), in validate_course_placement's order
+        not_found = np.array([self.course_loader.get_course(code) is None for code in course_codes], dtype=bool)
+        blocking_check = np.select(
+            [not_found[:, np.newaxis], not_offered, over_capacity, prerequisite_blocked,
+             antirequisite_blocked[:, np.newaxis], dependent_blocked],
+            [1, 2, 3, 4, 5, 6],
+            default=0
+        )
+        
+        targets = {}
+        for row, code in enumerate(course_codes):
+            valid_terms, blocked = [], {}
+            for column, term_code in enumerate(term_codes):
+                check = blocking_check[row, column]
+                if check == 0:
+                    valid_terms.append(term_code)
+                elif check == 1:
+                    blocked[term_code] = f"Course {code} not found"
+                elif check == 2:
+                    blocked[term_code] = f"Course {code} is not offered in term {term_code} ({STATUS_LABELS[NOT_OFFERED]})"
+                elif check == 3:
+                    blocked[term_code] = (f"Maximum {max_courses_per_term} courses per semester. "
+                                          f"Current term already has {other_counts[row, column]} courses.")
+                elif check == 4:
+                    description = list(group_thresholds[row])[first_unsatisfied[row, column]]
+                    blocked[term_code] = f"Prerequisite not satisfied: {description}"
+                elif check == 5:
+                    blocked[term_code] = (f"Antirequisite conflict: Cannot take {code} if "
+                                          f"{antirequisite_conflicts[row][0]} is completed/planned")
+                else:
+                    _, dependent_term, dependent_course = next(
+                        placement for placement in dependent_placements[row] if placement[0] < term_ints[column]
+                    )
+                    blocked[term_code] = self._dependent_course_issues(code, term_code, {dependent_term: [dependent_course]})[0]
+            targets[code] = {'valid_terms': valid_terms, 'blocked': blocked}
+        return targets
+    
+    def _validate_placement(self,
+                            course_code: str,
+                            target_term: str,
+                            prior_courses: Collection[str],
+                            placed_courses: AbstractSet[str],
+                            term_courses: Dict[str, List[str]],
+                            courses_in_term: int,
+                            max_courses_per_term: int) -> Dict[str, Any]:
+        """
+        Checks shared by validate_course_placement and validate_plan.
+        
+        Args:
+            prior_courses: Courses completed/planned in terms before target_term
+            placed_courses: Every other completed/planned course
+            term_courses: Term code -> completed and planned courses in that term
+            courses_in_term: Other courses already in target_term
+        """
         course = self.course_loader.get_course(course_code)
         if not course:
             return {
@@ -1478,9 +2403,6 @@ class CourseValidator:
         # Parse requirements
         requirements = self.prereq_parser.parse_requirements(course.requirements_description)
         
-        # Get all courses completed before target term
-        prior_courses = self._get_courses_before_term(target_term, completed_courses, planned_courses)
-        
         validation_result = {
             'valid': True,
             'issues': [],
@@ -1501,7 +2423,7 @@ class CourseValidator:
             validation_result['warnings'].append(f"Course offering in term {target_term} is {offering_status['status']}")
         
         # Check semester capacity
-        capacity_check = self._check_semester_capacity(target_term, completed_courses, planned_courses, max_courses_per_term)
+        capacity_check = self._capacity_check(courses_in_term, max_courses_per_term)
         if not capacity_check['valid']:
             validation_result['valid'] = False
             validation_result['issues'].extend(capacity_check['issues'])
@@ -1533,11 +2455,7 @@ class CourseValidator:
                 ])
         
         # Check antirequisites
-        antireq_conflicts = self._check_antirequisites(course_code,
-                                                      requirements['antirequisites'], 
-                                                      prior_courses, 
-                                                      completed_courses, 
-                                                      planned_courses)
+        antireq_conflicts = self._antirequisite_conflicts(course_code, requirements['antirequisites'], placed_courses)
         validation_result['antirequisite_conflicts'] = antireq_conflicts
         
         if antireq_conflicts:
@@ -1553,7 +2471,7 @@ class CourseValidator:
             validation_result['warnings'].extend(level_issues)
         
         # Check for dependent courses that would be invalidated by this move
-        dependent_course_issues = self._check_dependent_courses(course_code, target_term, completed_courses, planned_courses)
+        dependent_course_issues = self._dependent_course_issues(course_code, target_term, term_courses)
         if dependent_course_issues:
             validation_result['valid'] = False
             validation_result['issues'].extend(dependent_course_issues)
@@ -1569,16 +2487,16 @@ class CourseValidator:
             planned_courses = {}
             
         all_prior_courses = []
-        target_term_int = int(target_term)
+        target_ordinal = term_ordinal(target_term)
         
         # Add completed courses from earlier terms
         for term_code, courses in completed_courses.items():
-            if int(term_code) < target_term_int:
+            if term_ordinal(term_code) < target_ordinal:
                 all_prior_courses.extend(courses)
         
         # Add planned courses from earlier terms
         for term_code, courses in planned_courses.items():
-            if int(term_code) < target_term_int:
+            if term_ordinal(term_code) < target_ordinal:
                 all_prior_courses.extend(courses)
         
         return all_prior_courses
@@ -1600,6 +2518,10 @@ class CourseValidator:
         if target_term in planned_courses:
             current_courses_in_term += len(planned_courses[target_term])
         
+        return self._capacity_check(current_courses_in_term, max_courses)
+    
+    def _capacity_check(self, current_courses_in_term: int, max_courses: int = 3) -> Dict[str, Any]:
+        """Capacity check for a term already holding current_courses_in_term courses."""
         # Hard limit at 3 courses - absolutely cannot exceed
         if current_courses_in_term >= max_courses:
             return {
@@ -1658,17 +2580,22 @@ class CourseValidator:
                             completed_courses: Dict[str, List[str]],
                             planned_courses: Dict[str, List[str]] = None) -> List[str]:
         """Check for antirequisite conflicts (bidirectional)."""
-        conflicts = []
-        
         if planned_courses is None:
             planned_courses = {}
         
         # Combine all completed and planned courses
-        all_courses = prior_courses.copy()
+        all_courses = set(prior_courses)
         for courses in completed_courses.values():
-            all_courses.extend(courses)
+            all_courses.update(courses)
         for courses in planned_courses.values():
-            all_courses.extend(courses)
+            all_courses.update(courses)
+        
+        return self._antirequisite_conflicts(course_code, antirequisites, all_courses)
+    
+    def _antirequisite_conflicts(self, course_code: str, antirequisites: List[str],
+                                 all_courses: AbstractSet[str]) -> List[str]:
+        """Antirequisite conflicts of course_code with a set of completed/planned courses."""
+        conflicts = []
         
         # Check direct antirequisites (A lists B as antirequisite)
         for antireq in antirequisites:
@@ -1676,17 +2603,10 @@ class CourseValidator:
                 conflicts.append(f"{antireq} (listed as antirequisite of {course_code})")
         
         # Check reverse antirequisites (B lists A as antirequisite)
-        for existing_course in all_courses:
-            if existing_course == course_code:
-                continue
-                
-            existing_course_data = self.course_loader.get_course(existing_course)
-            if existing_course_data:
-                existing_requirements = self.prereq_parser.parse_requirements(existing_course_data.requirements_description)
-                existing_antireqs = existing_requirements.get('antirequisites', [])
-                
-                if course_code in existing_antireqs:
-                    conflicts.append(f"{existing_course} (lists {course_code} as antirequisite)")
+        reverse_conflicts = (self.requirement_graph.courses_excluding(course_code) & all_courses) - {course_code}
+        for existing_course in sorted(reverse_conflicts):
+            if existing_course in self.course_loader.courses:
+                conflicts.append(f"{existing_course} (lists {course_code} as antirequisite)")
         
         return conflicts
     
@@ -1705,141 +2625,52 @@ class CourseValidator:
         Check if any courses that depend on the target course are already placed in earlier terms.
         This prevents moving prerequisite courses after their dependent courses are already scheduled.
         """
-        def get_term_name(term_code: str) -> str:
-            """Convert term code to readable name."""
-            if len(term_code) != 4:
-                return term_code
-            
-            year = "20" + term_code[1:3]
-            month = term_code[3]
-            
-            season_map = {
-                "1": "Winter",
-                "5": "Spring", 
-                "9": "Fall"
-            }
-            
-            season = season_map.get(month, "Unknown")
-            return f"{season} {year}"
-        
-        issues = []
-        target_term_int = int(target_term)
-
         # Combine both completed and planned courses for comprehensive checking
+        return self._dependent_course_issues(course_code, target_term,
+                                             self._merge_term_courses(completed_courses, planned_courses))
+
+    def _merge_term_courses(self, completed_courses: Dict[str, List[str]],
+                            planned_courses: Optional[Dict[str, List[str]]]) -> Dict[str, List[str]]:
+        """Term code -> completed then planned courses in that term."""
         all_courses = {}
         for term_code, courses in completed_courses.items():
             all_courses[term_code] = all_courses.get(term_code, []) + courses
         if planned_courses:
             for term_code, courses in planned_courses.items():
                 all_courses[term_code] = all_courses.get(term_code, []) + courses
+        return all_courses
+
+    def _dependent_course_issues(self, course_code: str, target_term: str, all_courses: Dict[str, List[str]]) -> List[str]:
+        """Dependent-course issues for placing course_code in target_term, given term -> placed courses."""
+        issues = []
+        target_ordinal = term_ordinal(target_term)
 
         # Check antirequisites (if the target course is an antirequisite of any other)
-        for existing_course in all_courses.get(target_term, []):
-            if existing_course != course_code:  # Don't check against itself
-                existing_course_data = self.course_loader.get_course(existing_course)
-                if existing_course_data:
-                    existing_requirements = self.prereq_parser.parse_requirements(existing_course_data.requirements_description)
-                    existing_antireqs = existing_requirements.get('antirequisites', [])
-                    if course_code in existing_antireqs:
-                        issues.append(f"Cannot move {course_code} to term {target_term} because {existing_course} (listed as antirequisite) is already in this term.")
+        excluding_courses = self.requirement_graph.courses_excluding(course_code)
+        if excluding_courses:
+            for existing_course in all_courses.get(target_term, []):
+                if existing_course != course_code and existing_course in excluding_courses \
+                        and existing_course in self.course_loader.courses:
+                    issues.append(f"Cannot move {course_code} to term {target_term} because {existing_course} (listed as antirequisite) is already in this term.")
 
         # Check if any courses in earlier terms depend on this course as a prerequisite
         # This prevents moving prerequisite courses after their dependent courses
+        dependent_courses = self.requirement_graph.courses_requiring(course_code)
+        if not dependent_courses:
+            return issues
+        
         for term_code, courses in all_courses.items():
             try:
-                term_int = int(term_code)
-                if term_int < target_term_int:  # Check EARLIER terms, not later ones!
-                    for dependent_course in courses:
-                        if dependent_course != course_code:  # Don't check against itself
-                            dependent_course_data = self.course_loader.get_course(dependent_course)
-                            if dependent_course_data:
-                                dependent_requirements = self.prereq_parser.parse_requirements(dependent_course_data.requirements_description)
-                                # Check if the target course is a prerequisite for the dependent course
-                                for prereq_group in dependent_requirements.get('prerequisites', []):
-                                    if isinstance(prereq_group, dict):
-                                        prereq_courses = prereq_group.get('courses', [])
-                                        # Check if any prerequisite course matches the target course
-                                        for prereq_course in prereq_courses:
-                                            if isinstance(prereq_course, dict):
-                                                # Handle structured prerequisite (dict with full_code, subject, number)
-                                                if prereq_course.get('full_code') == course_code:
-                                                    target_term_name = get_term_name(target_term)
-                                                    dependent_term_name = get_term_name(term_code)
-                                                    issues.append(f"Cannot move {course_code} to {target_term_name} because {dependent_course} (which requires it as prerequisite) is already scheduled in {dependent_term_name}")
-                                            elif isinstance(prereq_course, str) and prereq_course == course_code:
-                                                # Handle simple string prerequisite
-                                                target_term_name = get_term_name(target_term)
-                                                dependent_term_name = get_term_name(term_code)
-                                                issues.append(f"Cannot move {course_code} to {target_term_name} because {dependent_course} (which requires it as prerequisite) is already scheduled in {dependent_term_name}")
-                                    elif isinstance(prereq_group, str) and course_code in prereq_group:
-                                        target_term_name = get_term_name(target_term)
-                                        dependent_term_name = get_term_name(term_code)
-                                        issues.append(f"Cannot move {course_code} to {target_term_name} because {dependent_course} (which requires it as prerequisite) is already scheduled in {dependent_term_name}")
+                ordinal = term_ordinal(term_code)
             except (ValueError, TypeError):
                 # Skip invalid term codes
                 continue
+            if ordinal >= target_ordinal:  # Check EARLIER terms, not later ones!
+                continue
+            for dependent_course in sorted(dependent_courses.intersection(courses)):
+                if dependent_course != course_code and dependent_course in self.course_loader.courses:
+                    target_term_name = term_name(target_term)
+                    dependent_term_name = term_name(term_code)
+                    issues.append(f"Cannot move {course_code} to {target_term_name} because {dependent_course} (which requires it as prerequisite) is already scheduled in {dependent_term_name}")
 
         return issues
-
-class TermSequenceManager:
-    """Manages term sequences and course scheduling."""
-    
-    def __init__(self):
-        self.term_order = self._generate_term_order()
-    
-    def _generate_term_order(self) -> List[str]:
-        """Generate chronological order of terms."""
-        terms = []
-        
-        # Generate terms from 2020 to 2030
-        for year in range(2020, 2031):
-            year_str = str(year)[2:]  # Last 2 digits
-            terms.extend([
-                f"1{year_str}1",  # Winter (January)
-                f"1{year_str}5",  # Spring (May) 
-                f"1{year_str}9"   # Fall (September)
-            ])
-        
-        return sorted(terms)
-    
-    def get_terms_before(self, target_term: str) -> List[str]:
-        """Get all terms that occur before the target term."""
-        if target_term not in self.term_order:
-            return []
-        
-        target_index = self.term_order.index(target_term)
-        return self.term_order[:target_index]
-    
-    def get_terms_after(self, target_term: str) -> List[str]:
-        """Get all terms that occur after the target term."""
-        if target_term not in self.term_order:
-            return []
-        
-        target_index = self.term_order.index(target_term)
-        return self.term_order[target_index + 1:]
-    
-    def is_term_before(self, term1: str, term2: str) -> bool:
-        """Check if term1 occurs before term2."""
-        try:
-            return self.term_order.index(term1) < self.term_order.index(term2)
-        except ValueError:
-            return False
-    
-    def get_term_name(self, term_code: str) -> str:
-        """Convert term code to readable name."""
-        if len(term_code) != 4:
-            return term_code
-        
-        year = "20" + term_code[1:3]
-        month = term_code[3]
-        
-        season_map = {
-            "1": "Winter",
-            "5": "Spring", 
-            "9": "Fall"
-        }
-        
-        season = season_map.get(month, "Unknown")
-        return f"{season} {year}"
-
- 
\ No newline at end of file
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Requirement Graph
+=================
+Prerequisite/antirequisite adjacency built once from parsed course requirements.
+
+Forward edges answer "what does X list", reverse edges answer "which courses list X",
+so validation checks become set intersections with the courses in a plan instead of
+re-reading every planned course's requirements.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, Mapping
+
+EMPTY: FrozenSet[str] = frozenset()
+
+
+class RequirementGraph:
+    """Forward and reverse prerequisite/antirequisite sets keyed by course code."""
+
+    def __init__(self):
+        self.prerequisites: Dict[str, FrozenSet[str]] = {}
+        self.antirequisites: Dict[str, FrozenSet[str]] = {}
+        self.required_by: Dict[str, FrozenSet[str]] = {}
+        self.antirequisite_of: Dict[str, FrozenSet[str]] = {}
+
+    def add_course(self, course_code: str, parsed_requirements: Mapping[str, Any]) -> None:
+        """Record one course's edges (parsed_requirements as returned by EnhancedPrerequisiteParser)."""
+        if course_code in self.prerequisites:
+            return
+
+        prerequisites = frozenset(
+            course['full_code']
+            for group in parsed_requirements.get('prerequisites', ())
+            for course in group.get('courses', ())
+        )
+        antirequisites = frozenset(parsed_requirements.get('antirequisites', ()))
+
+        self.prerequisites[course_code] = prerequisites
+        self.antirequisites[course_code] = antirequisites
+        # Reverse sets are replaced rather than mutated, so readers never see a set change size
+        for prerequisite in prerequisites:
+            self.required_by[prerequisite] = self.required_by.get(prerequisite, EMPTY) | {course_code}
+        for antirequisite in antirequisites:
+            self.antirequisite_of[antirequisite] = self.antirequisite_of.get(antirequisite, EMPTY) | {course_code}
+
+    def add_courses(self, parsed_by_course: Iterable) -> None:
+        """Record (course_code, parsed_requirements) pairs."""
+        for course_code, parsed_requirements in parsed_by_course:
+            self.add_course(course_code, parsed_requirements)
+
+    def courses_requiring(self, course_code: str) -> FrozenSet[str]:
+        """Courses that list course_code in their prerequisites."""
+        return self.required_by.get(course_code, EMPTY)
+
+    def courses_excluding(self, course_code: str) -> FrozenSet[str]:
+        """Courses that list course_code as an antirequisite."""
+        return self.antirequisite_of.get(course_code, EMPTY)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Requirement Role Index
+======================
+Course -> role in a plan's parsed requirements (category, priority, tags, primary tag
+and colour), compiled in one pass over the requirement rules.
+
+The planner builds one index per plan, so pool items take their categorization and
+tags from a dictionary lookup instead of re-scanning every rule for every course.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Tuple
+
+# Primary tag and colour by the highest-ranking role a course has
+REQUIRED_TAG = ('Required', '#dc3545')  # Red
+CORE_TAG = ('Core', '#fd7e14')  # Orange
+ELECTIVE_TAG = ('Elective', '#28a745')  # Green
+GRADUATE_TAG = ('Graduate', '#6f42c1')  # Purple
+ADVANCED_TAG = ('Advanced', '#17a2b8')  # Teal
+GENERAL_TAG = ('General', '#6c757d')  # Gray
+
+
+@dataclass(frozen=True)
+class CourseRole:
+    """A course's role in one set of program requirements."""
+    category: str
+    priority: int
+    tags: Tuple[str, ...]
+    tag: str
+    tag_color: str
+
+
+class RequirementRoleIndex:
+    """
+    Roles of every course named in a requirements dict (as built by SYDECoursePlanner).
+
+    Precedence matches the rule order: compulsory courses, then the first compulsory
+    choice group, then the first elective group naming the course (its 'courses' before
+    'specified_list' before 'elective_list'). Courses not named anywhere get a general
+    role based only on their level.
+    """
+
+    def __init__(self, requirements: Dict, course_level: Callable[[str], int]):
+        self.course_level = course_level
+
+        categories: Dict[str, Tuple[str, int]] = {}
+        tags: Dict[str, List[str]] = {}
+        primary_tags: Dict[str, Tuple[str, str]] = {}
+
+        for course_code in requirements.get('compulsory_courses', []):
+            categories.setdefault(course_code, ('compulsory', 10))
+            tags.setdefault(course_code, ['Required', 'Core'])
+            primary_tags.setdefault(course_code, REQUIRED_TAG)
+
+        for choice_group in requirements.get('compulsory_choices', []):
+            choose_tag = f"Choose {choice_group.get('n_to_choose', 1)}"
+            for course_code in dict.fromkeys(choice_group.get('courses', [])):
+                categories.setdefault(course_code, ('compulsory_choice', 9))
+                tags.setdefault(course_code, []).extend(('Choice Required', choose_tag))
+                primary_tags.setdefault(course_code, CORE_TAG)
+
+        for elective_group in requirements.get('elective_requirements', []):
+            group_name = elective_group.get('group_name', 'Elective')
+            # A course's first matching list within the group decides its role there
+            group_roles: Dict[str, Tuple[Tuple[str, int], Tuple[str, ...]]] = {}
+            for course_code in elective_group.get('courses', []):
+                group_roles.setdefault(course_code, (('specified_elective', 8), ('Elective', group_name)))
+                primary_tags.setdefault(course_code, ELECTIVE_TAG)
+            for course_code in elective_group.get('specified_list', []):
+                group_roles.setdefault(course_code, (('specified_elective', 7), ('Specified Elective', group_name)))
+            for course_code in elective_group.get('elective_list', []):
+                group_roles.setdefault(course_code, (('general_elective', 6), ('General Elective',)))
+            for course_code, (category, group_tags) in group_roles.items():
+                categories.setdefault(course_code, category)
+                tags.setdefault(course_code, []).extend(group_tags)
+
+        self.course_codes: FrozenSet[str] = frozenset(categories)
+        self._roles: Dict[str, CourseRole] = {}
+        for course_code, (category, priority) in categories.items():
+            level_tags, level_tag = self._level_tags(course_code)
+            tag, tag_color = primary_tags.get(course_code, level_tag)
+            self._roles[course_code] = CourseRole(category, priority, tuple(tags.get(course_code, ())) + level_tags, tag, tag_color)
+
+    def _level_tags(self, course_code: str) -> Tuple[Tuple[str, ...], Tuple[str, str]]:
+        """Level tags and level-based primary tag of a course."""
+        course_level = self.course_level(course_code)
+        if course_level >= 6:
+            return ('Graduate Level',), GRADUATE_TAG
+        if course_level == 5:
+            return ('Advanced Undergraduate',), ADVANCED_TAG
+        return (), GENERAL_TAG
+
+    def role(self, course_code: str) -> CourseRole:
+        """Role of a course; courses outside the requirements are general electives."""
+        role = self._roles.get(course_code)
+        if role is None:
+            level_tags, (tag, tag_color) = self._level_tags(course_code)
+            role = CourseRole('general_elective', 5, level_tags, tag, tag_color)
+        return role
@@ -0,0 +1,615 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Plan Scheduler
+==============
+Fills the semester board automatically: picks courses from a plan's pool and places
+them in its terms so that every placement passes CourseValidator and the program's
+requirements are met.
+
+Constraints:
+    - compulsory courses, n_to_choose choice groups and elective groups with a course list
+    - the program's total course count (as far as the board's capacity allows)
+    - offerings (confirmed or predicted) in the placed term
+    - prerequisites placed in an earlier term (not enforced for 500-level courses, as in
+      the validator), no antirequisite pairs, no course placed after a course requiring it
+    - per-term capacity
+    - level_constraints (max_500_level) and departmental minimums (min_dept_courses,
+      min_<subject>_courses)
+
+Constraint propagation narrows every course to the terms it is offered in and tightens
+each course's earliest term through its prerequisite chains, dropping courses that can
+no longer be placed. A depth-first search then fills the terms in order, trying the most
+urgent courses first and pruning partial plans that can no longer meet the requirements,
+until the search is exhausted or the time budget runs out. The best complete plan found
+wins: fewest terms used, then most confirmed offerings, then highest pool priority.
+
+PlanScheduler.alternatives lists the k best distinct plans under a weighted PlanObjective
+with a beam search over term-by-term partial plans. Partial plans that place the same
+courses (and so satisfy requirements equally) lead to the same completions; only the
+best-scoring one of each is kept in the beam.
+"""
+
+import itertools
+import math
+import re
+import time
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.term_helpers import term_ordinal
+from .availability import CONFIRMED, NOT_OFFERED
+
+# Departmental minimums on one subject, e.g. min_syde_courses
+SUBJECT_MINIMUM_PATTERN = re.compile(r'min_([a-z]+)_courses')
+# Course codes inside requirement list entries; legacy program files list electives as
+# descriptions such as "CIVE 507 - Building Science ... or CIVE 707 - Advanced Building Science"
+COURSE_CODE_PATTERN = re.compile(r'\b[A-Z]{2,6}\s+\d{3}[A-Z]?\b')
+
+
+@dataclass(frozen=True)
+class CourseRequirement:
+    """At least ``minimum`` of ``courses`` must be completed or planned."""
+    description: str
+    courses: FrozenSet[str]
+    minimum: int
+
+
+@dataclass(frozen=True)
+class PlanObjective:
+    """
+    Weights of the plan ranking used by PlanScheduler.alternatives (higher scores are better).
+
+    A plan scores -fewest_terms per term used, +confirmed_offerings per placement in a
+    term with a confirmed offering, -balanced_load per course between the fullest and
+    emptiest used term, +preferred_courses per preferred course and +pool_priority per
+    point of pool priority.
+    """
+    fewest_terms: float = 10.0
+    confirmed_offerings: float = 2.0
+    balanced_load: float = 1.0
+    preferred_courses: float = 3.0
+    pool_priority: float = 0.1
+    preferred: FrozenSet[str] = field(default_factory=frozenset)
+
+    @classmethod
+    def from_dict(cls, weights: Optional[Dict[str, Any]], preferred: Iterable[str] = ()) -> 'PlanObjective':
+        """
+        Objective from request weights (missing weights keep their defaults).
+
+        Raises:
+            ValueError: For an unknown weight or a weight that is not a non-negative number
+        """
+        names = {f.name for f in fields(cls)} - {'preferred'}
+        weights = dict(weights or {})
+        for name, value in weights.items():
+            if name not in names:
+                raise ValueError(f"Unknown objective weight: {name}. Expected one of {sorted(names)}")
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                raise ValueError(f"Objective weight '{name}' must be a non-negative number")
+        return cls(preferred=frozenset(preferred), **{name: float(value) for name, value in weights.items()})
+
+    def metrics(self, problem: 'SchedulingProblem', placed: Dict[str, int], terms_used: Optional[int] = None) -> Dict[str, int]:
+        """Plan measures the objective weighs; terms_used overrides the plan's own (for partial plans)."""
+        loads = [0] * (max(placed.values(), default=-1) + 1)
+        for term in placed.values():
+            loads[term] += 1
+        return {
+            'terms_used': len(loads) if terms_used is None else terms_used,
+            'confirmed_offerings': sum(1 for code, term in placed.items() if term in problem.confirmed[code]),
+            'load_imbalance': max(loads) - min(loads) if loads else 0,
+            'preferred_courses': sum(1 for code in placed if code in self.preferred),
+            'priority': sum(problem.priority[code] for code in placed),
+        }
+
+    def score(self, metrics: Dict[str, int]) -> float:
+        """Weighted score of plan metrics."""
+        return (self.confirmed_offerings * metrics['confirmed_offerings']
+                + self.preferred_courses * metrics['preferred_courses']
+                + self.pool_priority * metrics['priority']
+                - self.fewest_terms * metrics['terms_used']
+                - self.balanced_load * metrics['load_imbalance'])
+
+
+class SchedulingProblem:
+    """
+    A plan's requirements, pool and terms compiled into the lookups the search reads.
+
+    Completed courses count toward every requirement and are never placed again.
+    """
+
+    def __init__(self, course_validator, requirements: Dict[str, Any], course_pool: Sequence[Dict[str, Any]],
+                 term_codes: Sequence[str], completed_courses: Optional[Dict[str, List[str]]] = None,
+                 program_subjects: Iterable[str] = (), max_courses_per_term: int = 3):
+        """
+        Args:
+            course_validator: CourseValidator of the plan's program
+            requirements: requirements_summary of the plan
+            course_pool: Pool items of the plan (in pool order), already filtered to courses
+                the program allows
+            term_codes: Board terms, in order
+            completed_courses: Dict mapping term_code -> list of completed course codes
+            program_subjects: Subject codes of the program (for min_dept_courses)
+            max_courses_per_term: Maximum courses allowed per term (default: 3)
+        """
+        completed_courses = completed_courses or {}
+        course_loader = course_validator.course_loader
+        graph = course_validator.requirement_graph
+
+        self.term_codes = list(term_codes)
+        term_ordinals = [term_ordinal(term_code) for term_code in self.term_codes]
+        self.completed: Dict[str, int] = {}
+        for term_code, courses in completed_courses.items():
+            for code in courses:
+                self.completed[code] = min(self.completed.get(code, term_ordinal(term_code)), term_ordinal(term_code))
+        # First board term each completed course counts as a prior course for
+        self.completed_ready = {code: sum(1 for ordinal in term_ordinals if ordinal <= completed_ordinal)
+                                for code, completed_ordinal in self.completed.items()}
+        self.capacity = [max(0, max_courses_per_term - len(completed_courses.get(term_code, [])))
+                         for term_code in self.term_codes]
+
+        items = [item for item in course_pool if item['course']['course_code'] not in self.completed]
+        self.candidates: List[str] = [item['course']['course_code'] for item in items]
+        self.rank = {code: i for i, code in enumerate(self.candidates)}
+        self.priority = {item['course']['course_code']: item['priority'] for item in items}
+
+        status, _ = course_loader.predict_offerings(self.candidates, self.term_codes)
+        self.offered = {code: tuple(np.flatnonzero(row != NOT_OFFERED).tolist())
+                        for code, row in zip(self.candidates, status)}
+        self.confirmed = {code: frozenset(np.flatnonzero(row == CONFIRMED).tolist())
+                          for code, row in zip(self.candidates, status)}
+
+        self.level5 = frozenset(code for code in self.candidates if course_validator._get_course_level(code) == 5)
+        self.groups: Dict[str, List[FrozenSet[str]]] = {}
+        self.conflicts: Dict[str, FrozenSet[str]] = {}
+        self.required_by: Dict[str, FrozenSet[str]] = {}
+        self.latest: Dict[str, int] = {}
+        for item in items:
+            code = item['course']['course_code']
+            groups = []
+            if code not in self.level5:  # 500-level prerequisites are only recommended
+                for prereq in item['prerequisites']:
+                    if prereq['type'] == 'required':
+                        groups.append(frozenset([prereq['courses'][0]['full_code']]))
+                    elif prereq['type'] == 'one_of':
+                        groups.append(frozenset(entry['full_code'] for entry in prereq['courses']))
+            self.groups[code] = groups
+            excluding = {other for other in graph.courses_excluding(code) if other in course_loader.courses}
+            self.conflicts[code] = frozenset(set(item['antirequisites']) | excluding) - {code}
+            self.required_by[code] = frozenset(other for other in graph.courses_requiring(code)
+                                               if other != code and other in course_loader.courses)
+            # Last term before any completed course requiring it (placing it after one is invalid)
+            self.latest[code] = min((self.completed_ready[other] - 1 for other in self.required_by[code]
+                                     if other in self.completed_ready), default=len(self.term_codes) - 1)
+
+        # Requirements still open after the completed courses
+        completed_set = set(self.completed)
+        self.compulsory = frozenset(requirements.get('compulsory_courses', [])) - completed_set
+        self.requirements: List[CourseRequirement] = []
+        for group in requirements.get('compulsory_choices', []):
+            self._add_requirement(group.get('group_name', 'Choice Group'), group.get('courses', []),
+                                  group.get('n_to_choose', 1))
+        for group in requirements.get('elective_requirements', []):
+            if group.get('courses'):  # groups without a list only count toward the total
+                self._add_requirement(group.get('group_name', 'Electives'), group['courses'], group.get('n_to_choose', 1))
+
+        constraints = requirements.get('constraints') or {}
+        departmental = constraints.get('departmental_constraints') or {}
+        program_subjects = tuple(program_subjects)
+        for key, minimum in departmental.items():
+            match = SUBJECT_MINIMUM_PATTERN.fullmatch(key)
+            if key == 'min_dept_courses':
+                subjects = program_subjects
+            elif match and match.group(1).upper() in program_subjects:
+                subjects = (match.group(1).upper(),)
+            else:
+                continue  # not expressible as a course count over known subjects
+            self._add_requirement(departmental.get('description', key), self._subject_courses(subjects, completed_set),
+                                  minimum)
+
+        max_500_level = (constraints.get('level_constraints') or {}).get('max_500_level')
+        self.level5_budget: Optional[int] = None
+        if max_500_level is not None:
+            completed_level5 = sum(1 for code in self.completed if course_validator._get_course_level(code) == 5)
+            self.level5_budget = max(0, max_500_level - completed_level5)
+
+        self.total_needed = max(0, requirements.get('total_courses', 8) - len(self.completed))
+        self.target = min(self.total_needed, sum(self.capacity), len(self.candidates))
+
+    def _add_requirement(self, description: str, courses: Iterable[str], minimum: int) -> None:
+        courses = frozenset(code for entry in courses for code in COURSE_CODE_PATTERN.findall(entry))
+        remaining = minimum - len(courses & set(self.completed))
+        if remaining > 0:
+            self.requirements.append(CourseRequirement(description, courses & set(self.candidates), remaining))
+
+    def _subject_courses(self, subjects: Tuple[str, ...], completed: Iterable[str]) -> List[str]:
+        """Candidate and completed courses in any of the subjects."""
+        return [code for code in itertools.chain(self.candidates, completed) if code.split(' ')[0] in subjects]
+
+    # --- Propagation ---
+
+    def earliest_terms(self, placed: Dict[str, int], next_term: int) -> Dict[str, int]:
+        """
+        Earliest board term (index) each unplaced course can still take, given placements
+        in terms before next_term; courses that can no longer be placed are left out.
+
+        Each course's earliest term is its first offered term no earlier than one term after
+        some option of each prerequisite group, iterated to a fixpoint over the chains.
+        """
+        num_terms = len(self.term_codes)
+        level5_full = self.level5_budget is not None and \
+            sum(1 for code in placed if code in self.level5) >= self.level5_budget
+
+        earliest: Dict[str, int] = {}
+        for code in self.candidates:
+            if code in placed:
+                continue
+            if level5_full and code in self.level5:
+                continue
+            if any(other in placed or other in self.completed for other in self.conflicts[code]):
+                continue
+            # A course requiring this one is already placed in an earlier term
+            if not self.required_by[code].isdisjoint(placed) or self.latest[code] < next_term:
+                continue
+            earliest[code] = next_term
+
+        changed = True
+        while changed:
+            changed = False
+            for code in list(earliest):
+                bound = next_term
+                for group in self.groups[code]:
+                    bound = max(bound, min((self._ready_term(option, placed, earliest) for option in group),
+                                           default=num_terms))
+                term = next((t for t in self.offered[code] if t >= bound), num_terms)
+                if term > self.latest[code]:
+                    del earliest[code]
+                    changed = True
+                elif term != earliest[code]:
+                    earliest[code] = term
+                    changed = True
+        return earliest
+
+    def _ready_term(self, code: str, placed: Dict[str, int], earliest: Dict[str, int]) -> int:
+        """First board term in which code counts as a prior course."""
+        if code in self.completed_ready:
+            return self.completed_ready[code]
+        if code in placed:
+            return placed[code] + 1
+        if code in earliest:
+            return earliest[code] + 1
+        return len(self.term_codes)
+
+    def feasible(self, placed: Dict[str, int], next_term: int, earliest: Dict[str, int]) -> bool:
+        """False if the partial plan can no longer be completed (a necessary check only)."""
+        needed = self.target - len(placed)
+        if needed > sum(self.capacity[next_term:]) or needed > len(earliest):
+            return False
+        open_compulsory = self.compulsory - placed.keys()
+        if len(open_compulsory) > needed or not open_compulsory <= earliest.keys():
+            return False
+        for requirement in self.requirements:
+            have = sum(1 for code in requirement.courses if code in placed)
+            shortfall = requirement.minimum - have
+            if shortfall > 0 and (shortfall > needed or
+                                  shortfall > sum(1 for code in requirement.courses if code in earliest)):
+                return False
+        return True
+
+    def meets_requirements(self, placed: Dict[str, int]) -> bool:
+        """Every compulsory course, group and departmental minimum is met."""
+        return self.compulsory <= placed.keys() and all(
+            sum(1 for code in requirement.courses if code in placed) >= requirement.minimum
+            for requirement in self.requirements
+        )
+
+    def satisfaction(self, placed: Dict[str, int]) -> Tuple[int, ...]:
+        """Requirement-satisfaction vector: compulsory courses placed, then each group's count (capped at its minimum)."""
+        return (len(self.compulsory & placed.keys()),) + tuple(
+            min(requirement.minimum, sum(1 for code in requirement.courses if code in placed))
+            for requirement in self.requirements
+        )
+
+    def unmet(self, placed: Dict[str, int]) -> List[str]:
+        """Requirements a (final) plan leaves unmet."""
+        issues = [f"Compulsory course {code} could not be scheduled" for code in sorted(self.compulsory - placed.keys())]
+        for requirement in self.requirements:
+            have = sum(1 for code in requirement.courses if code in placed)
+            if have < requirement.minimum:
+                issues.append(f"{requirement.description}: {requirement.minimum - have} more course(s) needed")
+        if len(placed) < self.total_needed:
+            issues.append(f"{self.total_needed - len(placed)} more course(s) needed to reach the program total")
+        return issues
+
+    def score(self, placed: Dict[str, int]) -> Tuple[int, int, int]:
+        """Ranking of a plan (higher is better): fewest terms used, confirmed offerings, pool priority."""
+        last_term = max(placed.values(), default=-1)
+        confirmed = sum(1 for code, term in placed.items() if term in self.confirmed[code])
+        return (-(last_term + 1), confirmed, sum(self.priority[code] for code in placed))
+
+    def min_terms_used(self, placed: Dict[str, int], next_term: int) -> int:
+        """Fewest terms a completion of a partial plan can use (filling later terms to capacity)."""
+        last_term = max(placed.values(), default=-1)
+        remaining = self.target - len(placed)
+        term = next_term - 1
+        while remaining > 0 and term + 1 < len(self.term_codes):
+            term += 1
+            remaining -= self.capacity[term]
+        return max(last_term, term if self.target > len(placed) else -1) + 1
+
+    def score_bound(self, placed: Dict[str, int], next_term: int, earliest: Dict[str, int]) -> Tuple[int, int, int]:
+        """Highest score any completion of a partial plan can reach (for pruning)."""
+        needed = self.target - len(placed)
+        _, confirmed, priority = self.score(placed)
+        confirmable = sum(1 for code, first_term in earliest.items()
+                          if any(t >= first_term for t in self.confirmed[code]))
+        best_priorities = sorted((self.priority[code] for code in earliest), reverse=True)[:needed]
+        return (-self.min_terms_used(placed, next_term), confirmed + min(needed, confirmable), priority + sum(best_priorities))
+
+    def urgency_key(self, placed: Dict[str, int], next_term: int):
+        """Sort key putting the courses most in need of a place first."""
+        short = set()
+        for requirement in self.requirements:
+            if sum(1 for code in requirement.courses if code in placed) < requirement.minimum:
+                short.update(requirement.courses)
+
+        def key(code: str) -> Tuple:
+            remaining_terms = sum(1 for term in self.offered[code] if term >= next_term)
+            return (code not in self.compulsory, code not in short, -self.priority[code], remaining_terms, self.rank[code])
+        return key
+
+    def compatible(self, courses: Sequence[str], placed: Dict[str, int]) -> bool:
+        """True if the courses can share a term: no antirequisite pair, within the 500-level budget."""
+        for i, code in enumerate(courses):
+            if not self.conflicts[code].isdisjoint(courses[i + 1:]):
+                return False
+        if self.level5_budget is not None:
+            level5 = sum(1 for code in itertools.chain(placed, courses) if code in self.level5)
+            if level5 > self.level5_budget:
+                return False
+        return True
+
+    def plan_of(self, placed: Dict[str, int]) -> Dict[str, List[str]]:
+        """Term code -> placed courses (in pool order) for every board term."""
+        plan = {term_code: [] for term_code in self.term_codes}
+        for code in sorted(placed, key=self.rank.get):
+            plan[self.term_codes[placed[code]]].append(code)
+        return plan
+
+
+class PlanScheduler:
+    """Builds complete plans for a program's board (see the module docstring)."""
+
+    def __init__(self, course_validator, time_budget: float = 0.5):
+        """
+        Args:
+            course_validator: CourseValidator of the plan's program
+            time_budget: Seconds the search may run before returning its best plan
+        """
+        self.course_validator = course_validator
+        self.time_budget = time_budget
+
+    def schedule(self, problem: SchedulingProblem, time_budget: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Best plan found within the time budget.
+
+        Returns:
+            {'complete', 'plan': {term_code: [course codes]}, 'unmet': [issues],
+             'score': {...}, 'search': {'nodes', 'elapsed_ms', 'exhausted'}}
+            If no plan meets every requirement, a greedy plan with valid placements is
+            returned with the requirements it leaves unmet.
+        """
+        budget = self.time_budget if time_budget is None else time_budget
+        search = _DepthFirstSearch(problem, time.perf_counter() + budget)
+        started = time.perf_counter()
+        search.run()
+        placed = search.best if search.best is not None else self._greedy(problem)
+        return self._result(problem, placed, {
+            'nodes': search.nodes,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 3),
+            'exhausted': not search.timed_out,
+        })
+
+    def alternatives(self, problem: SchedulingProblem, k: int = 3, objective: Optional[PlanObjective] = None,
+                     beam_width: int = 32, time_budget: Optional[float] = None) -> Dict[str, Any]:
+        """
+        The k best distinct complete plans under an objective, by beam search.
+
+        Returns:
+            {'plans': [{'plan', 'score', 'metrics'}, ...] best first (fewer than k, or none,
+             if fewer complete plans were found), 'search': {'states', 'elapsed_ms', 'exhausted'}}
+        """
+        objective = objective or PlanObjective()
+        budget = self.time_budget if time_budget is None else time_budget
+        search = _BeamSearch(problem, objective, beam_width, time.perf_counter() + budget)
+        started = time.perf_counter()
+        finished = search.run(k)
+        plans = []
+        for score, placed in finished:
+            plans.append({
+                'plan': problem.plan_of(placed),
+                'score': round(score, 6),
+                'metrics': objective.metrics(problem, placed),
+            })
+        return {
+            'plans': plans,
+            'search': {
+                'states': search.states,
+                'elapsed_ms': round((time.perf_counter() - started) * 1000, 3),
+                'exhausted': not search.timed_out,
+            },
+        }
+
+    def _greedy(self, problem: SchedulingProblem) -> Dict[str, int]:
+        """Fill terms in order with the most urgent placeable courses, ignoring unmet requirements."""
+        placed: Dict[str, int] = {}
+        for term in range(len(problem.term_codes)):
+            earliest = problem.earliest_terms(placed, term)
+            chosen: List[str] = []
+            for code in sorted((c for c, t in earliest.items() if t == term), key=problem.urgency_key(placed, term)):
+                if len(chosen) >= problem.capacity[term] or len(placed) + len(chosen) >= problem.target:
+                    break
+                if problem.compatible(chosen + [code], placed):
+                    chosen.append(code)
+            placed.update((code, term) for code in chosen)
+        return placed
+
+    def _result(self, problem: SchedulingProblem, placed: Dict[str, int], search: Dict[str, Any]) -> Dict[str, Any]:
+        unmet = problem.unmet(placed)
+        terms_used, confirmed, priority = problem.score(placed)
+        return {
+            'complete': not unmet,
+            'plan': problem.plan_of(placed),
+            'unmet': unmet,
+            'score': {'terms_used': -terms_used, 'confirmed_offerings': confirmed, 'priority': priority},
+            'search': search,
+        }
+
+
+class _DepthFirstSearch:
+    """Term-by-term branch and prune over one SchedulingProblem."""
+
+    def __init__(self, problem: SchedulingProblem, deadline: float):
+        self.problem = problem
+        self.deadline = deadline
+        self.best: Optional[Dict[str, int]] = None
+        self.best_score = None
+        self.nodes = 0
+        self.timed_out = False
+
+    def run(self) -> None:
+        self._visit({}, 0)
+
+    def _visit(self, placed: Dict[str, int], term: int) -> None:
+        problem = self.problem
+        self.nodes += 1
+        if time.perf_counter() > self.deadline:
+            self.timed_out = True
+            return
+
+        needed = problem.target - len(placed)
+        if needed == 0 or term == len(problem.term_codes):
+            if needed == 0 and problem.meets_requirements(placed):
+                score = problem.score(placed)
+                if self.best_score is None or score > self.best_score:
+                    self.best, self.best_score = dict(placed), score
+            return
+        # No plan using more terms can beat the best one found
+        if self.best_score is not None and -self.best_score[0] <= term:
+            return
+
+        earliest = problem.earliest_terms(placed, term)
+        if not problem.feasible(placed, term, earliest):
+            return
+        if self.best_score is not None and problem.score_bound(placed, term, earliest) <= self.best_score:
+            return
+
+        eligible = sorted((code for code, t in earliest.items() if t == term), key=problem.urgency_key(placed, term))
+        remaining_capacity = sum(problem.capacity[term + 1:])
+        largest = min(problem.capacity[term], len(eligible), needed)
+        smallest = max(0, needed - remaining_capacity)
+        for size in range(largest, smallest - 1, -1):
+            for courses in itertools.combinations(eligible, size):
+                if not problem.compatible(courses, placed):
+                    continue
+                placed.update((code, term) for code in courses)
+                self._visit(placed, term + 1)
+                for code in courses:
+                    del placed[code]
+                if self.timed_out:
+                    return
+
+
+class _BeamSearch:
+    """
+    Term-by-term beam over partial plans, deduplicated by placed courses and requirement satisfaction.
+
+    Equal scores are ordered by the plans' placements (course code, term), never by the order the
+    plans were generated in, so which plans survive a full beam is the same in every process.
+    """
+
+    def __init__(self, problem: SchedulingProblem, objective: PlanObjective, beam_width: int, deadline: float):
+        self.problem = problem
+        self.objective = objective
+        self.beam_width = beam_width
+        self.deadline = deadline
+        self.states = 0
+        self.timed_out = False
+
+    def run(self, k: int) -> List[Tuple[float, Dict[str, int]]]:
+        """Best-first (score, placements) of up to k distinct complete plans."""
+        problem = self.problem
+        finished: Dict[FrozenSet, Tuple[float, Dict[str, int]]] = {}
+        if problem.target == 0 and problem.meets_requirements({}):
+            finished[frozenset()] = (self._final_score({}), {})
+        earliest = problem.earliest_terms({}, 0)
+        beam = [({}, earliest)] if problem.feasible({}, 0, earliest) else []
+
+        for term in range(len(problem.term_codes)):
+            layer: Dict[Tuple, Tuple[float, Dict[str, int]]] = {}
+            for placed, earliest in beam:
+                if time.perf_counter() > self.deadline:
+                    self.timed_out = True
+                    break
+                for child in self._children(placed, term, earliest):
+                    self.states += 1
+                    if len(child) == problem.target:
+                        if problem.meets_requirements(child):
+                            finished.setdefault(frozenset(child.items()), (self._final_score(child), child))
+                        continue
+                    # Completions depend only on which courses are placed, not on where
+                    key = (frozenset(child), problem.satisfaction(child))
+                    entry = (self._estimate(child, term + 1), child)
+                    if key not in layer or self._order(entry) < self._order(layer[key]):
+                        layer[key] = entry
+            if self.timed_out or term + 1 == len(problem.term_codes):
+                break
+            beam = self._select(layer.values(), term + 1)
+            if not beam:
+                break
+
+        return sorted(finished.values(), key=self._order)[:k]
+
+    @staticmethod
+    def _order(entry: Tuple[float, Dict[str, int]]) -> Tuple:
+        """Sort key of a (score, placements) entry: best score first, then by placements."""
+        return -entry[0], sorted(entry[1].items())
+
+    def _select(self, layer: Iterable[Tuple[float, Dict[str, int]]], next_term: int):
+        """Best beam_width partial plans that can still be completed, with their propagated earliest terms."""
+        beam = []
+        for _, child in sorted(layer, key=self._order):
+            if len(beam) == self.beam_width:
+                break
+            if time.perf_counter() > self.deadline:
+                self.timed_out = True
+                break
+            earliest = self.problem.earliest_terms(child, next_term)
+            if self.problem.feasible(child, next_term, earliest):
+                beam.append((child, earliest))
+        return beam
+
+    def _children(self, placed: Dict[str, int], term: int, earliest: Dict[str, int]):
+        """Partial plans extending placed with one choice of courses for term, most urgent choices first."""
+        problem = self.problem
+        needed = problem.target - len(placed)
+        eligible = sorted((code for code, t in earliest.items() if t == term), key=problem.urgency_key(placed, term))
+        largest = min(problem.capacity[term], len(eligible), needed)
+        smallest = max(0, needed - sum(problem.capacity[term + 1:]))
+        for size in range(largest, smallest - 1, -1):
+            # Each state contributes at most beam_width choices per size
+            for courses in itertools.islice(itertools.combinations(eligible, size), self.beam_width):
+                if problem.compatible(courses, placed):
+                    child = dict(placed)
+                    child.update((code, term) for code in courses)
+                    yield child
+
+    def _estimate(self, placed: Dict[str, int], next_term: int) -> float:
+        """Score of a partial plan, counting the fewest terms a completion can use."""
+        terms_used = self.problem.min_terms_used(placed, next_term)
+        return self.objective.score(self.objective.metrics(self.problem, placed, terms_used))
+
+    def _final_score(self, placed: Dict[str, int]) -> float:
+        return self.objective.score(self.objective.metrics(self.problem, placed))
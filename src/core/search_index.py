@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Course Search Index
+===================
+In-memory BM25 index over the title and description of every course in the catalog
+(every subject, not only the programs that are loaded).
+
+Each course is one document. Title tokens (and the course code) count TITLE_WEIGHT
+times per occurrence, description tokens once, and a document's length is its weighted
+token count. Because the corpus is fixed once built, every posting stores its final
+BM25 contribution
+
+    idf(t) * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / average length))
+
+so a query only adds the postings of its tokens into one score array. The postings are
+compressed-row numpy arrays (offsets, course rows, scores); filters on subject, level,
+career and offered term are vectorized over the matching rows.
+
+Usage:
+    python -m src.core.search_index QUERY [--subject SYDE] [--level 600] [--career GRD] [--term 1249]
+"""
+
+import argparse
+import re
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.term_helpers import term_ordinal
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# Words too common in course text to help ranking
+STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into", "is", "it",
+    "its", "of", "on", "or", "such", "that", "the", "their", "these", "this", "to", "with",
+})
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Occurrences of a token in the title (or course code) count this many times
+TITLE_WEIGHT = 3.0
+DEFAULT_SEARCH_LIMIT = 20
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower-case alphanumeric tokens of a text, without stop words."""
+    if not text:
+        return []
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def course_level(catalog_number: str) -> int:
+    """Level of a catalog number in hundreds (e.g., "660A" -> 600; 0 if it has no digit)."""
+    match = re.match(r"\D*(\d)", catalog_number or "")
+    return int(match.group(1)) * 100 if match else 0
+
+
+class CourseSearchIndex:
+    """BM25 inverted index with per-course filter columns (see the module docstring)."""
+
+    def __init__(self, documents: Iterable[Tuple[str, Dict[str, Any], Sequence[str]]]):
+        """
+        Args:
+            documents: (course_code, Course fields, offered term codes) for every course;
+                the first record of a course code wins
+        """
+        records: Dict[str, Tuple[Dict[str, Any], Sequence[str]]] = {}
+        for course_code, fields, term_codes in documents:
+            records.setdefault(course_code, (fields, term_codes))
+
+        # Rows in course code order, so equal scores rank alphabetically
+        self.course_codes: List[str] = sorted(records)
+        self.titles: List[str] = [records[code][0]["title"] or "" for code in self.course_codes]
+        self.subject_codes = sorted({records[code][0]["subject_code"] for code in self.course_codes})
+        self.careers = sorted({records[code][0]["academic_career"] or "" for code in self.course_codes})
+        self.term_codes = sorted({term for code in self.course_codes for term in records[code][1]}, key=term_ordinal)
+
+        self.subject_ids: Dict[str, int] = {subject: i for i, subject in enumerate(self.subject_codes)}
+        self.career_ids: Dict[str, int] = {career: i for i, career in enumerate(self.careers)}
+        self.term_index: Dict[str, int] = {term: j for j, term in enumerate(self.term_codes)}
+
+        num_courses = len(self.course_codes)
+        self.subject = np.empty(num_courses, dtype=np.int32)
+        self.career = np.empty(num_courses, dtype=np.int32)
+        self.level = np.empty(num_courses, dtype=np.int32)
+        self.offered = np.zeros((num_courses, len(self.term_codes)), dtype=bool)
+        lengths = np.zeros(num_courses, dtype=np.float32)
+        frequencies: Dict[str, Dict[int, float]] = defaultdict(dict)
+
+        for row, course_code in enumerate(self.course_codes):
+            fields, term_codes = records[course_code]
+            self.subject[row] = self.subject_ids[fields["subject_code"]]
+            self.career[row] = self.career_ids[fields["academic_career"] or ""]
+            self.level[row] = course_level(fields["catalog_number"])
+            for term_code in term_codes:
+                self.offered[row, self.term_index[term_code]] = True
+
+            weighted = [(token, TITLE_WEIGHT) for token in tokenize(f"{course_code} {fields['title']}")]
+            weighted += [(token, 1.0) for token in tokenize(fields["description"])]
+            for token, weight in weighted:
+                postings = frequencies[token]
+                postings[row] = postings.get(row, 0.0) + weight
+                lengths[row] += weight
+
+        average_length = float(lengths.mean()) if num_courses and lengths.any() else 1.0
+        length_norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / average_length)
+
+        self.vocabulary: Dict[str, int] = {}
+        offsets = [0]
+        rows_parts, score_parts = [], []
+        for token, postings in frequencies.items():
+            rows = np.fromiter(postings.keys(), dtype=np.int32, count=len(postings))
+            tf = np.fromiter(postings.values(), dtype=np.float32, count=len(postings))
+            idf = np.log(1.0 + (num_courses - len(rows) + 0.5) / (len(rows) + 0.5))
+            self.vocabulary[token] = len(self.vocabulary)
+            rows_parts.append(rows)
+            score_parts.append((idf * tf * (BM25_K1 + 1) / (tf + length_norm[rows])).astype(np.float32))
+            offsets.append(offsets[-1] + len(rows))
+
+        self.posting_offsets = np.array(offsets, dtype=np.int64)
+        self.posting_rows = np.concatenate(rows_parts) if rows_parts else np.zeros(0, dtype=np.int32)
+        self.posting_scores = np.concatenate(score_parts) if score_parts else np.zeros(0, dtype=np.float32)
+        for array in (self.subject, self.career, self.level, self.offered, self.posting_offsets,
+                      self.posting_rows, self.posting_scores):
+            array.setflags(write=False)
+
+    def __len__(self) -> int:
+        return len(self.course_codes)
+
+    def search(self, query: str, subject: Optional[str] = None, level: Optional[int] = None,
+               career: Optional[str] = None, term: Optional[str] = None,
+               limit: int = DEFAULT_SEARCH_LIMIT) -> Dict[str, Any]:
+        """
+        Rank the courses matching any query token by BM25 score.
+
+        Args:
+            query: Free text; course codes match too (e.g., "SYDE 675")
+            subject: Only courses of this subject code
+            level: Only courses of this level in hundreds (e.g., 600)
+            career: Only courses of this academic career (e.g., "GRD" or "UG")
+            term: Only courses offered (confirmed) in this term code
+            limit: Number of results to return
+
+        Returns:
+            {'total': matching courses, 'results': [{course_code, title, subject_code,
+            academic_career, level, score}, ...]} best first
+        """
+        scores = np.zeros(len(self.course_codes), dtype=np.float32)
+        for token in set(tokenize(query)):
+            token_id = self.vocabulary.get(token)
+            if token_id is not None:
+                start, end = self.posting_offsets[token_id], self.posting_offsets[token_id + 1]
+                scores[self.posting_rows[start:end]] += self.posting_scores[start:end]
+
+        rows = np.flatnonzero(scores)
+        if subject is not None:
+            rows = self._filter(rows, self.subject, self.subject_ids.get(subject.upper()))
+        if career is not None:
+            rows = self._filter(rows, self.career, self.career_ids.get(career.upper()))
+        if level is not None:
+            rows = rows[self.level[rows] == level]
+        if term is not None:
+            column = self.term_index.get(term)
+            rows = rows[self.offered[rows, column]] if column is not None else rows[:0]
+
+        total = len(rows)
+        if total > limit:
+            rows = rows[np.argpartition(-scores[rows], limit - 1)[:limit]] if limit > 0 else rows[:0]
+        # Best score first; ties keep course code order
+        ranked = rows[np.lexsort((rows, -scores[rows]))]
+        return {
+            'total': total,
+            'results': [self._result(int(row), float(scores[row])) for row in ranked],
+        }
+
+    def _filter(self, rows: np.ndarray, column: np.ndarray, value_id: Optional[int]) -> np.ndarray:
+        return rows[column[rows] == value_id] if value_id is not None else rows[:0]
+
+    def _result(self, row: int, score: float) -> Dict[str, Any]:
+        return {
+            'course_code': self.course_codes[row],
+            'title': self.titles[row],
+            'subject_code': self.subject_codes[self.subject[row]],
+            'academic_career': self.careers[self.career[row]],
+            'level': int(self.level[row]),
+            'score': round(score, 4),
+        }
+
+
+def main() -> None:
+    from .planner import CourseCatalog
+
+    parser = argparse.ArgumentParser(description="Search every course in the catalog.")
+    parser.add_argument("query", help="Search text")
+    parser.add_argument("--subject", help="Subject code filter (e.g., SYDE)")
+    parser.add_argument("--level", type=int, help="Level filter in hundreds (e.g., 600)")
+    parser.add_argument("--career", help="Academic career filter (UG or GRD)")
+    parser.add_argument("--term", help="Term code filter (courses offered that term)")
+    parser.add_argument("--limit", type=int, default=DEFAULT_SEARCH_LIMIT, help="Number of results")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = CourseCatalog().search_index
+    build_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    found = index.search(args.query, args.subject, args.level, args.career, args.term, args.limit)
+    query_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Indexed {len(index)} courses in {build_ms:.0f} ms; "
+          f"{found['total']} matches in {query_ms:.3f} ms")
+    for result in found['results']:
+        print(f"{result['score']:8.3f}  {result['course_code']:12} {result['title']}")
+
+
+if __name__ == "__main__":
+    main()
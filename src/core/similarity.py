@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Course Similarity
+=================
+TF-IDF vectors over the title and description of every course in the catalog, and a
+precomputed table of each course's most similar courses.
+
+The matrix is stored compressed-row style in numpy arrays (row offsets, term ids,
+weights). Weights are a sublinear term frequency (1 + log tf, with title tokens counted
+TITLE_WEIGHT times as in the search index) times a smoothed idf, and every row is L2
+normalized, so the dot product of two rows is their cosine similarity.
+
+The neighbour table is computed once, a block of rows at a time: each block's entries
+are expanded over the transposed (compressed-column) matrix and summed with one
+bincount into a dense block x courses score array. Asking for a course's similar courses
+then reads one row of the table. Scoring courses against a profile (free text and/or
+courses, see text_vector and centroid) is one sparse matrix-vector product over their rows.
+Everything is built from the catalog text; no model is downloaded.
+
+Usage:
+    python -m src.core.similarity COURSE_CODE [--limit N]
+"""
+
+import argparse
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .search_index import TITLE_WEIGHT, tokenize
+
+# Neighbours kept per course
+SIMILAR_COURSES_K = 20
+# Rows scored per block while building the neighbour table (bounds the dense block array)
+NEIGHBOUR_BLOCK_ROWS = 256
+DEFAULT_SIMILAR_LIMIT = 10
+
+
+def _expand_ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Concatenation of range(start, start + length) for every pair."""
+    ends = np.cumsum(lengths)
+    return np.repeat(starts - (ends - lengths), lengths) + np.arange(ends[-1] if len(ends) else 0)
+
+
+class CourseSimilarityIndex:
+    """TF-IDF course vectors with a top-k cosine neighbour table (see the module docstring)."""
+
+    def __init__(self, documents: Iterable[Tuple[str, Dict[str, Any], Sequence[str]]],
+                 neighbours: int = SIMILAR_COURSES_K):
+        """
+        Args:
+            documents: (course_code, Course fields, offered term codes) for every course;
+                the first record of a course code wins
+            neighbours: Size of each course's row in the neighbour table
+        """
+        records: Dict[str, Dict[str, Any]] = {}
+        for course_code, fields, _ in documents:
+            records.setdefault(course_code, fields)
+
+        self.course_codes: List[str] = sorted(records)
+        self.titles: List[str] = [records[code]["title"] or "" for code in self.course_codes]
+        self.course_index: Dict[str, int] = {code: row for row, code in enumerate(self.course_codes)}
+
+        vocabulary: Dict[str, int] = {}
+        counts, terms, row_lengths = [], [], []
+        for course_code in self.course_codes:
+            fields = records[course_code]
+            frequencies = Counter()
+            for token in tokenize(fields["title"]):
+                frequencies[token] += TITLE_WEIGHT
+            for token in tokenize(fields["description"]):
+                frequencies[token] += 1
+            for token, count in frequencies.items():
+                terms.append(vocabulary.setdefault(token, len(vocabulary)))
+                counts.append(count)
+            row_lengths.append(len(frequencies))
+
+        num_courses = len(self.course_codes)
+        self.num_terms = len(vocabulary)
+        self.indptr = np.concatenate(([0], np.cumsum(row_lengths))).astype(np.int64)
+        self.indices = np.array(terms, dtype=np.int32)
+        self.entry_rows = np.repeat(np.arange(num_courses, dtype=np.int32), row_lengths)
+
+        document_frequency = np.bincount(self.indices, minlength=self.num_terms)
+        self.vocabulary = vocabulary
+        self.idf = np.log((1.0 + num_courses) / (1.0 + document_frequency)) + 1.0
+        weights = (1.0 + np.log(np.array(counts, dtype=np.float64))) * self.idf[self.indices]
+        norms = np.sqrt(np.bincount(self.entry_rows, weights * weights, minlength=num_courses))
+        self.data = (weights / np.maximum(norms[self.entry_rows], 1e-12)).astype(np.float32)
+
+        self.neighbour_rows, self.neighbour_scores = self._neighbour_table(neighbours)
+        for array in (self.indptr, self.indices, self.entry_rows, self.data, self.idf, self.neighbour_rows,
+                      self.neighbour_scores):
+            array.setflags(write=False)
+
+    def __len__(self) -> int:
+        return len(self.course_codes)
+
+    def _neighbour_table(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(rows, cosine scores) of each course's k most similar courses; -1/0 pad courses with fewer."""
+        num_courses = len(self.course_codes)
+        rows = np.full((num_courses, k), -1, dtype=np.int32)
+        scores = np.zeros((num_courses, k), dtype=np.float32)
+        k = min(k, num_courses - 1)
+        if k <= 0:
+            return rows, scores
+
+        # Transposed matrix: the courses (and weights) of each term
+        order = np.argsort(self.indices, kind="stable")
+        column_rows, column_data = self.entry_rows[order], self.data[order].astype(np.float64)
+        column_ptr = np.concatenate(([0], np.cumsum(np.bincount(self.indices, minlength=self.num_terms))))
+
+        for first in range(0, num_courses, NEIGHBOUR_BLOCK_ROWS):
+            last = min(first + NEIGHBOUR_BLOCK_ROWS, num_courses)
+            start, end = self.indptr[first], self.indptr[last]
+            terms = self.indices[start:end]
+            lengths = column_ptr[terms + 1] - column_ptr[terms]
+            entries = _expand_ranges(column_ptr[terms], lengths)
+            block = np.bincount(
+                np.repeat(self.entry_rows[start:end] - first, lengths).astype(np.int64) * num_courses + column_rows[entries],
+                weights=np.repeat(self.data[start:end], lengths) * column_data[entries],
+                minlength=(last - first) * num_courses,
+            ).reshape(last - first, num_courses)
+            block[np.arange(last - first), np.arange(first, last)] = 0.0  # a course is not its own neighbour
+
+            top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(block, top, axis=1)
+            # Best first; equal scores in course code order
+            ranked = np.lexsort((top, -top_scores))
+            top, top_scores = np.take_along_axis(top, ranked, axis=1), np.take_along_axis(top_scores, ranked, axis=1)
+            rows[first:last, :k] = np.where(top_scores > 0, top, -1)
+            scores[first:last, :k] = np.where(top_scores > 0, top_scores, 0.0)
+        return rows, scores
+
+    def similar(self, course_code: str, limit: int = DEFAULT_SIMILAR_LIMIT) -> Optional[List[Dict[str, Any]]]:
+        """
+        Most similar courses by TF-IDF cosine, read from the neighbour table.
+
+        Returns:
+            [{course_code, title, similarity}, ...] best first (at most the table's k),
+            or None for an unknown course
+        """
+        row = self.course_index.get(course_code)
+        if row is None:
+            return None
+        return [
+            {'course_code': self.course_codes[neighbour], 'title': self.titles[neighbour], 'similarity': round(float(score), 4)}
+            for neighbour, score in zip(self.neighbour_rows[row, :limit].tolist(), self.neighbour_scores[row, :limit].tolist())
+            if neighbour >= 0
+        ]
+
+    def centroid(self, course_codes: Iterable[str]) -> np.ndarray:
+        """L2-normalized sum of the courses' vectors (dense, over the vocabulary); zero if none are known."""
+        rows = np.array(sorted({self.course_index[code] for code in course_codes if code in self.course_index}),
+                        dtype=np.int64)
+        entries = _expand_ranges(self.indptr[rows], self.indptr[rows + 1] - self.indptr[rows])
+        vector = np.bincount(self.indices[entries], self.data[entries], minlength=self.num_terms)
+        return vector / max(float(np.linalg.norm(vector)), 1e-12)
+
+    def text_vector(self, text: str) -> np.ndarray:
+        """L2-normalized TF-IDF vector of free text, weighted like a description; zero without known terms."""
+        vector = np.zeros(self.num_terms, dtype=np.float64)
+        for token, count in Counter(tokenize(text)).items():
+            term = self.vocabulary.get(token)
+            if term is not None:
+                vector[term] = (1.0 + np.log(count)) * self.idf[term]
+        return vector / max(float(np.linalg.norm(vector)), 1e-12)
+
+    def scores(self, course_codes: Sequence[str], vector: np.ndarray) -> np.ndarray:
+        """
+        Dot product of each course's vector with a dense vector: one sparse matrix-vector
+        product over the courses' rows (cosine similarity for a normalized vector).
+
+        Returns:
+            float32 array aligned with course_codes; 0 for unknown courses
+        """
+        rows = np.array([self.course_index.get(code, -1) for code in course_codes], dtype=np.int64)
+        result = np.zeros(len(course_codes), dtype=np.float32)
+        known = np.flatnonzero(rows >= 0)
+        if len(known):
+            lengths = self.indptr[rows[known] + 1] - self.indptr[rows[known]]
+            entries = _expand_ranges(self.indptr[rows[known]], lengths)
+            owners = np.repeat(np.arange(len(known)), lengths)
+            result[known] = np.bincount(owners, self.data[entries] * vector[self.indices[entries]], minlength=len(known))
+        return result
+
+    def relevance(self, course_codes: Sequence[str], anchor_codes: Iterable[str]) -> np.ndarray:
+        """
+        Cosine similarity of each course to the normalized centroid of the anchor courses.
+
+        Returns:
+            float32 array aligned with course_codes; 0 for unknown courses or without anchors
+        """
+        return self.scores(course_codes, self.centroid(anchor_codes))
+
+
+def main() -> None:
+    from .planner import CourseCatalog
+
+    parser = argparse.ArgumentParser(description="List the courses most similar to a course.")
+    parser.add_argument("course_code", help="Course code (e.g., \"SYDE 675\")")
+    parser.add_argument("--limit", type=int, default=DEFAULT_SIMILAR_LIMIT, help="Number of results")
+    args = parser.parse_args()
+
+    catalog = CourseCatalog()
+    start = time.perf_counter()
+    similarity = catalog.similarity
+    build_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    results = similarity.similar(args.course_code, args.limit)
+    query_ms = (time.perf_counter() - start) * 1000
+    if results is None:
+        raise SystemExit(f"Course {args.course_code} not found.")
+
+    print(f"Indexed {len(similarity)} courses in {build_ms:.0f} ms; looked up in {query_ms:.3f} ms")
+    for result in results:
+        print(f"{result['similarity']:7.3f}  {result['course_code']:12} {result['title']}")
+
+
+if __name__ == "__main__":
+    main()
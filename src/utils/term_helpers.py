@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Term Calendar
+=============
+Term-code arithmetic shared by the planner, validator and offering predictions.
+
+A term code is '1' + two-digit year + season digit (1 = Winter, 5 = Spring,
+9 = Fall), e.g. '1249' is Fall 2024. Every code maps to a dense integer ordinal
+(three terms per year), so ordering, stepping and distances between terms are plain
+integer arithmetic for any year, and whole arrays of codes convert at once.
+"""
+
+from typing import Iterable, List, Sequence
+
+import numpy as np
+
+SEASON_NAMES = {1: "Winter", 5: "Spring", 9: "Fall"}
+SEASON_DIGITS = (1, 5, 9)
+TERMS_PER_YEAR = len(SEASON_DIGITS)
+
+
+def is_valid_term_code(term_code: object) -> bool:
+    """True for a digit string ending in a season digit (1, 5 or 9)."""
+    return (isinstance(term_code, str) and len(term_code) >= 2 and term_code.isdigit()
+            and int(term_code[-1]) in SEASON_NAMES)
+
+
+def term_ordinal(term_code: str) -> int:
+    """
+    Dense ordinal of a term code: consecutive terms differ by 1.
+
+    Raises:
+        ValueError: If the code is not a valid term code.
+    """
+    if not is_valid_term_code(term_code):
+        raise ValueError(f"Invalid term code: {term_code!r}")
+    return int(term_code[:-1]) * TERMS_PER_YEAR + SEASON_DIGITS.index(int(term_code[-1]))
+
+
+def term_code_from_ordinal(ordinal: int) -> str:
+    """Term code of an ordinal (inverse of term_ordinal)."""
+    year_code, season_index = divmod(ordinal, TERMS_PER_YEAR)
+    return f"{year_code}{SEASON_DIGITS[season_index]}"
+
+
+def term_offset(term_code: str, terms: int) -> str:
+    """The term ``terms`` terms after (or before, if negative) term_code."""
+    return term_code_from_ordinal(term_ordinal(term_code) + terms)
+
+
+def next_term_code(term_code: str) -> str:
+    """Next term code (e.g., '1249' -> '1251')."""
+    return term_offset(term_code, 1)
+
+
+def term_sequence(start_term_code: str, num_terms: int) -> List[str]:
+    """num_terms consecutive term codes starting at start_term_code."""
+    start = term_ordinal(start_term_code)
+    return [term_code_from_ordinal(ordinal) for ordinal in range(start, start + num_terms)]
+
+
+def terms_between(first_term_code: str, last_term_code: str) -> List[str]:
+    """Every term code from first to last, inclusive (empty if last precedes first)."""
+    first, last = term_ordinal(first_term_code), term_ordinal(last_term_code)
+    return [term_code_from_ordinal(ordinal) for ordinal in range(first, last + 1)]
+
+
+def is_term_before(term_code: str, other_term_code: str) -> bool:
+    """True if term_code comes strictly before other_term_code."""
+    return term_ordinal(term_code) < term_ordinal(other_term_code)
+
+
+def term_year(term_code: str) -> int:
+    """Calendar year of a term code (e.g., '1249' -> 2024)."""
+    return 1900 + int(term_code[:-1])
+
+
+def term_name(term_code: str) -> str:
+    """
+    Readable name of a term code (e.g., '1249' -> 'Fall 2024').
+
+    Codes that aren't four digits are returned unchanged; an unknown season digit reads 'Unknown'.
+    """
+    if len(term_code) != 4 or not term_code.isdigit():
+        return term_code
+    return f"{SEASON_NAMES.get(int(term_code[-1]), 'Unknown')} {term_year(term_code)}"
+
+
+# --- Vectorized conversions ---
+
+def term_ordinals(term_codes: Iterable[str]) -> np.ndarray:
+    """
+    Ordinals of many term codes as an int64 array.
+
+    Raises:
+        ValueError: If any code is not a valid term code.
+    """
+    codes = np.asarray(list(term_codes), dtype=np.int64) if not isinstance(term_codes, np.ndarray) \
+        else term_codes.astype(np.int64)
+    year_codes, seasons = np.divmod(codes, 10)
+    if not np.isin(seasons, SEASON_DIGITS).all():
+        raise ValueError("Invalid term code in array")
+    # Season digits 1/5/9 map to 0/1/2
+    return year_codes * TERMS_PER_YEAR + (seasons - 1) // 4
+
+
+def term_codes_from_ordinals(ordinals: Sequence[int]) -> List[str]:
+    """Term codes of many ordinals (inverse of term_ordinals)."""
+    year_codes, season_indexes = np.divmod(np.asarray(ordinals, dtype=np.int64), TERMS_PER_YEAR)
+    return (year_codes * 10 + season_indexes * 4 + 1).astype(str).tolist()
+
+
+class TermSequenceManager:
+    """
+    Term ordering over a calendar range (2020-2030 by default), answered by ordinal arithmetic.
+    """
+
+    def __init__(self, first_year: int = 2020, last_year: int = 2030):
+        self.first_ordinal = (first_year - 1900) * TERMS_PER_YEAR
+        self.last_ordinal = (last_year - 1900) * TERMS_PER_YEAR + TERMS_PER_YEAR - 1
+
+    @property
+    def term_order(self) -> List[str]:
+        """Every term code in the range, in chronological order."""
+        return [term_code_from_ordinal(o) for o in range(self.first_ordinal, self.last_ordinal + 1)]
+
+    def _ordinal_in_range(self, term_code: str):
+        """Ordinal of a term code, or None if it is invalid or outside the range."""
+        if not is_valid_term_code(term_code):
+            return None
+        ordinal = term_ordinal(term_code)
+        return ordinal if self.first_ordinal <= ordinal <= self.last_ordinal else None
+
+    def get_terms_before(self, target_term: str) -> List[str]:
+        """Get all terms that occur before the target term."""
+        target = self._ordinal_in_range(target_term)
+        if target is None:
+            return []
+        return [term_code_from_ordinal(o) for o in range(self.first_ordinal, target)]
+
+    def get_terms_after(self, target_term: str) -> List[str]:
+        """Get all terms that occur after the target term."""
+        target = self._ordinal_in_range(target_term)
+        if target is None:
+            return []
+        return [term_code_from_ordinal(o) for o in range(target + 1, self.last_ordinal + 1)]
+
+    def is_term_before(self, term1: str, term2: str) -> bool:
+        """Check if term1 occurs before term2 (False if either is outside the range)."""
+        first, second = self._ordinal_in_range(term1), self._ordinal_in_range(term2)
+        return first is not None and second is not None and first < second
+
+    def get_term_name(self, term_code: str) -> str:
+        """Convert term code to readable name."""
+        return term_name(term_code)
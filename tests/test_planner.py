@@ -0,0 +1,913 @@
+#!/usr/bin/python3
+# coding=utf-8
+# author troy
+
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.core.catalog_snapshot import CatalogSnapshot
+from src.core.planner import CourseCatalog, EngineeringCourseLoader
+
+
+def _course_row(subject, number, term_code, term_name, requirements=None, title=None):
+    return {
+        "courseId": f"{subject}{number}",
+        "termCode": term_code,
+        "termName": term_name,
+        "associatedAcademicCareer": "GRD",
+        "subjectCode": subject,
+        "catalogNumber": number,
+        "title": title or f"{subject} {number} Title",
+        "description": f"Description of {subject} {number}",
+        "creditWeight": 0.5,
+        "requirementsDescription": requirements,
+    }
+
+
+def write_catalog(root: Path) -> Path:
+    """Write a tiny two-subject catalog in the course_data_filtered layout."""
+    terms = {"1249": "Fall 2024", "1251": "Winter 2025", "1259": "Fall 2025"}
+    rows = {
+        "SYDE": {
+            "1249": [_course_row("SYDE", "600", "1249", terms["1249"]),
+                     _course_row("SYDE", "675", "1249", terms["1249"], "Prereq: SYDE 600. Antireq: ECE 657")],
+            "1251": [_course_row("SYDE", "660A", "1251", terms["1251"])],
+            "1259": [_course_row("SYDE", "600", "1259", terms["1259"], title="Systems Theory"),
+                     _course_row("SYDE", "522", "1259", terms["1259"])],
+        },
+        "ECE": {
+            "1249": [_course_row("ECE", "657", "1249", terms["1249"], "Antireq: SYDE 675")],
+            "1251": [],
+            "1259": [_course_row("ECE", "657", "1259", terms["1259"], "Antireq: SYDE 675")],
+        },
+    }
+    catalog_dir = root / "course_data_filtered"
+    for subject, term_rows in rows.items():
+        (catalog_dir / subject).mkdir(parents=True)
+        for term_code, courses in term_rows.items():
+            (catalog_dir / subject / f"{term_code}.json").write_text(json.dumps(courses), encoding="utf-8")
+    return catalog_dir
+
+
+def _pool_item(loader, validator, code, priority):
+    """Minimal course pool item for SchedulingProblem; the course's subject must be resident in the catalog."""
+    course = loader.catalog.subject_courses[code.split(" ")[0]][code]
+    requirements = validator.prereq_parser.parse_requirements(course.requirements_description)
+    return {'course': {'course_code': code}, 'priority': priority,
+            'prerequisites': requirements['prerequisites'], 'antirequisites': requirements['antirequisites']}
+
+
+def test_snapshot_matches_json_loader(tmp_path):
+    """Courses and availability read from the snapshot equal the JSON loader's."""
+    catalog_dir = write_catalog(tmp_path)
+    snapshot_path = tmp_path / "catalog.snapshot"
+    CourseCatalog(catalog_dir, snapshot_path=None).build_snapshot(snapshot_path)
+
+    json_loader = EngineeringCourseLoader(catalog_dir, snapshot_path=None)
+    snapshot_loader = EngineeringCourseLoader(catalog_dir, snapshot_path=snapshot_path)
+    assert snapshot_loader.snapshot is not None
+
+    json_loader.load_courses_for_program("Systems Design Engineering")
+    snapshot_loader.load_courses_for_program("Systems Design Engineering")
+
+    assert set(snapshot_loader.courses) == set(json_loader.courses)
+    for course_code, course in json_loader.courses.items():
+        assert snapshot_loader.get_course(course_code) == course
+        assert snapshot_loader.get_course_availability(course_code) == json_loader.get_course_availability(course_code)
+    # The newest term's record wins
+    assert snapshot_loader.get_course("SYDE 600").title == "Systems Theory"
+
+
+def test_stale_snapshot_falls_back_to_json(tmp_path):
+    """Touching a term file invalidates the snapshot."""
+    catalog_dir = write_catalog(tmp_path)
+    snapshot_path = tmp_path / "catalog.snapshot"
+    CourseCatalog(catalog_dir, snapshot_path=None).build_snapshot(snapshot_path)
+    assert CatalogSnapshot.open_if_fresh(snapshot_path, catalog_dir) is not None
+
+    term_file = catalog_dir / "SYDE" / "1251.json"
+    stat = term_file.stat()
+    os.utime(term_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert CatalogSnapshot.open_if_fresh(snapshot_path, catalog_dir) is None
+    loader = EngineeringCourseLoader(catalog_dir, snapshot_path=snapshot_path)
+    loader.load_courses_for_program("Systems Design Engineering")
+    assert loader.snapshot is None
+    assert "SYDE 660A" in loader.courses
+
+
+def test_program_switch_keeps_subjects_resident(tmp_path, monkeypatch):
+    """Switching back and forth between programs never reloads a subject."""
+    catalog_dir = write_catalog(tmp_path)
+    loader = EngineeringCourseLoader(catalog_dir, snapshot_path=None)
+    loader.load_courses_for_program("Systems Design Engineering")
+    loader.load_courses_for_program("Electrical and Computer Engineering")
+    assert "ECE 657" in loader.courses and "SYDE 600" not in loader.courses
+
+    def fail_reload(*args):
+        raise AssertionError("subject reloaded from disk")
+    monkeypatch.setattr(loader.catalog, "_load_subject_courses", fail_reload)
+
+    loader.load_courses_for_program("Systems Design Engineering")
+    assert "SYDE 600" in loader.courses and "ECE 657" not in loader.courses
+    assert loader.get_current_program_info()["total_courses"] == 4
+    assert set(loader.catalog.subject_courses) == {"SYDE", "ECE"}
+
+
+def test_program_contexts_are_independent(tmp_path):
+    """Concurrent requests for different programs resolve against their own read-only views."""
+    from concurrent.futures import ThreadPoolExecutor
+    from src.core.planner import SYDECoursePlanner
+
+    planner = SYDECoursePlanner()
+    planner.catalog = CourseCatalog(write_catalog(tmp_path), snapshot_path=None)
+
+    programs = ["Systems Design Engineering", "Electrical and Computer Engineering"] * 20
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        contexts = list(pool.map(planner.get_program_context, programs))
+
+    syde, ece = planner.get_program_context("Systems Design Engineering"), planner.get_program_context("Electrical and Computer Engineering")
+    assert all(c is (syde if c.program_name == "Systems Design Engineering" else ece) for c in contexts)
+    assert syde.course_loader.get_course("ECE 657") is None
+    assert ece.course_loader.get_course("ECE 657") is not None
+    try:
+        syde.course_loader.courses["ECE 657"] = None
+        assert False, "program view should be read-only"
+    except TypeError:
+        pass
+
+    result = planner.switch_program("Electrical and Computer Engineering")
+    assert result["success"] and result["program_info"]["program_name"] == "Electrical and Computer Engineering"
+    assert planner.get_program_context().program_name == "Systems Design Engineering"
+
+
+def test_parsed_requirements_are_cached_and_frozen():
+    """The same text is parsed once and every caller shares the read-only result."""
+    from src.core.planner import EnhancedPrerequisiteParser
+
+    text = "Prereq: One of SYDE 600, SYDE 601; ECE 602. Antireq: ECE 657"
+    first = EnhancedPrerequisiteParser().parse_requirements(text)
+    second = EnhancedPrerequisiteParser().parse_requirements(text)
+    assert first is second
+    assert first["antirequisites"] == ("ECE 657",)
+    assert first["prerequisites"][0]["type"] == "one_of"
+    assert {"type": "required", "courses": ({"subject": "ECE", "number": "602", "full_code": "ECE 602"},),
+            "description": "ECE 602"} in first["prerequisites"]
+    assert json.loads(json.dumps(first))["prerequisites"][0]["courses"][0]["full_code"] == "SYDE 600"
+    try:
+        first["prerequisites"][0]["type"] = "required"
+        assert False, "parsed requirements should be read-only"
+    except TypeError:
+        pass
+
+
+def test_validator_uses_reverse_requirement_index(tmp_path):
+    """Dependent-course and reverse antirequisite checks come from the prebuilt graph."""
+    from src.core.planner import CourseValidator
+
+    loader = EngineeringCourseLoader(write_catalog(tmp_path), snapshot_path=None)
+    loader.load_courses_for_program("Systems Design Engineering")
+    graph = loader.catalog.requirement_graph
+    assert graph.courses_requiring("SYDE 600") == {"SYDE 675"}
+    assert graph.courses_excluding("SYDE 675") == set()
+    assert graph.antirequisites["SYDE 675"] == {"ECE 657"}
+
+    validator = CourseValidator(loader)
+    result = validator.validate_course_placement("SYDE 600", "1259", {}, {"1249": ["SYDE 675"]})
+    assert not result["valid"]
+    assert any("SYDE 675 (which requires it as prerequisite)" in issue for issue in result["issues"])
+
+    result = validator.validate_course_placement("SYDE 675", "1259", {}, {"1249": ["SYDE 600", "ECE 657"]})
+    assert result["antirequisite_conflicts"] == ["ECE 657 (listed as antirequisite of SYDE 675)"]
+
+
+def test_offered_mask_matches_scalar_status(tmp_path):
+    """The vectorized availability pass agrees with get_offering_status_for_term."""
+    loader = EngineeringCourseLoader(write_catalog(tmp_path), snapshot_path=None)
+    loader.load_courses_for_program("Systems Design Engineering")
+    assert loader.catalog.availability_matrix.is_offered("SYDE 600", "1249")
+    assert not loader.catalog.availability_matrix.is_offered("SYDE 600", "1251")
+
+    course_codes = sorted(loader.courses) + ["SYDE 999"]
+    for schedule in (["1249"], ["1251"], ["1255"], ["1261", "1265"], ["1269"], ["1279"]):
+        mask = loader.offered_mask(course_codes, schedule)
+        expected = [any(loader.get_offering_status_for_term(code, term)["is_offered"] for term in schedule)
+                    for code in course_codes]
+        assert mask.tolist() == expected, schedule
+    assert loader.get_offering_status_for_term("SYDE 600", "1279") == {"is_offered": True, "status": "Predicted (Annual)"}
+
+
+def test_predict_offerings_bulk_lookup(tmp_path):
+    """Bulk predictions combine confirmed offerings with the precomputed future-term table."""
+    from src.core.availability import CONFIRMED, NOT_OFFERED, PREDICTED_ANNUAL
+
+    loader = EngineeringCourseLoader(write_catalog(tmp_path), snapshot_path=None)
+    loader.load_courses_for_program("Systems Design Engineering")
+    assert "1269" in loader.catalog.offering_predictions.term_index
+
+    status, confidence = loader.predict_offerings(["SYDE 600", "SYDE 660A", "SYDE 999"], ["1259", "1261", "1269", "1279"])
+    assert status.tolist() == [
+        [CONFIRMED, NOT_OFFERED, PREDICTED_ANNUAL, PREDICTED_ANNUAL],
+        [NOT_OFFERED, PREDICTED_ANNUAL, NOT_OFFERED, NOT_OFFERED],
+        [NOT_OFFERED, NOT_OFFERED, NOT_OFFERED, NOT_OFFERED],
+    ]
+    threshold = loader.catalog.offering_predictions.forecaster.threshold
+    assert confidence[0, 0] == 1.0 and confidence[0, 2] >= threshold > confidence[0, 1]
+
+
+def test_plan_cache_reuses_plans_per_window_and_catalog_version(tmp_path):
+    """Identical requests share one frozen plan; other windows or course data build new ones."""
+    from src.core.plan_cache import PlanCache
+    from src.core.planner import SYDECoursePlanner
+
+    planner = SYDECoursePlanner()
+    planner.catalog = CourseCatalog(write_catalog(tmp_path), snapshot_path=None)
+    planner.engineering_program_loader.load_programs()
+
+    request = {"program": "Systems Design Engineering", "start_term": "1249", "semesters": 3}
+    plan = planner.plan_courses(dict(request))
+    assert "error" not in plan
+    assert planner.plan_courses(dict(request)) is plan
+    assert planner.plan_cache.stats()["hits"] == 1
+    try:
+        plan["course_pool"] = []
+        assert False, "cached plans should be read-only"
+    except TypeError:
+        pass
+
+    assert planner.plan_courses(dict(request, start_term="1251")) is not plan
+    # Any change to the term files gives the reloaded catalog a new version
+    term_file = tmp_path / "course_data_filtered" / "SYDE" / "1259.json"
+    os.utime(term_file, ns=(term_file.stat().st_atime_ns, term_file.stat().st_mtime_ns + 10**9))
+    planner.catalog = CourseCatalog(tmp_path / "course_data_filtered", snapshot_path=None)
+    planner._program_contexts.clear()
+    assert planner.plan_courses(dict(request)) is not plan
+
+    cache = PlanCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert "a" in cache and "c" in cache and "b" not in cache
+
+
+def test_requirement_role_index_matches_rule_precedence():
+    """Roles follow rule order: compulsory, first choice group, then first elective group/list."""
+    from src.core.planner import SYDECoursePlanner
+    from src.core.requirement_roles import RequirementRoleIndex
+
+    requirements = {
+        "compulsory_courses": ["SYDE 600"],
+        "compulsory_choices": [
+            {"group_name": "Core", "n_to_choose": 2, "courses": ["SYDE 600", "SYDE 611", "SYDE 611"]},
+        ],
+        "elective_requirements": [
+            {"group_name": "Group A", "courses": ["SYDE 611"], "specified_list": ["SYDE 522"], "elective_list": ["ECE 657"]},
+            {"group_name": "Group B", "courses": ["ECE 657", "SYDE 522"]},
+        ],
+    }
+    roles = RequirementRoleIndex(requirements, SYDECoursePlanner()._get_course_level)
+
+    assert roles.course_codes == {"SYDE 600", "SYDE 611", "SYDE 522", "ECE 657"}
+    required = roles.role("SYDE 600")
+    assert (required.category, required.priority, required.tag) == ("compulsory", 10, "Required")
+    assert required.tags == ("Required", "Core", "Choice Required", "Choose 2", "Graduate Level")
+    choice = roles.role("SYDE 611")
+    assert (choice.category, choice.tag) == ("compulsory_choice", "Core")
+    assert choice.tags == ("Choice Required", "Choose 2", "Elective", "Group A", "Graduate Level")
+    specified = roles.role("SYDE 522")
+    assert (specified.category, specified.priority, specified.tag, specified.tag_color) == ("specified_elective", 7, "Elective", "#28a745")
+    assert specified.tags == ("Specified Elective", "Group A", "Elective", "Group B", "Advanced Undergraduate")
+    general = roles.role("ECE 657")
+    assert (general.category, general.priority) == ("general_elective", 6)
+    assert general.tags == ("General Elective", "Elective", "Group B", "Graduate Level")
+    other = roles.role("SYDE 750")
+    assert (other.category, other.priority, other.tags, other.tag) == ("general_elective", 5, ("Graduate Level",), "Graduate")
+
+
+def test_synthetic_catalog_replicates_courses_and_requirements(tmp_path):
+    """Scaled catalogs hold `scale` copies of every course, each replica linked to its own prerequisites."""
+    from benchmarks.synthetic_catalog import generate_catalog
+
+    rows = generate_catalog(tmp_path / "scaled", 3, subjects=["SYDE"], source_dir=write_catalog(tmp_path))
+    assert rows == 3 * 5
+
+    catalog = CourseCatalog(tmp_path / "scaled", snapshot_path=None)
+    view = catalog.program_view("Systems Design Engineering")
+    assert view.course_count == 3 * 4
+    assert view.courses["SYDE 675XB"].requirements_description == "Prereq: SYDE 600XB. Antireq: ECE 657XB"
+    assert catalog.requirement_graph.courses_requiring("SYDE 600XA") == {"SYDE 675XA"}
+
+
+def test_validate_plan_matches_per_course_validation(tmp_path):
+    """validate_plan reports equal validating each course against the rest of the plan."""
+    from src.core.planner import CourseValidator
+
+    loader = EngineeringCourseLoader(catalog=CourseCatalog(write_catalog(tmp_path), snapshot_path=None))
+    loader.load_courses_for_program("Electrical and Computer Engineering")
+    loader = EngineeringCourseLoader(catalog=loader.catalog)
+    loader.load_courses_for_program("Systems Design Engineering")
+    validator = CourseValidator(loader)
+
+    plan = {"1259": ["SYDE 600", "SYDE 522"], "1249": ["SYDE 675", "ECE 657", "SYDE 600", "SYDE 522"]}
+    reports = validator.validate_plan(plan)
+
+    assert [(r["term_code"], r["course_code"]) for r in reports] == [
+        ("1249", "SYDE 675"), ("1249", "ECE 657"), ("1249", "SYDE 600"), ("1249", "SYDE 522"),
+        ("1259", "SYDE 600"), ("1259", "SYDE 522"),
+    ]
+    for report in reports:
+        rest = {term: list(courses) for term, courses in plan.items()}
+        rest[report["term_code"]].remove(report["course_code"])
+        expected = validator.validate_course_placement(report["course_code"], report["term_code"], {}, rest)
+        assert {k: v for k, v in report.items() if k not in ("course_code", "term_code")} == expected
+    assert not reports[0]["valid"] and any("Maximum 3 courses" in issue for issue in reports[0]["issues"])
+
+
+def test_drop_targets_agree_with_per_cell_validation(tmp_path):
+    """Every (course, term) cell is valid exactly when validating the move is, blocked by its first issue."""
+    from src.core.planner import CourseValidator
+
+    catalog = CourseCatalog(write_catalog(tmp_path), snapshot_path=None)
+    loader = EngineeringCourseLoader(catalog=catalog)
+    loader.load_courses_for_program("Systems Design Engineering")
+    validator = CourseValidator(loader)
+
+    courses = ["SYDE 600", "SYDE 675", "SYDE 660A", "SYDE 522", "SYDE 999"]
+    terms = ["1249", "1251", "1259", "1261"]
+    plans = [
+        {},
+        {"1249": ["SYDE 675"], "1259": ["SYDE 600"]},
+        {"1249": ["SYDE 600"], "1251": ["SYDE 660A", "SYDE 522", "SYDE 675"]},
+    ]
+    for plan in plans:
+        targets = validator.drop_targets(courses, terms, plan)
+        for course in courses:
+            rest = {term: [code for code in codes if code != course] for term, codes in plan.items()}
+            for term in terms:
+                expected = validator.validate_course_placement(course, term, {}, rest)
+                assert (term in targets[course]["valid_terms"]) == expected["valid"]
+                if not expected["valid"]:
+                    assert targets[course]["blocked"][term] == expected["issues"][0]
+
+    targets = validator.drop_targets(["SYDE 600"], ["1259"], {"1249": ["SYDE 675"]})
+    assert targets["SYDE 600"]["blocked"]["1259"].startswith("Cannot move SYDE 600")
+
+
+def test_plan_session_deltas_match_full_revalidation(tmp_path):
+    """After each delta a session's reports equal validate_plan's, and every change is reported."""
+    from src.core.plan_session import PlanSession
+    from src.core.planner import CourseValidator
+
+    loader = EngineeringCourseLoader(catalog=CourseCatalog(write_catalog(tmp_path), snapshot_path=None))
+    loader.load_courses_for_program("Systems Design Engineering")
+    validator = CourseValidator(loader)
+
+    session = PlanSession(validator, lambda report, course, term: report, {"1249": ["SYDE 675"], "1259": ["SYDE 600"]})
+    assert session.state()["reports"] == validator.validate_plan({"1249": ["SYDE 675"], "1259": ["SYDE 600"]})
+    assert not session.valid
+
+    deltas = [
+        ("move", ("SYDE 600", "1259", "1249")),
+        ("add", ("SYDE 522", "1249")),
+        ("move", ("SYDE 675", "1249", "1259")),
+        ("remove", ("SYDE 522", "1249")),
+        ("add", ("SYDE 660A", "1251")),
+    ]
+    for action, args in deltas:
+        before = {(r["course_code"], r["term_code"]): r for r in session.state()["reports"]}
+        result = getattr(session, action)(*args)
+        state = session.state()
+        assert state["reports"] == validator.validate_plan(state["current_plan"])
+        changed = {(r["course_code"], r["term_code"]) for r in result["changed"]}
+        for report in state["reports"]:
+            key = (report["course_code"], report["term_code"])
+            assert key in changed or before.get(key) == report
+    assert session.state()["current_plan"] == {"1249": ["SYDE 600"], "1251": ["SYDE 660A"], "1259": ["SYDE 675"]}
+
+    try:
+        session.add("SYDE 600", "1249")
+        assert False, "duplicate placement should be rejected"
+    except ValueError:
+        pass
+
+
+def test_plan_session_store_expires_idle_sessions(monkeypatch):
+    """Sessions are dropped once unused for longer than the TTL; access refreshes them."""
+    from src.core import plan_session
+    from src.core.plan_session import PlanSessionStore
+
+    now = [1000.0]
+    monkeypatch.setattr(plan_session.time, "monotonic", lambda: now[0])
+    store = PlanSessionStore(ttl_seconds=60)
+    first, second = store.create("first"), store.create("second")
+
+    now[0] += 45
+    assert store.get(first) == "first"
+    now[0] += 30
+    assert store.get(second) is None
+    assert store.get(first) == "first"
+    assert len(store) == 1
+    assert store.delete(first) and store.get(first) is None
+
+
+def test_term_calendar_ordinals_and_names():
+    """Term ordinals are dense across seasons and years, and round-trip scalar and vectorized."""
+    from src.utils.term_helpers import (TermSequenceManager, is_term_before, next_term_code, term_code_from_ordinal,
+                                        term_codes_from_ordinals, term_name, term_ordinal, term_ordinals, term_sequence)
+
+    assert term_sequence("1245", 4) == ["1245", "1249", "1251", "1255"]
+    assert term_ordinal("1251") - term_ordinal("1249") == 1
+    assert next_term_code("1999") == "2001"  # Fall 2099 -> Winter 2100
+    assert is_term_before("1999", "2001") and not is_term_before("2001", "1999")
+
+    codes = term_sequence("1001", 600)
+    ordinals = term_ordinals(codes)
+    assert ordinals.tolist() == [term_ordinal(code) for code in codes]
+    assert (ordinals[1:] - ordinals[:-1] == 1).all()
+    assert term_codes_from_ordinals(ordinals) == codes == [term_code_from_ordinal(o) for o in ordinals]
+
+    assert term_name("1249") == "Fall 2024" and term_name("1243") == "Unknown 2024" and term_name("12491") == "12491"
+    for bad_code in ("1243", "12a9", ""):
+        try:
+            term_ordinal(bad_code)
+            assert False, f"{bad_code!r} should be rejected"
+        except ValueError:
+            pass
+
+    manager = TermSequenceManager()
+    assert manager.get_terms_before("1205") == ["1201"]
+    assert manager.get_terms_after("1305") == ["1309"]
+    assert manager.is_term_before("1249", "1251") and not manager.is_term_before("1249", "1401")
+
+
+def test_scheduler_builds_valid_plan_meeting_requirements(tmp_path):
+    """Auto plans respect offerings, prerequisites and antirequisites, and report what they cannot meet."""
+    from src.core.planner import CourseValidator
+    from src.core.scheduler import PlanScheduler, SchedulingProblem
+
+    loader = EngineeringCourseLoader(catalog=CourseCatalog(write_catalog(tmp_path), snapshot_path=None))
+    loader.load_courses_for_program("Electrical and Computer Engineering")
+    loader = EngineeringCourseLoader(catalog=loader.catalog)
+    loader.load_courses_for_program("Systems Design Engineering")
+    validator = CourseValidator(loader)
+
+    pool = [_pool_item(loader, validator, code, priority)
+            for code, priority in (("SYDE 675", 10), ("ECE 657", 8), ("SYDE 660A", 6), ("SYDE 522", 6))]
+    requirements = {
+        'total_courses': 4,
+        'compulsory_courses': ["SYDE 675"],
+        'compulsory_choices': [{'group_name': "Foundations", 'n_to_choose': 1, 'courses': ["SYDE 522", "SYDE 552"]}],
+        'elective_requirements': [],
+    }
+    terms = ["1249", "1251", "1259"]
+    completed = {"1245": ["SYDE 600"]}
+
+    result = PlanScheduler(validator).schedule(SchedulingProblem(validator, requirements, pool, terms, completed))
+    assert result['complete'] and result['unmet'] == [] and result['search']['exhausted']
+    assert result['plan'] == {"1249": ["SYDE 675"], "1251": ["SYDE 660A"], "1259": ["SYDE 522"]}
+    assert all(report['valid'] for report in validator.validate_plan(result['plan'], completed))
+
+    # Without SYDE 600 completed, SYDE 675 (offered only in 1249) can never follow its prerequisite
+    result = PlanScheduler(validator).schedule(SchedulingProblem(validator, requirements, pool, terms))
+    assert not result['complete'] and "Compulsory course SYDE 675 could not be scheduled" in result['unmet']
+    assert result['plan'] == {"1249": ["ECE 657"], "1251": ["SYDE 660A"], "1259": ["SYDE 522"]}
+
+
+def test_auto_plan_does_not_depend_on_hash_seed(tmp_path):
+    """Pools, auto plans and plan alternatives are the same in every process, even for tied courses."""
+    import subprocess
+
+    catalog_dir = write_catalog(tmp_path)
+    term_file = catalog_dir / "SYDE" / "1251.json"
+    rows = json.loads(term_file.read_text(encoding="utf-8"))
+    rows += [_course_row("SYDE", f"660{variant}", "1251", "Winter 2025") for variant in "BCDE"]
+    term_file.write_text(json.dumps(rows), encoding="utf-8")
+
+    script = """
+import contextlib, io, json, sys
+from pathlib import Path
+from src.core.planner import CourseCatalog, SYDECoursePlanner
+from src.core.scheduler import PlanScheduler, SchedulingProblem
+with contextlib.redirect_stdout(io.StringIO()):
+    planner = SYDECoursePlanner()
+    planner.catalog = CourseCatalog(Path(sys.argv[1]), snapshot_path=None)
+    planner.engineering_program_loader.load_programs()
+    request = {"program": "Systems Design Engineering", "start_term": "1249", "semesters": 3}
+    plan = planner.plan_courses(dict(request))
+    pool = [item['course']['course_code'] for item in plan['course_pool']]
+    auto = planner.auto_plan(dict(request), time_budget=2.0)
+    # A beam narrower than the tied choices, so survivors are picked among equal scores
+    validator = planner.get_program_context(request["program"]).course_validator
+    requirements = {'total_courses': 3, 'compulsory_courses': ["SYDE 600"], 'compulsory_choices': [],
+                    'elective_requirements': []}
+    problem = SchedulingProblem(validator, requirements, plan['course_pool'], ["1249", "1251", "1255"])
+    alternatives = PlanScheduler(validator, 2.0).alternatives(problem, k=3, beam_width=2)
+print(json.dumps([pool, auto['current_plan'], [alternative['plan'] for alternative in alternatives['plans']]]))
+"""
+
+    def run(seed):
+        result = subprocess.run([sys.executable, "-c", script, str(catalog_dir)], capture_output=True, text=True,
+                                cwd=Path(__file__).resolve().parent.parent, env=dict(os.environ, PYTHONHASHSEED=seed),
+                                check=True)
+        return json.loads(result.stdout)
+
+    pool, current_plan, alternatives = run("1")
+    assert [code for code in pool if code.startswith("SYDE 660")] == [f"SYDE 660{variant}" for variant in "ABCDE"]
+    assert current_plan["1251"] == ["SYDE 660A", "SYDE 660B", "SYDE 660C"]
+    assert [alternative["1251"] for alternative in alternatives] == [["SYDE 660A", "SYDE 660B"], ["SYDE 660A", "SYDE 660C"]]
+    assert run("2") == [pool, current_plan, alternatives]
+
+
+def test_plan_alternatives_ranked_by_objective(tmp_path):
+    """Beam search returns distinct valid plans, best first, and the ranking follows the objective's weights."""
+    from src.core.planner import CourseValidator
+    from src.core.scheduler import PlanObjective, PlanScheduler, SchedulingProblem
+
+    loader = EngineeringCourseLoader(catalog=CourseCatalog(write_catalog(tmp_path), snapshot_path=None))
+    loader.load_courses_for_program("Systems Design Engineering")
+    validator = CourseValidator(loader)
+
+    pool = [_pool_item(loader, validator, code, priority)
+            for code, priority in (("SYDE 600", 10), ("SYDE 675", 8), ("SYDE 660A", 6), ("SYDE 522", 6))]
+    requirements = {'total_courses': 2, 'compulsory_courses': ["SYDE 600"],
+                    'compulsory_choices': [], 'elective_requirements': []}
+    problem = SchedulingProblem(validator, requirements, pool, ["1249", "1251", "1259"], max_courses_per_term=2)
+
+    result = PlanScheduler(validator).alternatives(problem, k=3)
+    plans = [alternative['plan'] for alternative in result['plans']]
+    assert len(plans) == 3 and result['search']['exhausted']
+    assert len({frozenset((term, tuple(courses)) for term, courses in plan.items()) for plan in plans}) == 3
+    assert plans[0] == {"1249": ["SYDE 600"], "1251": ["SYDE 660A"], "1259": []}
+    scores = [alternative['score'] for alternative in result['plans']]
+    assert scores == sorted(scores, reverse=True)
+    assert result['plans'][0]['metrics']['terms_used'] == 2
+    for plan in plans:
+        assert "SYDE 600" in [code for courses in plan.values() for code in courses]
+        assert all(report['valid'] for report in validator.validate_plan(plan, {}))
+
+    # Weighting a preferred course heavily outranks finishing a term earlier
+    objective = PlanObjective.from_dict({'preferred_courses': 20}, ["SYDE 522"])
+    result = PlanScheduler(validator).alternatives(problem, k=3, objective=objective)
+    assert result['plans'][0]['plan'] == {"1249": ["SYDE 600"], "1251": [], "1259": ["SYDE 522"]}
+    assert result['plans'][0]['metrics']['preferred_courses'] == 1
+
+    for bad_weights in ({'fewest_terms': -1}, {'shortest_commute': 1}):
+        try:
+            PlanObjective.from_dict(bad_weights, [])
+            assert False, f"{bad_weights!r} should be rejected"
+        except ValueError:
+            pass
+
+
+def test_degree_audit_counts_each_course_once():
+    """Groups share courses without double counting, 500-level limits apply, and incremental audits match fresh ones."""
+    from src.core.degree_audit import DegreeAudit, DegreeRules, audit_course_sets
+
+    requirements = {
+        'total_courses': 5,
+        'compulsory_courses': ["SYDE 600", "SYDE 660A"],
+        'compulsory_choices': [
+            {'group_name': "Workshop", 'n_to_choose': 1, 'courses': ["SYDE 660A", "SYDE 660B"]},
+            {'group_name': "Foundations", 'n_to_choose': 1, 'courses': ["SYDE 522", "SYDE 552"]},
+        ],
+        'elective_requirements': [
+            {'type': 'elective', 'group_name': "6 graduate courses", 'n_to_choose': 6, 'courses': []},
+            {'type': 'elective', 'group_name': "AI Electives", 'n_to_choose': 2,
+             'courses': ["SYDE 552", "SYDE 672", "SYDE 522 - Machine Intelligence"]},
+        ],
+        'constraints': {'level_constraints': {'max_500_level': 1},
+                        'departmental_constraints': {'min_syde_courses': 4, 'description': "4 SYDE courses"}},
+    }
+    rules = DegreeRules(requirements, lambda code: int(code.split(' ')[1][0]), ("SYDE",))
+    assert [group.name for group in rules.groups] == ["Workshop", "Foundations", "AI Electives"]
+
+    # SYDE 522 could fill Foundations or AI Electives but counts once; the compulsory workshop fills its group
+    report = DegreeAudit(rules, ["SYDE 600", "SYDE 660A", "SYDE 522", "SYDE 672", "ECE 602"]).report()
+    assert not report['satisfied']
+    groups = {group['name']: group for group in report['groups']}
+    assert groups["Workshop"]['assigned'] == ["SYDE 660A"]
+    assert groups["Foundations"]['missing'] + groups["AI Electives"]['missing'] == 1
+    assert report['departmental'][0]['missing'] == 0
+    assert report['total'] == {'required': 5, 'counted': 5}
+
+    # Only one 500-level course may count: SYDE 552 adds a course but cannot fill a second group
+    audit = DegreeAudit(rules, ["SYDE 600", "SYDE 660A", "SYDE 522", "SYDE 672", "ECE 602"])
+    audit.add("SYDE 552")
+    report = audit.report()
+    assert not report['satisfied'] and report['level']['uncounted'] == ["SYDE 552"]
+    assert report['total']['counted'] == 5 and report['warnings']
+    audit.add("SYDE 671")
+    assert not audit.report()['satisfied']
+    requirements['elective_requirements'][1]['courses'].append("SYDE 671")
+    assert DegreeAudit(DegreeRules(requirements, rules.course_level, ("SYDE",)),
+                       ["SYDE 600", "SYDE 660A", "SYDE 522", "SYDE 672", "SYDE 671"]).report()['satisfied']
+
+    # Removing a course re-routes the flow exactly as a fresh audit would
+    audit.remove("SYDE 522")
+    assert audit.report() == DegreeAudit(rules, ["SYDE 600", "SYDE 660A", "SYDE 672", "ECE 602", "SYDE 552",
+                                                 "SYDE 671"]).report()
+    assert audit.report()['level']['uncounted'] == []
+
+    plans = [["SYDE 600"], ["SYDE 600"], ["SYDE 660A"]]
+    reports = audit_course_sets(rules, plans)
+    assert reports[0] is reports[1] and reports[2]['compulsory']['missing'] == ["SYDE 600"]
+
+
+def test_offering_forecaster_fits_course_patterns():
+    """Each course gets the model matching its history, and the backtest beats the same-season lookback rule."""
+    import numpy as np
+    from src.core.forecasting import OfferingForecaster, backtest
+
+    # Winter 2021 .. Fall 2025 (Falls are columns 2, 5, 8, 11, 14); Spring 2023 has no data
+    history = np.zeros((4, 15), dtype=np.float32)
+    history[0, [2, 5, 8, 11, 14]] = 1  # every Fall
+    history[1, [2, 8, 14]] = 1  # every other Fall
+    history[2, [2, 5, 8]] = 1  # every Fall until 2023
+    history[3, [0, 1, 3, 4, 6, 9, 10, 12, 13]] = 1  # every Winter and Spring
+    observed = np.ones(15, dtype=bool)
+    observed[7] = False
+
+    forecaster = OfferingForecaster().fit(history, observed)
+    assert [forecaster.models[m].pattern for m in forecaster.model_index] == ["annual", "biennial", "sporadic", "annual"]
+    offered = forecaster.forecast(6) >= forecaster.threshold  # Winter 2026 .. Fall 2027
+    assert offered.tolist() == [
+        [False, False, True, False, False, True],
+        [False, False, False, False, False, True],
+        [False, False, False, False, False, False],
+        [True, True, False, True, True, False],
+    ]
+    assert np.array_equal(forecaster.forecast(6, np.array([3, 1])), forecaster.forecast(6)[[3, 1]])
+
+    results = backtest(history, observed, 3)
+    assert results['forecaster']['accuracy'] == 1.0 > results['baseline']['accuracy']
+    assert results['forecaster']['courses'] == 4 and results['forecaster']['terms'] == 3
+
+
+def test_search_index_ranks_and_filters_whole_catalog(tmp_path):
+    """BM25 search covers every subject, built the same from JSON files or the snapshot, with vectorized filters."""
+    catalog_dir = write_catalog(tmp_path)
+    snapshot_path = tmp_path / "catalog.snapshot"
+    json_catalog = CourseCatalog(catalog_dir, snapshot_path=None)
+    json_catalog.build_snapshot(snapshot_path)
+    index = json_catalog.search_index
+    # No program was loaded, yet every subject is searchable
+    assert len(index) == 5 and not json_catalog.subject_courses
+
+    def codes(query, **filters):
+        return [result['course_code'] for result in index.search(query, **filters)['results']]
+
+    # Newest title wins; title matches outrank description matches
+    assert codes("systems theory")[0] == "SYDE 600"
+    assert codes("ECE 657") == ["ECE 657"]
+    assert index.search("the of")['total'] == 0
+    assert index.search("description")['total'] == 5
+    assert codes("description", limit=2) == codes("description")[:2]
+    assert codes("description", subject="ece") == ["ECE 657"]
+    assert codes("description", level=500) == ["SYDE 522"]
+    assert codes("description", term="1251") == ["SYDE 660A"]
+    assert codes("description", career="UG") == [] and len(codes("description", career="GRD")) == 5
+    assert codes("description", term="1255") == []
+
+    snapshot_index = CourseCatalog(catalog_dir, snapshot_path=snapshot_path).search_index
+    for query in ("systems theory", "description syde", "657"):
+        assert snapshot_index.search(query) == index.search(query)
+
+
+def test_autocomplete_completes_codes_numbers_and_title_words(tmp_path):
+    """Typeahead matches normalized code, catalog number and title word prefixes, codes first."""
+    catalog = CourseCatalog(write_catalog(tmp_path), snapshot_path=None)
+    autocomplete = catalog.autocomplete
+
+    def codes(query, limit=10):
+        return [(result['course_code'], result['match']) for result in autocomplete.complete(query, limit)]
+
+    assert codes("SYDE 6") == codes("syde6") == [("SYDE 600", "code"), ("SYDE 660A", "code"), ("SYDE 675", "code")]
+    assert codes("SYDE 660a") == [("SYDE 660A", "code")]
+    assert codes("6", limit=2) == [("SYDE 600", "number"), ("ECE 657", "number")]
+    # Titles index the newest record; earlier words must prefix other title words
+    assert codes("theo") == codes("sys theo") == [("SYDE 600", "title")]
+    assert codes("title ece") == [("ECE 657", "title")]
+    assert codes("theory zz") == [] and codes("  ") == []
+
+
+def test_similarity_neighbour_table_matches_cosine(tmp_path):
+    """The precomputed neighbours are the top TF-IDF cosines, and pool electives rank by similarity to the program's courses."""
+    import numpy as np
+    from src.core.planner import SYDECoursePlanner
+    from src.core.similarity import CourseSimilarityIndex
+
+    def document(code, title, description):
+        subject, number = code.split()
+        return code, {"subject_code": subject, "catalog_number": number, "title": title,
+                      "description": description}, []
+
+    index = CourseSimilarityIndex([
+        document("CS 480", "Machine Learning", "Supervised learning, neural networks and classifiers."),
+        document("SYDE 675", "Pattern Recognition", "Statistical classifiers and machine learning for patterns."),
+        document("ME 351", "Fluid Mechanics", "Flow of fluids in pipes."),
+        document("ME 353", "Heat Transfer", "Conduction, convection and heat flow in fluids."),
+        document("HIST 101", "Ancient Rome", "Empire and republic."),
+    ], neighbours=3)
+
+    dense = np.zeros((len(index), index.num_terms))
+    dense[index.entry_rows, index.indices] = index.data
+    cosine = dense @ dense.T
+    assert np.allclose(np.diag(cosine), 1.0)
+    for row, course_code in enumerate(index.course_codes):
+        expected = [(index.course_codes[other], round(float(cosine[row, other]), 4))
+                    for other in np.argsort(-cosine[row], kind="stable") if other != row and cosine[row, other] > 0][:3]
+        assert [(result['course_code'], result['similarity']) for result in index.similar(course_code)] == expected
+    assert index.similar("SYDE 675")[0]['course_code'] == "CS 480"
+    assert index.similar("HIST 101") == [] and index.similar("CS 999") is None
+
+    relevance = index.relevance(["ME 353", "SYDE 675", "HIST 101", "CS 999"], ["ME 351"])
+    assert relevance[0] > 0 and relevance.tolist()[1:] == [0.0, 0.0, 0.0]
+    assert np.allclose(index.relevance(["ME 351"], ["ME 351", "ME 999"]), 1.0)
+
+    loader = EngineeringCourseLoader(catalog=CourseCatalog(write_catalog(tmp_path), snapshot_path=None))
+    loader.load_courses_for_program("Systems Design Engineering")
+    requirements = {'compulsory_courses': ["SYDE 675"], 'compulsory_choices': [], 'elective_requirements': []}
+    pool = SYDECoursePlanner()._build_course_pool(requirements, ["1249", "1251", "1259"], loader)
+    assert pool[0]['course']['course_code'] == "SYDE 675" and pool[0]['relevance'] == 1.0
+    electives = [item['relevance'] for item in pool[1:]]
+    assert len(electives) == 2 and electives == sorted(electives, reverse=True)
+
+
+def test_plan_profile_ranks_electives_without_touching_cached_plan(tmp_path):
+    """Interests and completed courses reorder only the elective portion of a copy of the cached pool."""
+    from src.core.planner import SYDECoursePlanner
+
+    catalog_dir = write_catalog(tmp_path)
+    term_file = catalog_dir / "SYDE" / "1259.json"
+    rows = json.loads(term_file.read_text(encoding="utf-8"))
+    for number, title, description in (("750", "Robot Control", "Feedback control of robot manipulators."),
+                                       ("770", "Medical Imaging", "Image reconstruction for medical scanners."),
+                                       ("780", "Learning Machines", "Machine learning with neural networks.")):
+        row = _course_row("SYDE", number, "1259", "Fall 2025", title=title)
+        row["description"] = description
+        rows.append(row)
+    term_file.write_text(json.dumps(rows), encoding="utf-8")
+
+    planner = SYDECoursePlanner()
+    planner.catalog = CourseCatalog(catalog_dir, snapshot_path=None)
+    planner.engineering_program_loader.load_programs()
+    request = {"program": "Systems Design Engineering", "start_term": "1249", "semesters": 4}
+    plan = planner.plan_courses(dict(request))
+
+    def electives(pool):
+        return [item['course']['course_code'] for item in pool if item['category'] == 'general_elective']
+
+    ranked = planner.plan_courses(dict(request, interests=["robot control", "machine learning"]))
+    assert electives(ranked['course_pool'])[:2] == ["SYDE 750", "SYDE 780"]
+    assert ranked['course_pool'][:2] == list(plan['course_pool'][:2])  # compulsory courses keep their places
+    assert sorted(electives(ranked['course_pool'])) == sorted(electives(plan['course_pool']))
+    assert all('profile_score' not in item for item in plan['course_pool'])
+    assert planner.plan_courses(dict(request)) is plan
+
+    # Completed courses pull similar courses up and sink themselves; "SYDE780" is normalized
+    ranked = planner.plan_courses(dict(request, completed_courses={"1245": ["SYDE780"]}, interests="imaging"))
+    assert ranked['profile'] == {'interests': ["imaging"], 'completed_courses': ["SYDE 780"]}
+    assert electives(ranked['course_pool'])[0] == "SYDE 770" and electives(ranked['course_pool'])[-1] == "SYDE 780"
+
+
+def test_prefork_server_serves_reports_and_restarts_workers():
+    """Forked workers share one socket, report their memory, and are restarted when they exit."""
+    import signal
+    import time
+    import urllib.request
+    from src.api.server import PreforkServer, memory_usage
+
+    def app(environ, start_response):
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [str(os.getpid()).encode()]
+
+    server = PreforkServer(app, "127.0.0.1", 0, workers=2, stats_interval=0)
+    server.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/", timeout=10) as response:
+            assert int(response.read()) in server.pids
+
+        stats = server.worker_stats()
+        assert [entry['worker'] for entry in stats] == [0, 1]
+        if memory_usage(os.getpid()):
+            assert all(entry['rss'] > 0 for entry in stats)
+
+        crashed = stats[0]['pid']
+        os.kill(crashed, signal.SIGKILL)
+        deadline = time.monotonic() + 10
+        while crashed in server.pids and time.monotonic() < deadline:
+            server._reap(respawn=True)
+            time.sleep(0.05)
+        assert crashed not in server.pids and sorted(server.pids.values()) == [0, 1]
+    finally:
+        server.stop()
+    assert server.pids == {} and server.socket is None
+
+
+def test_planner_endpoints_reject_invalid_start_terms():
+    """Planning endpoints answer 400, not 500, for a start term that is not a term code."""
+    from src.api.main import app
+
+    client = app.test_client()
+    request = {'program': 'Systems Design Engineering', 'semesters': 3}
+    for endpoint in ('/api/v1/plan', '/api/v1/drop_targets', '/api/v1/auto_plan', '/api/v1/plan_alternatives'):
+        for start_term in ("abcd", "12x9", "1243", 1249):
+            response = client.post(endpoint, json=dict(request, start_term=start_term))
+            assert response.status_code == 400 and 'not a valid term code' in response.json['error'], endpoint
+        assert client.post(endpoint, json=request).status_code == 400
+        assert client.post(endpoint, json=dict(request, start_term="1249")).status_code == 200
+
+
+def test_plan_response_negotiates_gzip_and_echoes_request_strings():
+    """Large plan bodies are gzipped on request and cached for frozen plans; echoed input is plain JSON."""
+    import gzip
+    from flask import Flask
+    from src.api import responses
+    from src.core.planner import freeze
+
+    course = {'course_code': 'SYDE 675', 'title': 'Pattern Recognition', 'description': 'x' * 2000}
+    plan = freeze({
+        'program_info': {'specialization': "\u0000fragment:0\u0000"},
+        'course_pool': [{'course': course, 'category': 'core'}, {'course': None, 'category': 'placeholder'}],
+    })
+    expected = json.loads(json.dumps(plan))
+
+    app = Flask(__name__)
+    app.json = responses.FastJSONProvider(app)
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip, deflate'}):
+        response = responses.plan_response(plan)
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert json.loads(gzip.decompress(response.get_data())) == expected
+        assert responses.plan_response(plan).get_data() == response.get_data()
+    with app.test_request_context():
+        response = responses.plan_response(plan)
+        assert 'Content-Encoding' not in response.headers
+        assert json.loads(response.get_data()) == expected
+
+    from src.api.main import app as api_app
+    for specialization in ("\u0000fragment:0\u0000", "\u0000fragment:99999\u0000"):
+        response = api_app.test_client().post('/api/v1/plan', json={
+            'program': 'Systems Design Engineering', 'start_term': '1249', 'semesters': 3,
+            'specialization': specialization})
+        assert response.status_code == 200
+        assert response.json['program_info']['specialization'] == specialization
+
+
+def test_plan_fields_select_summary_pool_items():
+    """fields="summary" keeps only card data; field lists are validated and cached apart from full bodies."""
+    from flask import Flask
+    from src.api import responses
+    from src.core.planner import Course, course_record, freeze
+
+    course = Course("1", "SYDE", "675", "Pattern Recognition", "x" * 2000, 0.5, "Prereq: SYDE 600",
+                    "1249", "Fall 2024", "GRD")
+    record = course_record(course)
+    assert record['course_code'] == "SYDE 675" and record['description'] == course.description
+    plan = freeze({
+        'program': 'SYDE',
+        'course_pool': [{'course': record, 'category': 'compulsory', 'tag': 'Required', 'elective_rule': None,
+                         'prerequisites': [{'description': 'SYDE 600'}]}],
+    })
+
+    assert responses.parse_fields(None) is None and responses.parse_fields('full') is None
+    assert responses.parse_fields('summary') == responses.PLAN_SUMMARY_FIELDS
+    assert responses.parse_fields('tag, course.title') == responses.parse_fields(['course.title', 'tag'])
+    for invalid in (['course.bogus'], ['tag.title'], 'unknown', [], [1]):
+        try:
+            responses.parse_fields(invalid)
+            assert False, invalid
+        except ValueError:
+            pass
+
+    summary = responses.select_pool_fields(plan, responses.PLAN_SUMMARY_FIELDS)
+    assert summary['program'] == 'SYDE'
+    assert json.loads(json.dumps(summary['course_pool'])) == [{'course': {'course_code': 'SYDE 675', 'title': 'Pattern Recognition'},
+                                       'category': 'compulsory', 'tag': 'Required',
+                                       'prerequisites': [{'description': 'SYDE 600'}]}]
+    assert plan['course_pool'][0]['course']['description'] == course.description
+
+    app = Flask(__name__)
+    app.json = responses.FastJSONProvider(app)
+    with app.test_request_context():
+        full = responses.plan_response(plan).get_data()
+        compact = responses.plan_response(plan, responses.PLAN_SUMMARY_FIELDS).get_data()
+        assert json.loads(compact) == json.loads(json.dumps(summary)) and len(compact) * 5 < len(full)
+        assert responses.plan_response(plan).get_data() == full
+
+
+def test_validate_move_rejects_invalid_term_codes():
+    """validate_move answers 400, not 500, for a term code or plan key without a season digit."""
+    from src.api.main import app
+
+    client = app.test_client()
+    response = client.post('/api/v1/validate_move', json={'course_code': 'SYDE 600', 'term_code': '1243'})
+    assert response.status_code == 400 and '1243' in response.json['error']
+    response = client.post('/api/v1/validate_move', json={
+        'course_code': 'SYDE 600', 'term_code': '1249', 'current_plan': {'12a9': ['SYDE 610']}})
+    assert response.status_code == 400 and 'current_plan' in response.json['error']